@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Generator
 import contextlib
 from datetime import datetime, timedelta
 import logging
@@ -27,6 +28,8 @@ from .helpers import area_registry, device_registry, entity_registry
 from .helpers.dispatcher import async_dispatcher_send
 from .helpers.typing import ConfigType
 from .setup import (
+    BASE_PLATFORMS,
+    DATA_BOOTSTRAP_TIMINGS,
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
@@ -34,7 +37,6 @@ from .setup import (
     async_setup_component,
 )
 from .util import dt as dt_util
-from .util.async_ import gather_with_concurrency
 from .util.logging import async_activate_log_queue_handler
 from .util.package import async_get_user_site, is_virtual_env
 
@@ -57,6 +59,7 @@ WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
 MAX_LOAD_CONCURRENTLY = 6
+MAX_PREIMPORT_CONCURRENTLY = 2
 
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 CORE_INTEGRATIONS = {"homeassistant", "persistent_notification"}
@@ -215,20 +218,26 @@ async def async_from_config_dict(
     """
     start = monotonic()
 
-    hass.config_entries = config_entries.ConfigEntries(hass, config)
-    await hass.config_entries.async_initialize()
+    with _time_bootstrap_phase(hass, "manifest_cache"):
+        await loader.async_load_manifest_cache(hass)
+
+    with _time_bootstrap_phase(hass, "config_entries"):
+        hass.config_entries = config_entries.ConfigEntries(hass, config)
+        await hass.config_entries.async_initialize()
 
     # Set up core.
     _LOGGER.debug("Setting up %s", CORE_INTEGRATIONS)
 
-    if not all(
-        await asyncio.gather(
-            *(
-                async_setup_component(hass, domain, config)
-                for domain in CORE_INTEGRATIONS
+    with _time_bootstrap_phase(hass, "core"):
+        core_set_up = all(
+            await asyncio.gather(
+                *(
+                    async_setup_component(hass, domain, config)
+                    for domain in CORE_INTEGRATIONS
+                )
             )
         )
-    ):
+    if not core_set_up:
         _LOGGER.error("Home Assistant core failed to initialize. ")
         return None
 
@@ -387,6 +396,19 @@ async def async_mount_local_lib_path(config_dir: str) -> str:
     return deps_dir
 
 
+@contextlib.contextmanager
+def _time_bootstrap_phase(
+    hass: core.HomeAssistant, phase: str
+) -> Generator[None, None, None]:
+    """Record how long a phase of the bootstrap took."""
+    start = monotonic()
+    try:
+        yield
+    finally:
+        timings: dict[str, timedelta] = hass.data.setdefault(DATA_BOOTSTRAP_TIMINGS, {})
+        timings[phase] = timedelta(seconds=monotonic() - start)
+
+
 @core.callback
 def _get_domains(hass: core.HomeAssistant, config: dict[str, Any]) -> set[str]:
     """Get domains of components to set up."""
@@ -455,19 +477,16 @@ async def async_setup_multi_components(
         )
 
 
-async def _async_set_up_integrations(
-    hass: core.HomeAssistant, config: dict[str, Any]
-) -> None:
-    """Set up all the integrations."""
-    hass.data[DATA_SETUP_STARTED] = {}
-    setup_time: dict[str, timedelta] = hass.data.setdefault(DATA_SETUP_TIME, {})
-
-    watch_task = asyncio.create_task(_async_watch_pending_setups(hass))
-
-    domains_to_setup = _get_domains(hass, config)
+async def _async_resolve_domains_to_setup(
+    hass: core.HomeAssistant, domains_to_setup: set[str]
+) -> dict[str, loader.Integration]:
+    """Resolve all dependencies so we know all integrations to set up.
 
-    # Resolve all dependencies so we know all integrations
-    # that will have to be loaded and start rightaway
+    The manifests of the domains and everything they depend on are loaded
+    in a single executor job so resolving the dependencies does not have
+    to wait on the disk for every layer of the dependency tree.
+    Adds the dependencies to domains_to_setup.
+    """
     integration_cache: dict[str, loader.Integration] = {}
     to_resolve: set[str] = domains_to_setup
     while to_resolve:
@@ -476,14 +495,11 @@ async def _async_set_up_integrations(
 
         integrations_to_process = [
             int_or_exc
-            for int_or_exc in await gather_with_concurrency(
-                loader.MAX_LOAD_CONCURRENTLY,
-                *(
-                    loader.async_get_integration(hass, domain)
-                    for domain in old_to_resolve
-                ),
-                return_exceptions=True,
-            )
+            for int_or_exc in (
+                await loader.async_get_integrations(
+                    hass, old_to_resolve, with_dependencies=True
+                )
+            ).values()
             if isinstance(int_or_exc, loader.Integration)
         ]
         resolve_dependencies_tasks = [
@@ -505,17 +521,88 @@ async def _async_set_up_integrations(
                 domains_to_setup.add(dep)
                 to_resolve.add(dep)
 
+    return integration_cache
+
+
+async def _async_preimport_integrations(
+    hass: core.HomeAssistant, integrations: dict[str, loader.Integration]
+) -> None:
+    """Import the integrations that will be set up in the executor.
+
+    Dependencies are imported before the integrations that depend on them.
+    Integrations with config entries also get their config flow and entity
+    platforms imported, so their setup does not import them on the loop.
+    """
+    config_entry_domains = set(hass.config_entries.async_domains())
+    entry_platforms = ["config_flow", *sorted(BASE_PLATFORMS)]
+    semaphore = asyncio.Semaphore(MAX_PREIMPORT_CONCURRENTLY)
+    preimports: dict[str, asyncio.Task[None]] = {}
+
+    async def _async_preimport(
+        integration: loader.Integration, dependencies: set[str]
+    ) -> None:
+        """Import an integration in the executor after its dependencies."""
+        if waiting := [preimports[dep] for dep in dependencies if dep in preimports]:
+            await asyncio.wait(waiting)
+        async with semaphore:
+            await hass.async_add_executor_job(
+                integration.preimport,
+                entry_platforms if integration.domain in config_entry_domains else [],
+            )
+
+    all_dependencies: dict[str, set[str]] = {}
+    for domain, integration in integrations.items():
+        if not integration.all_dependencies_resolved:
+            continue
+        try:
+            all_dependencies[domain] = integration.all_dependencies
+        except RuntimeError:
+            # The dependencies failed to resolve, it will not be set up
+            continue
+
+    # An integration has more dependencies than each of its dependencies
+    # so their tasks already exist when it is scheduled
+    for domain in sorted(all_dependencies, key=lambda dom: len(all_dependencies[dom])):
+        preimports[domain] = asyncio.create_task(
+            _async_preimport(integrations[domain], all_dependencies[domain])
+        )
+    if preimports:
+        await asyncio.wait(preimports.values())
+
+
+async def _async_set_up_integrations(
+    hass: core.HomeAssistant, config: dict[str, Any]
+) -> None:
+    """Set up all the integrations."""
+    hass.data[DATA_SETUP_STARTED] = {}
+    setup_time: dict[str, timedelta] = hass.data.setdefault(DATA_SETUP_TIME, {})
+
+    watch_task = asyncio.create_task(_async_watch_pending_setups(hass))
+
+    domains_to_setup = _get_domains(hass, config)
+
+    with _time_bootstrap_phase(hass, "resolve_integrations"):
+        integration_cache = await _async_resolve_domains_to_setup(
+            hass, domains_to_setup
+        )
+
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    # Import the integrations in the background while the
+    # earlier ones are being set up
+    hass.async_create_task(_async_preimport_integrations(hass, integration_cache))
+
     # Load logging as soon as possible
     if logging_domains := domains_to_setup & LOGGING_INTEGRATIONS:
         _LOGGER.info("Setting up logging: %s", logging_domains)
-        await async_setup_multi_components(hass, logging_domains, config)
+        with _time_bootstrap_phase(hass, "logging"):
+            await async_setup_multi_components(hass, logging_domains, config)
 
     # Start up debuggers. Start these first in case they want to wait.
     if debuggers := domains_to_setup & DEBUGGER_INTEGRATIONS:
         _LOGGER.debug("Setting up debuggers: %s", debuggers)
-        await async_setup_multi_components(hass, debuggers, config)
+        with _time_bootstrap_phase(hass, "debuggers"):
+            await async_setup_multi_components(hass, debuggers, config)
 
     # calculate what components to setup in what stage
     stage_1_domains: set[str] = set()
@@ -541,43 +628,49 @@ async def _async_set_up_integrations(
     stage_2_domains = domains_to_setup - logging_domains - debuggers - stage_1_domains
 
     # Load the registries
-    await asyncio.gather(
-        device_registry.async_load(hass),
-        entity_registry.async_load(hass),
-        area_registry.async_load(hass),
-    )
+    with _time_bootstrap_phase(hass, "registries"):
+        await asyncio.gather(
+            device_registry.async_load(hass),
+            entity_registry.async_load(hass),
+            area_registry.async_load(hass),
+        )
 
     # Start setup
     if stage_1_domains:
         _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
-        try:
-            async with hass.timeout.async_timeout(
-                STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
-        except asyncio.TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 1 - moving forward")
+        with _time_bootstrap_phase(hass, "stage_1"):
+            try:
+                async with hass.timeout.async_timeout(
+                    STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
+                ):
+                    await async_setup_multi_components(hass, stage_1_domains, config)
+            except asyncio.TimeoutError:
+                _LOGGER.warning("Setup timed out for stage 1 - moving forward")
 
     # Enables after dependencies
     async_set_domains_to_be_loaded(hass, stage_2_domains)
 
     if stage_2_domains:
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
+        with _time_bootstrap_phase(hass, "stage_2"):
+            try:
+                async with hass.timeout.async_timeout(
+                    STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
+                ):
+                    await async_setup_multi_components(hass, stage_2_domains, config)
+            except asyncio.TimeoutError:
+                _LOGGER.warning("Setup timed out for stage 2 - moving forward")
+
+    # Wrap up startup
+    _LOGGER.debug("Waiting for startup to wrap up")
+    with _time_bootstrap_phase(hass, "wrap_up"):
         try:
             async with hass.timeout.async_timeout(
-                STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
+                WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                await hass.async_block_till_done()
         except asyncio.TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 2 - moving forward")
-
-    # Wrap up startup
-    _LOGGER.debug("Waiting for startup to wrap up")
-    try:
-        async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
-    except asyncio.TimeoutError:
-        _LOGGER.warning("Setup timed out for bootstrap - moving forward")
+            _LOGGER.warning("Setup timed out for bootstrap - moving forward")
 
     watch_task.cancel()
     async_dispatcher_send(hass, SIGNAL_BOOTSTRAP_INTEGRATONS, {})
@@ -585,9 +678,26 @@ async def _async_set_up_integrations(
     _LOGGER.debug(
         "Integration setup times: %s",
         {
-            integration: timedelta.total_seconds()
-            for integration, timedelta in sorted(
+            integration: setup_timedelta.total_seconds()
+            for integration, setup_timedelta in sorted(
                 setup_time.items(), key=lambda item: item[1].total_seconds()
             )
         },
     )
+    _LOGGER.debug(
+        "Integration import times: %s",
+        {
+            integration: round(seconds, 3)
+            for integration, seconds in sorted(
+                hass.data.get(loader.DATA_IMPORT_TIMES, {}).items(),
+                key=lambda item: item[1],
+            )
+        },
+    )
+    _LOGGER.debug(
+        "Bootstrap phase times: %s",
+        {
+            phase: phase_timedelta.total_seconds()
+            for phase, phase_timedelta in hass.data[DATA_BOOTSTRAP_TIMINGS].items()
+        },
+    )
@@ -4,7 +4,7 @@ from http import HTTPStatus
 import logging
 
 from aiohttp import web
-from aiohttp.web_exceptions import HTTPBadRequest
+from aiohttp.web_exceptions import HTTPBadRequest, HTTPInternalServerError
 import async_timeout
 import voluptuous as vol
 
@@ -12,6 +12,7 @@ from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
+    CONTENT_TYPE_JSON,
     EVENT_HOMEASSISTANT_STOP,
     MATCH_ALL,
     URL_API,
@@ -28,7 +29,7 @@ import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ServiceNotFound, TemplateError, Unauthorized
 from homeassistant.helpers import template
-from homeassistant.helpers.json import json_dumps, json_loads
+from homeassistant.helpers.json import JSON_ENCODE_EXCEPTIONS, json_dumps, json_loads
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import ConfigType
 
@@ -175,7 +176,7 @@ class APIStatesView(HomeAssistantView):
             for state in request.app["hass"].states.async_all()
             if entity_perm(state.entity_id, "read")
         ]
-        return self.json(states)
+        return _states_json_response(states)
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -192,7 +193,7 @@ class APIEntityStateView(HomeAssistantView):
             raise Unauthorized(entity_id=entity_id)
 
         if state := request.app["hass"].states.get(entity_id):
-            return self.json(state)
+            return _states_json_response(state)
         return self.json_message("Entity not found.", HTTPStatus.NOT_FOUND)
 
     async def post(self, request, entity_id):
@@ -220,7 +221,7 @@ class APIEntityStateView(HomeAssistantView):
 
         # Read the state back for our response
         status_code = HTTPStatus.CREATED if is_new_state else HTTPStatus.OK
-        resp = self.json(hass.states.get(entity_id), status_code)
+        resp = _states_json_response(hass.states.get(entity_id), status_code)
 
         resp.headers.add("Location", f"/api/states/{entity_id}")
 
@@ -334,7 +335,7 @@ class APIDomainServicesView(HomeAssistantView):
             if state.context is context:
                 changed_states.append(state)
 
-        return self.json(changed_states)
+        return _states_json_response(changed_states)
 
 
 class APIComponentsView(HomeAssistantView):
@@ -382,6 +383,28 @@ class APIErrorLog(HomeAssistantView):
         return web.FileResponse(request.app["hass"].data[DATA_LOGGING])
 
 
+def _states_json_response(
+    states: ha.State | list[ha.State], status_code: HTTPStatus = HTTPStatus.OK
+) -> web.Response:
+    """Return a JSON response of one or more states.
+
+    Uses the JSON cached on the states instead of serializing them again.
+    """
+    try:
+        if isinstance(states, ha.State):
+            body = states.as_dict_json()
+        else:
+            body = b"[" + b",".join(state.as_dict_json() for state in states) + b"]"
+    except JSON_ENCODE_EXCEPTIONS as err:
+        _LOGGER.error("Unable to serialize to JSON: %s\n%s", err, states)
+        raise HTTPInternalServerError from err
+    response = web.Response(
+        body=body, content_type=CONTENT_TYPE_JSON, status=int(status_code)
+    )
+    response.enable_compression()
+    return response
+
+
 async def async_services_json(hass):
     """Generate services data to JSONify."""
     descriptions = await async_get_all_descriptions(hass)
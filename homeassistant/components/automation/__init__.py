@@ -1,8 +1,11 @@
 """Allow to set up simple automation rules via the config file."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 import logging
+from timeit import default_timer as timer
 from typing import Any, TypedDict, cast
 
 import voluptuous as vol
@@ -57,6 +60,7 @@ from homeassistant.helpers.script import (
     ATTR_MAX,
     CONF_MAX,
     CONF_MAX_EXCEEDED,
+    ReferenceIndex,
     Script,
     script_stack_cv,
 )
@@ -104,6 +108,8 @@ DEFAULT_STOP_ACTIONS = True
 EVENT_AUTOMATION_RELOADED = "automation_reloaded"
 EVENT_AUTOMATION_TRIGGERED = "automation_triggered"
 
+DATA_REFERENCE_INDEX = "automation_reference_index"
+
 ATTR_LAST_TRIGGERED = "last_triggered"
 ATTR_SOURCE = "source"
 ATTR_VARIABLES = "variables"
@@ -143,16 +149,10 @@ def is_on(hass, entity_id):
 @callback
 def automations_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     """Return all automations that reference the entity."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if entity_id in automation_entity.referenced_entities
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].referencing_entity(entity_id)
 
 
 @callback
@@ -172,16 +172,10 @@ def entities_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_device(hass: HomeAssistant, device_id: str) -> list[str]:
     """Return all automations that reference the device."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if device_id in automation_entity.referenced_devices
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].referencing_device(device_id)
 
 
 @callback
@@ -201,16 +195,10 @@ def devices_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_area(hass: HomeAssistant, area_id: str) -> list[str]:
     """Return all automations that reference the area."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if area_id in automation_entity.referenced_areas
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].referencing_area(area_id)
 
 
 @callback
@@ -230,6 +218,7 @@ def areas_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up all automations."""
     hass.data[DOMAIN] = component = EntityComponent(LOGGER, DOMAIN, hass)
+    hass.data[DATA_REFERENCE_INDEX] = ReferenceIndex()
 
     # Process integration platforms right away since
     # we will create entities before firing EVENT_COMPONENT_LOADED
@@ -266,8 +255,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
 
     async def reload_service_handler(service_call):
-        """Remove all automations and load new ones from config."""
-        if (conf := await component.async_prepare_reload()) is None:
+        """Reload the automations that were added, changed or removed."""
+        if (conf := await component.async_prepare_reload(skip_reset=True)) is None:
             return
         async_get_blueprints(hass).async_reset_cache()
         await _async_process_config(hass, conf, component)
@@ -319,8 +308,8 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         self._logger = LOGGER
         self._variables: ScriptVariables = variables
         self._trigger_variables: ScriptVariables = trigger_variables
-        self._raw_config = raw_config
-        self._blueprint_inputs = blueprint_inputs
+        self.raw_config = raw_config
+        self.raw_blueprint_inputs = blueprint_inputs
         self._trace_config = trace_config
         self._attr_unique_id = automation_id
 
@@ -393,6 +382,12 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
             f"{__name__}.{split_entity_id(self.entity_id)[1]}"
         )
         self.action_script.update_logger(self._logger)
+        self.hass.data[DATA_REFERENCE_INDEX].async_add(
+            self.entity_id,
+            self.referenced_entities,
+            self.referenced_devices,
+            self.referenced_areas,
+        )
 
         if state := await self.async_get_last_state():
             enable_automation = state.state == STATE_ON
@@ -454,8 +449,8 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         with trace_automation(
             self.hass,
             self.unique_id,
-            self._raw_config,
-            self._blueprint_inputs,
+            self.raw_config,
+            self.raw_blueprint_inputs,
             trigger_context,
             self._trace_config,
         ) as automation_trace:
@@ -535,6 +530,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
     async def async_will_remove_from_hass(self):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
+        self.hass.data[DATA_REFERENCE_INDEX].async_remove(self.entity_id)
         await self.async_disable()
 
     async def async_enable(self):
@@ -618,17 +614,21 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         )
 
 
-async def _async_process_config(
-    hass: HomeAssistant,
-    config: dict[str, Any],
-    component: EntityComponent,
-) -> bool:
-    """Process config and add automations.
+@dataclass
+class AutomationEntityConfig:
+    """Container for a validated automation and the config it came from."""
 
-    Returns if blueprints were used.
-    """
-    entities = []
-    blueprints_used = False
+    config_block: ConfigType
+    name: str
+    raw_blueprint_inputs: ConfigType | None
+    raw_config: ConfigType | None
+
+
+async def _prepare_automation_config(
+    hass: HomeAssistant, config: ConfigType
+) -> list[AutomationEntityConfig]:
+    """Substitute the blueprint inputs and name the automations."""
+    automation_configs: list[AutomationEntityConfig] = []
 
     for config_key in extract_domain_configs(config, DOMAIN):
         conf: list[dict[str, Any] | blueprint.BlueprintInputs] = config[config_key]
@@ -637,7 +637,6 @@ async def _async_process_config(
             raw_blueprint_inputs = None
             raw_config = None
             if isinstance(config_block, blueprint.BlueprintInputs):
-                blueprints_used = True
                 blueprint_inputs = config_block
                 raw_blueprint_inputs = blueprint_inputs.config_with_inputs
 
@@ -658,65 +657,157 @@ async def _async_process_config(
             else:
                 raw_config = cast(AutomationConfig, config_block).raw_config
 
-            automation_id = config_block.get(CONF_ID)
-            name = config_block.get(CONF_ALIAS) or f"{config_key} {list_no}"
+            automation_configs.append(
+                AutomationEntityConfig(
+                    config_block,
+                    config_block.get(CONF_ALIAS) or f"{config_key} {list_no}",
+                    raw_blueprint_inputs,
+                    raw_config,
+                )
+            )
 
-            initial_state = config_block.get(CONF_INITIAL_STATE)
+    return automation_configs
 
-            action_script = Script(
-                hass,
-                config_block[CONF_ACTION],
-                name,
-                DOMAIN,
-                running_description="automation actions",
-                script_mode=config_block[CONF_MODE],
-                max_runs=config_block[CONF_MAX],
-                max_exceeded=config_block[CONF_MAX_EXCEEDED],
-                logger=LOGGER,
-                # We don't pass variables here
-                # Automation will already render them to use them in the condition
-                # and so will pass them on to the script.
-            )
 
-            if CONF_CONDITION in config_block:
-                cond_func = await _async_process_if(hass, name, config, config_block)
+def _automation_matches_config(
+    automation: AutomationEntity, config: AutomationEntityConfig
+) -> bool:
+    """Return if an automation was created from the same config."""
+    return (
+        config.raw_config is not None
+        and automation.raw_config == config.raw_config
+        and automation.raw_blueprint_inputs == config.raw_blueprint_inputs
+    )
 
-                if cond_func is None:
-                    continue
-            else:
-                cond_func = None
 
-            # Add trigger variables to variables
-            variables = None
-            if CONF_TRIGGER_VARIABLES in config_block:
-                variables = ScriptVariables(
-                    dict(config_block[CONF_TRIGGER_VARIABLES].as_dict())
-                )
-            if CONF_VARIABLES in config_block:
-                if variables:
-                    variables.variables.update(config_block[CONF_VARIABLES].as_dict())
-                else:
-                    variables = config_block[CONF_VARIABLES]
-
-            entity = AutomationEntity(
-                automation_id,
-                name,
-                config_block[CONF_TRIGGER],
-                cond_func,
-                action_script,
-                initial_state,
-                variables,
-                config_block.get(CONF_TRIGGER_VARIABLES),
-                raw_config,
-                raw_blueprint_inputs,
-                config_block[CONF_TRACE],
+async def _create_automation_entities(
+    hass: HomeAssistant,
+    config: ConfigType,
+    automation_configs: list[AutomationEntityConfig],
+) -> list[AutomationEntity]:
+    """Create automation entities from prepared configuration."""
+    entities = []
+
+    for automation_config in automation_configs:
+        config_block = automation_config.config_block
+        name = automation_config.name
+
+        automation_id = config_block.get(CONF_ID)
+        initial_state = config_block.get(CONF_INITIAL_STATE)
+
+        action_script = Script(
+            hass,
+            config_block[CONF_ACTION],
+            name,
+            DOMAIN,
+            running_description="automation actions",
+            script_mode=config_block[CONF_MODE],
+            max_runs=config_block[CONF_MAX],
+            max_exceeded=config_block[CONF_MAX_EXCEEDED],
+            logger=LOGGER,
+            # We don't pass variables here
+            # Automation will already render them to use them in the condition
+            # and so will pass them on to the script.
+        )
+
+        if CONF_CONDITION in config_block:
+            cond_func = await _async_process_if(hass, name, config, config_block)
+
+            if cond_func is None:
+                continue
+        else:
+            cond_func = None
+
+        # Add trigger variables to variables
+        variables = None
+        if CONF_TRIGGER_VARIABLES in config_block:
+            variables = ScriptVariables(
+                dict(config_block[CONF_TRIGGER_VARIABLES].as_dict())
             )
+        if CONF_VARIABLES in config_block:
+            if variables:
+                variables.variables.update(config_block[CONF_VARIABLES].as_dict())
+            else:
+                variables = config_block[CONF_VARIABLES]
+
+        entity = AutomationEntity(
+            automation_id,
+            name,
+            config_block[CONF_TRIGGER],
+            cond_func,
+            action_script,
+            initial_state,
+            variables,
+            config_block.get(CONF_TRIGGER_VARIABLES),
+            automation_config.raw_config,
+            automation_config.raw_blueprint_inputs,
+            config_block[CONF_TRACE],
+        )
+
+        entities.append(entity)
 
-            entities.append(entity)
+    return entities
 
-    if entities:
+
+async def _async_process_config(
+    hass: HomeAssistant,
+    config: dict[str, Any],
+    component: EntityComponent,
+) -> bool:
+    """Process config and add automations.
+
+    Automations that were created from the same id, name and config are
+    kept running, only the ones that were added, changed or removed are
+    set up or removed.
+
+    Returns if blueprints were used.
+    """
+    automation_configs = await _prepare_automation_config(hass, config)
+    blueprints_used = any(
+        automation_config.raw_blueprint_inputs is not None
+        for automation_config in automation_configs
+    )
+
+    running: dict[tuple[str | None, str], list[AutomationEntity]] = {}
+    for automation in component.entities:
+        automation = cast(AutomationEntity, automation)
+        running.setdefault((automation.unique_id, str(automation.name)), []).append(
+            automation
+        )
+
+    changed_configs: list[AutomationEntityConfig] = []
+    for automation_config in automation_configs:
+        candidates = running.get(
+            (automation_config.config_block.get(CONF_ID), automation_config.name), []
+        )
+        for idx, automation in enumerate(candidates):
+            if _automation_matches_config(automation, automation_config):
+                del candidates[idx]
+                break
+        else:
+            changed_configs.append(automation_config)
+
+    removed = [
+        automation for automations in running.values() for automation in automations
+    ]
+
+    start = timer()
+    if removed:
+        await asyncio.gather(
+            *(component.async_remove_entity(entity.entity_id) for entity in removed)
+        )
+
+    if entities := await _create_automation_entities(hass, config, changed_configs):
         await component.async_add_entities(entities)
 
+    LOGGER.debug(
+        "Set up %s and removed %s automations in %.3f seconds, %s unchanged",
+        len(entities),
+        len(removed),
+        timer() - start,
+        len(automation_configs) - len(changed_configs),
+    )
+
     return blueprints_used
 
 
@@ -59,6 +59,9 @@ class BuienradarCam(Camera):
     [0]: https://www.buienradar.nl/overbuienradar/gratis-weerdata
     """
 
+    # The camera keeps the image itself until the delta passes
+    _image_cache_ttl = 0
+
     def __init__(
         self, latitude: float, longitude: float, delta: float, country: str
     ) -> None:
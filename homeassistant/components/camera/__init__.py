@@ -13,6 +13,7 @@ from functools import partial
 import logging
 import os
 from random import SystemRandom
+from time import monotonic
 from typing import Final, Optional, cast, final
 
 from aiohttp import web
@@ -21,7 +22,11 @@ import attr
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.http import KEY_AUTHENTICATED, HomeAssistantView
+from homeassistant.components.http import (
+    KEY_AUTHENTICATED,
+    KEY_HASS,
+    HomeAssistantView,
+)
 from homeassistant.components.media_player.const import (
     ATTR_MEDIA_CONTENT_ID,
     ATTR_MEDIA_CONTENT_TYPE,
@@ -65,6 +70,7 @@ from .const import (  # noqa: F401
     CONF_LOOKBACK,
     DATA_CAMERA_PREFS,
     DATA_RTSP_TO_WEB_RTC,
+    DATA_STILL_STREAMS,
     DOMAIN,
     SERVICE_RECORD,
     STREAM_TYPE_HLS,
@@ -117,6 +123,9 @@ _RND: Final = SystemRandom()
 
 MIN_STREAM_INTERVAL: Final = 0.5  # seconds
 
+# Number of scaled image sizes kept per camera
+MAX_CACHED_IMAGES: Final = 4
+
 CAMERA_SERVICE_SNAPSHOT: Final = {vol.Required(ATTR_FILENAME): cv.template}
 
 CAMERA_SERVICE_PLAY_STREAM: Final = {
@@ -159,6 +168,90 @@ async def async_request_stream(hass: HomeAssistant, entity_id: str, fmt: str) ->
     return await _async_stream_endpoint_url(hass, camera, fmt)
 
 
+class _ImageCache:
+    """Share the image fetches of a camera and keep the recent frame.
+
+    The camera is asked for one frame at a time, requests that come in while
+    it is being fetched wait for that fetch. The frame is kept for the frame
+    interval of the camera together with the sizes it was scaled to.
+    """
+
+    def __init__(self, ttl: float | None) -> None:
+        """Initialize the image cache, a ttl of None keeps frames a frame interval."""
+        self._ttl = ttl
+        self._fetch: asyncio.Task[Image] | None = None
+        self._frame: Image | None = None
+        self._frame_expires = 0.0
+        self._scaled: dict[tuple[int, int], asyncio.Task[Image]] = {}
+
+    async def async_get_image(
+        self,
+        camera: Camera,
+        timeout: int,
+        width: int | None,
+        height: int | None,
+    ) -> Image:
+        """Return the recent frame or wait for one to be fetched, then scale it."""
+        if self._frame is None or self._frame_expires <= monotonic():
+            if self._fetch is None:
+                self._fetch = camera.hass.async_create_task(
+                    _async_fetch_image(camera, timeout)
+                )
+                self._fetch.add_done_callback(
+                    partial(
+                        self._async_fetch_done,
+                        camera.frame_interval if self._ttl is None else self._ttl,
+                    )
+                )
+            # A request that is cancelled must not cancel the shared fetch
+            frame = await asyncio.shield(self._fetch)
+        else:
+            frame = self._frame
+
+        content_type = frame.content_type
+        if (
+            width is None
+            or height is None
+            or ("jpeg" not in content_type and "jpg" not in content_type)
+        ):
+            return frame
+
+        key = (width, height)
+        if frame is not self._frame or (
+            key not in self._scaled and len(self._scaled) >= MAX_CACHED_IMAGES
+        ):
+            # Scaling an outdated frame or too many sizes, do not keep it
+            return await _async_scale_image(camera, frame, width, height)
+
+        if (scale := self._scaled.get(key)) is None:
+            scale = self._scaled[key] = camera.hass.async_create_task(
+                _async_scale_image(camera, frame, width, height)
+            )
+            scale.add_done_callback(partial(self._async_scale_done, key))
+        return await asyncio.shield(scale)
+
+    @callback
+    def _async_fetch_done(self, ttl: float, fetch: asyncio.Task[Image]) -> None:
+        """Keep the fetched frame and forget the sizes of the previous one."""
+        self._fetch = None
+        if fetch.cancelled() or fetch.exception() is not None:
+            return
+
+        self._frame = fetch.result()
+        self._frame_expires = monotonic() + ttl
+        self._scaled = {}
+
+    @callback
+    def _async_scale_done(
+        self, key: tuple[int, int], scale: asyncio.Task[Image]
+    ) -> None:
+        """Forget a failed scale so the next request tries again."""
+        if (scale.cancelled() or scale.exception() is not None) and self._scaled.get(
+            key
+        ) is scale:
+            del self._scaled[key]
+
+
 async def _async_get_image(
     camera: Camera,
     timeout: int = 10,
@@ -173,27 +266,37 @@ async def _async_get_image(
     that we can scale, however the majority of cases
     are handled.
     """
+    return (
+        await camera._image_cache.async_get_image(  # pylint: disable=protected-access
+            camera, timeout, width, height
+        )
+    )
+
+
+async def _async_fetch_image(camera: Camera, timeout: int) -> Image:
+    """Fetch a snapshot image from a camera."""
+    image: Image | None = None
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            if image_bytes := await camera.async_camera_image(
-                width=width, height=height
-            ):
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
+            if image_bytes := await camera.async_camera_image():
+                image = Image(camera.content_type, image_bytes)
 
-                return image
+    if image is None:
+        raise HomeAssistantError("Unable to get image")
 
-    raise HomeAssistantError("Unable to get image")
+    return image
+
+
+async def _async_scale_image(
+    camera: Camera, image: Image, width: int, height: int
+) -> Image:
+    """Scale a jpeg image of a camera in the executor."""
+    return Image(
+        image.content_type,
+        await camera.hass.async_add_executor_job(
+            scale_jpeg_camera_image, image, width, height
+        ),
+    )
 
 
 @bind_hass
@@ -234,6 +337,101 @@ async def async_get_mjpeg_stream(
     return stream
 
 
+def _still_stream_chunk(content_type: str, img_bytes: bytes) -> bytes:
+    """Return an image as a part of an MJPEG stream."""
+    return (
+        bytes(
+            "--frameboundary\r\n"
+            "Content-Type: {}\r\n"
+            "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
+            "utf-8",
+        )
+        + img_bytes
+        + b"\r\n"
+    )
+
+
+_StillStreamKey = tuple[Callable[[], Awaitable[bytes | None]], str, float]
+
+
+def _put_latest(queue: asyncio.Queue[bytes | None], chunk: bytes | None) -> None:
+    """Put a chunk in a viewer queue, replacing a chunk it did not write yet."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(chunk)
+
+
+class _StillStreamBroadcaster:
+    """Fetch the images of a still image stream once for all its viewers.
+
+    Each viewer has a queue of a single chunk. A viewer that did not write
+    the previous chunk yet gets it replaced by the newest one, so a slow
+    viewer skips images instead of delaying the others.
+    """
+
+    def __init__(
+        self,
+        streams: dict[_StillStreamKey, _StillStreamBroadcaster],
+        key: _StillStreamKey,
+    ) -> None:
+        """Initialize the broadcaster."""
+        self._streams = streams
+        self._key = key
+        self._viewers: set[asyncio.Queue[bytes | None]] = set()
+        self._last_image: bytes | None = None
+        self._last_chunk: bytes | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @callback
+    def async_subscribe(self) -> asyncio.Queue[bytes | None]:
+        """Add a viewer and start fetching images if needed."""
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=1)
+        if self._last_chunk is not None:
+            queue.put_nowait(self._last_chunk)
+        self._viewers.add(queue)
+        if self._task is None:
+            self._task = asyncio.create_task(self._async_produce())
+        return queue
+
+    @callback
+    def async_unsubscribe(self, queue: asyncio.Queue[bytes | None]) -> None:
+        """Remove a viewer and stop fetching images after the last one."""
+        self._viewers.discard(queue)
+        if not self._viewers:
+            self._async_remove()
+            if self._task is not None:
+                self._task.cancel()
+
+    @callback
+    def _async_remove(self) -> None:
+        """Stop handing out this broadcaster to new viewers."""
+        if self._streams.get(self._key) is self:
+            del self._streams[self._key]
+
+    async def _async_produce(self) -> None:
+        """Fetch images and hand the ones that changed to all viewers."""
+        image_cb, content_type, interval = self._key
+        try:
+            while True:
+                if not (img_bytes := await image_cb()):
+                    break
+
+                if img_bytes != self._last_image:
+                    self._last_image = img_bytes
+                    self._last_chunk = _still_stream_chunk(content_type, img_bytes)
+                    for queue in self._viewers:
+                        _put_latest(queue, self._last_chunk)
+
+                await asyncio.sleep(interval)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error fetching image for still image stream")
+        finally:
+            self._async_remove()
+            # End the stream of the remaining viewers
+            for queue in self._viewers:
+                _put_latest(queue, None)
+
+
 async def async_get_still_stream(
     request: web.Request,
     image_cb: Callable[[], Awaitable[bytes | None]],
@@ -242,42 +440,37 @@ async def async_get_still_stream(
 ) -> web.StreamResponse:
     """Generate an HTTP MJPEG stream from camera images.
 
+    Viewers of the same images at the same interval share the image fetches.
+
     This method must be run in the event loop.
     """
     response = web.StreamResponse()
     response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
     await response.prepare(request)
 
-    async def write_to_mjpeg_stream(img_bytes: bytes) -> None:
-        """Write image to stream."""
-        await response.write(
-            bytes(
-                "--frameboundary\r\n"
-                "Content-Type: {}\r\n"
-                "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
-                "utf-8",
-            )
-            + img_bytes
-            + b"\r\n"
-        )
-
-    last_image = None
-
-    while True:
-        img_bytes = await image_cb()
-        if not img_bytes:
-            break
+    hass: HomeAssistant = request.app[KEY_HASS]
+    # Still image streams that have viewers, by image callback, content type
+    # and interval
+    streams: dict[_StillStreamKey, _StillStreamBroadcaster] = hass.data.setdefault(
+        DATA_STILL_STREAMS, {}
+    )
+    key = (image_cb, content_type, interval)
+    if (broadcaster := streams.get(key)) is None:
+        broadcaster = streams[key] = _StillStreamBroadcaster(streams, key)
+    queue = broadcaster.async_subscribe()
 
-        if img_bytes != last_image:
-            await write_to_mjpeg_stream(img_bytes)
+    first_chunk = True
+    try:
+        while (chunk := await queue.get()) is not None:
+            await response.write(chunk)
 
             # Chrome seems to always ignore first picture,
             # print it twice.
-            if last_image is None:
-                await write_to_mjpeg_stream(img_bytes)
-            last_image = img_bytes
-
-        await asyncio.sleep(interval)
+            if first_chunk:
+                await response.write(chunk)
+                first_chunk = False
+    finally:
+        broadcaster.async_unsubscribe(queue)
 
     return response
 
@@ -451,6 +644,10 @@ class Camera(Entity):
     _attr_state: None = None  # State is determined by is_on
     _attr_supported_features: int = 0
 
+    # Seconds a fetched image is shared with later requests, None shares it
+    # for the frame interval. Cameras that keep their own image cache use 0.
+    _image_cache_ttl: float | None = None
+
     def __init__(self) -> None:
         """Initialize a camera."""
         self.stream: Stream | None = None
@@ -461,6 +658,7 @@ class Camera(Entity):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        self._image_cache = _ImageCache(self._image_cache_ttl)
 
     @property
     def entity_picture(self) -> str:
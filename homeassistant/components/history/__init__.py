@@ -5,8 +5,9 @@ from collections.abc import Iterable
 from datetime import datetime as dt, timedelta
 from http import HTTPStatus
 import logging
+from operator import itemgetter
 import time
-from typing import Literal, cast
+from typing import Any, Literal, cast
 
 from aiohttp import web
 import voluptuous as vol
@@ -24,13 +25,19 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import messages
-from homeassistant.core import HomeAssistant
+from homeassistant.components.websocket_api.const import (
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
+from homeassistant.core import HomeAssistant, State
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA
 from homeassistant.helpers.json import JSON_DUMP
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
+from .downsample import downsample_states, lttb_indices
+
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "history"
@@ -39,6 +46,8 @@ HISTORY_USE_INCLUDE_ORDER = "history_use_include_order"
 
 CONF_ORDER = "use_include_order"
 
+MAX_POINTS_SCHEMA = vol.All(vol.Coerce(int), vol.Range(min=3))
+
 
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -64,6 +73,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, ws_get_statistics_during_period)
     websocket_api.async_register_command(hass, ws_get_list_statistic_ids)
     websocket_api.async_register_command(hass, ws_get_history_during_period)
+    websocket_api.async_register_command(hass, ws_get_numeric_history_during_period)
 
     return True
 
@@ -174,6 +184,7 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
     states = history.get_significant_states(
@@ -188,6 +199,14 @@ def _ws_get_significant_states(
         no_attributes,
         True,
     )
+    if max_points:
+        for entity_id, entity_states in states.items():
+            states[entity_id] = downsample_states(
+                entity_states,
+                max_points,
+                itemgetter(COMPRESSED_STATE_STATE),
+                itemgetter(COMPRESSED_STATE_LAST_UPDATED),
+            )
 
     if not use_include_order or not filters:
         return JSON_DUMP(messages.result_message(msg_id, states))
@@ -215,6 +234,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): MAX_POINTS_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -273,6 +293,108 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
+        )
+    )
+
+
+def _encode_numeric_history(
+    series: history.NumericHistory, max_points: int | None
+) -> dict[str, list[int] | list[float]]:
+    """Encode a numeric history series compactly.
+
+    The timestamps are sent as integer milliseconds, the first one since the
+    epoch and the rest as the difference to the previous timestamp.
+    """
+    timestamps = series.timestamps.tolist()
+    values = series.values.tolist()
+    if max_points and len(timestamps) > max_points:
+        kept = lttb_indices(timestamps, values, max_points)
+        timestamps = [timestamps[idx] for idx in kept]
+        values = [values[idx] for idx in kept]
+    timestamps_ms = [round(timestamp * 1000) for timestamp in timestamps]
+    return {
+        "t": [
+            timestamps_ms[0],
+            *(
+                timestamp - previous
+                for previous, timestamp in zip(timestamps_ms, timestamps_ms[1:])
+            ),
+        ],
+        "v": values,
+    }
+
+
+def _ws_get_numeric_history(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    max_points: int | None,
+) -> str:
+    """Fetch the numeric history and convert it to json in the executor."""
+    return JSON_DUMP(
+        messages.result_message(
+            msg_id,
+            {
+                entity_id: _encode_numeric_history(series, max_points)
+                for entity_id, series in history.get_numeric_history(
+                    hass, entity_ids, start_time, end_time, include_start_time_state
+                ).items()
+            },
+        )
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/numeric_history_during_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Required("entity_ids"): vol.All([cv.entity_id], vol.Length(min=1)),
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("max_points"): MAX_POINTS_SCHEMA,
+    }
+)
+@websocket_api.async_response
+async def ws_get_numeric_history_during_period(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Handle numeric history during period websocket command."""
+    start_time_str = msg["start_time"]
+    end_time_str = msg.get("end_time")
+
+    if start_time := dt_util.parse_datetime(start_time_str):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time_str:
+        if end_time := dt_util.parse_datetime(end_time_str):
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = None
+
+    if start_time > dt_util.utcnow():
+        connection.send_result(msg["id"], {})
+        return
+
+    connection.send_message(
+        await get_instance(hass).async_add_executor_job(
+            _ws_get_numeric_history,
+            hass,
+            msg["id"],
+            start_time,
+            end_time,
+            msg["entity_ids"],
+            msg["include_start_time_state"],
+            msg.get("max_points"),
         )
     )
 
@@ -326,6 +448,12 @@ class HistoryPeriodView(HomeAssistantView):
 
         minimal_response = "minimal_response" in request.query
         no_attributes = "no_attributes" in request.query
+        max_points: int | None = None
+        if max_points_str := request.query.get("max_points"):
+            try:
+                max_points = MAX_POINTS_SCHEMA(max_points_str)
+            except vol.Invalid:
+                return self.json_message("Invalid max_points", HTTPStatus.BAD_REQUEST)
 
         hass = request.app["hass"]
 
@@ -348,6 +476,7 @@ class HistoryPeriodView(HomeAssistantView):
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
+                max_points,
             ),
         )
 
@@ -361,6 +490,7 @@ class HistoryPeriodView(HomeAssistantView):
         significant_changes_only: bool,
         minimal_response: bool,
         no_attributes: bool,
+        max_points: int | None,
     ) -> web.Response:
         """Fetch significant stats from the database as json."""
         timer_start = time.perf_counter()
@@ -385,6 +515,12 @@ class HistoryPeriodView(HomeAssistantView):
                 "Extracted %d states in %fs", sum(map(len, states.values())), elapsed
             )
 
+        if max_points:
+            for entity_id, entity_states in states.items():
+                states[entity_id] = downsample_states(
+                    entity_states, max_points, _state_of, _timestamp_of
+                )
+
         # Optionally reorder the result to respect the ordering given
         # by any entities explicitly included in the configuration.
         if not self.filters or not self.use_include_order:
@@ -399,6 +535,20 @@ class HistoryPeriodView(HomeAssistantView):
         return self.json(sorted_result)
 
 
+def _state_of(state: State | dict[str, Any]) -> str:
+    """Return the state of a history entry."""
+    if isinstance(state, State):
+        return state.state
+    return cast(str, state[history.STATE_KEY])
+
+
+def _timestamp_of(state: State | dict[str, Any]) -> float:
+    """Return the time of a history entry as a timestamp."""
+    if isinstance(state, State):
+        return state.last_updated.timestamp()
+    return dt_util.parse_datetime(state[history.LAST_CHANGED_KEY]).timestamp()  # type: ignore[union-attr]
+
+
 def _entities_may_have_state_changes_after(
     hass: HomeAssistant, entity_ids: Iterable, start_time: dt
 ) -> bool:
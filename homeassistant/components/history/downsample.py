@@ -0,0 +1,131 @@
+"""Downsample history before it is sent to the frontend."""
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+import math
+from typing import TypeVar
+
+_T = TypeVar("_T")
+
+
+def lttb_indices(
+    times: Sequence[float], values: Sequence[float], threshold: int
+) -> list[int]:
+    """Return the indices of the points to keep with Largest-Triangle-Three-Buckets.
+
+    The first and last point are always kept. The points in between are
+    split into threshold - 2 buckets and from each bucket the point that
+    forms the largest triangle with the previously kept point and the
+    average of the next bucket is kept, which preserves peaks and dips.
+    """
+    length = len(times)
+    if threshold >= length:
+        return list(range(length))
+    if threshold <= 2:
+        return [0, length - 1][:threshold]
+
+    every = (length - 2) / (threshold - 2)
+    kept = [0]
+    previous = 0
+    for bucket in range(threshold - 2):
+        avg_start = int((bucket + 1) * every) + 1
+        avg_end = min(int((bucket + 2) * every) + 1, length)
+        avg_count = avg_end - avg_start
+        avg_time = math.fsum(times[avg_start:avg_end]) / avg_count
+        avg_value = math.fsum(values[avg_start:avg_end]) / avg_count
+
+        previous_time = times[previous]
+        previous_value = values[previous]
+        time_span = previous_time - avg_time
+        value_span = avg_value - previous_value
+        max_area = -1.0
+        selected = start = int(bucket * every) + 1
+        for idx in range(start, int((bucket + 1) * every) + 1):
+            area = abs(
+                time_span * (values[idx] - previous_value)
+                - (previous_time - times[idx]) * value_span
+            )
+            if area > max_area:
+                max_area = area
+                selected = idx
+        kept.append(selected)
+        previous = selected
+
+    kept.append(length - 1)
+    return kept
+
+
+def _as_float(state: str) -> float | None:
+    """Return the state as a finite float or None."""
+    try:
+        value = float(state)
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def downsample_states(
+    states: list[_T],
+    max_points: int,
+    get_state: Callable[[_T], str],
+    get_time: Callable[[_T], float],
+) -> list[_T]:
+    """Reduce the history of an entity to about max_points states.
+
+    Consecutive non-numeric states that are the same are merged into the
+    first one of the run. When that is not enough, the first and last
+    state of each run of numeric states are kept and the remaining points
+    are shared by the runs to downsample them with LTTB. Non-numeric
+    states are never dropped beyond merging since they can not be
+    interpolated, so only those and the ends of the runs can exceed
+    max_points.
+    """
+    if len(states) <= max_points:
+        return states
+
+    values = [_as_float(get_state(state)) for state in states]
+    merged: list[int] = []
+    for idx, value in enumerate(values):
+        if (
+            value is None
+            and merged
+            and values[merged[-1]] is None
+            and get_state(states[merged[-1]]) == get_state(states[idx])
+        ):
+            continue
+        merged.append(idx)
+
+    if len(merged) <= max_points:
+        return [states[idx] for idx in merged]
+
+    segments: list[list[int]] = []
+    kept: list[int] = []
+    for idx in merged:
+        if values[idx] is None:
+            kept.append(idx)
+        elif segments and segments[-1][-1] == idx - 1:
+            segments[-1].append(idx)
+        else:
+            segments.append([idx])
+
+    # Reserve the ends of the runs and share the rest of
+    # the budget by the number of points between them
+    reserved = sum(min(len(segment), 2) for segment in segments)
+    leftover = max(max_points - len(kept) - reserved, 0)
+    between = sum(max(len(segment) - 2, 0) for segment in segments) or 1
+    for segment in segments:
+        segment_budget = 2 + leftover * max(len(segment) - 2, 0) // between
+        if len(segment) <= segment_budget:
+            kept.extend(segment)
+            continue
+        kept.extend(
+            segment[idx]
+            for idx in lttb_indices(
+                [get_time(states[idx]) for idx in segment],
+                [values[idx] for idx in segment],  # type: ignore[misc]
+                segment_budget,
+            )
+        )
+
+    kept.sort()
+    return [states[idx] for idx in kept]
@@ -5,16 +5,13 @@ from collections.abc import Callable, Generator
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime as dt
+import time
 from typing import Any
 
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.query import Query
 
 from homeassistant.components.recorder.filters import Filters
-from homeassistant.components.recorder.models import (
-    process_datetime_to_timestamp,
-    process_timestamp_to_utc_isoformat,
-)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
 from homeassistant.const import (
@@ -152,8 +149,8 @@ class EventProcessor:
             return query.yield_per(1024)  # type: ignore[no-any-return]
 
         stmt = statement_for_request(
-            start_day,
-            end_day,
+            start_day.timestamp(),
+            end_day.timestamp(),
             self.event_types,
             self.entity_ids,
             self.device_ids,
@@ -388,12 +385,12 @@ def _rows_match(row: Row | EventAsRow, other_row: Row | EventAsRow) -> bool:
 
 def _row_time_fired_isoformat(row: Row | EventAsRow) -> str:
     """Convert the row timed_fired to isoformat."""
-    return process_timestamp_to_utc_isoformat(row.time_fired or dt_util.utcnow())
+    return dt_util.utc_from_timestamp(row.time_fired_ts or time.time()).isoformat()
 
 
 def _row_time_fired_timestamp(row: Row | EventAsRow) -> float:
     """Convert the row timed_fired to timestamp."""
-    return process_datetime_to_timestamp(row.time_fired or dt_util.utcnow())
+    return row.time_fired_ts or time.time()  # type: ignore[no-any-return]
 
 
 class EntityNameCache:
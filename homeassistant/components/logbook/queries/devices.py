@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from datetime import datetime as dt
 
 import sqlalchemy
 from sqlalchemy import lambda_stmt, select
@@ -21,6 +20,7 @@ from homeassistant.components.recorder.db_schema import (
 from .common import (
     apply_events_context_hints,
     apply_states_context_hints,
+    outerjoin_states_meta,
     select_events_context_id_subquery,
     select_events_context_only,
     select_events_without_states,
@@ -29,8 +29,8 @@ from .common import (
 
 
 def _select_device_id_context_ids_sub_query(
-    start_day: dt,
-    end_day: dt,
+    start_day: float,
+    end_day: float,
     event_types: tuple[str, ...],
     json_quotable_device_ids: list[str],
 ) -> CompoundSelect:
@@ -43,8 +43,8 @@ def _select_device_id_context_ids_sub_query(
 
 def _apply_devices_context_union(
     query: Query,
-    start_day: dt,
-    end_day: dt,
+    start_day: float,
+    end_day: float,
     event_types: tuple[str, ...],
     json_quotable_device_ids: list[str],
 ) -> CompoundSelect:
@@ -61,17 +61,19 @@ def _apply_devices_context_union(
             .select_from(devices_cte)
             .outerjoin(Events, devices_cte.c.context_id == Events.context_id)
         ).outerjoin(EventData, (Events.data_id == EventData.data_id)),
-        apply_states_context_hints(
-            select_states_context_only()
-            .select_from(devices_cte)
-            .outerjoin(States, devices_cte.c.context_id == States.context_id)
+        outerjoin_states_meta(
+            apply_states_context_hints(
+                select_states_context_only()
+                .select_from(devices_cte)
+                .outerjoin(States, devices_cte.c.context_id == States.context_id)
+            )
         ),
     )
 
 
 def devices_stmt(
-    start_day: dt,
-    end_day: dt,
+    start_day: float,
+    end_day: float,
     event_types: tuple[str, ...],
     json_quotable_device_ids: list[str],
 ) -> StatementLambdaElement:
@@ -85,7 +87,7 @@ def devices_stmt(
             end_day,
             event_types,
             json_quotable_device_ids,
-        ).order_by(Events.time_fired)
+        ).order_by(Events.time_fired_ts)
     )
     return stmt
 
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from datetime import datetime as dt
 
 import sqlalchemy
 from sqlalchemy import lambda_stmt, select, union_all
@@ -15,10 +14,12 @@ from homeassistant.components.recorder.db_schema import EventData, Events, State
 from .common import (
     apply_events_context_hints,
     apply_states_context_hints,
+    outerjoin_states_meta,
     select_events_context_id_subquery,
     select_events_context_only,
     select_events_without_states,
     select_states_context_only,
+    select_states_metadata_ids,
 )
 from .devices import apply_event_device_id_matchers
 from .entities import (
@@ -29,8 +30,8 @@ from .entities import (
 
 
 def _select_entities_device_id_context_ids_sub_query(
-    start_day: dt,
-    end_day: dt,
+    start_day: float,
+    end_day: float,
     event_types: tuple[str, ...],
     entity_ids: list[str],
     json_quoted_entity_ids: list[str],
@@ -44,16 +45,18 @@ def _select_entities_device_id_context_ids_sub_query(
             )
         ),
         apply_entities_hints(select(States.context_id))
-        .filter((States.last_updated > start_day) & (States.last_updated < end_day))
-        .where(States.entity_id.in_(entity_ids)),
+        .filter(
+            (States.last_updated_ts > start_day) & (States.last_updated_ts < end_day)
+        )
+        .where(States.metadata_id.in_(select_states_metadata_ids(entity_ids))),
     )
     return select(union.c.context_id).group_by(union.c.context_id)
 
 
 def _apply_entities_devices_context_union(
     query: Query,
-    start_day: dt,
-    end_day: dt,
+    start_day: float,
+    end_day: float,
     event_types: tuple[str, ...],
     entity_ids: list[str],
     json_quoted_entity_ids: list[str],
@@ -79,17 +82,21 @@ def _apply_entities_devices_context_union(
             .select_from(devices_entities_cte)
             .outerjoin(Events, devices_entities_cte.c.context_id == Events.context_id)
         ).outerjoin(EventData, (Events.data_id == EventData.data_id)),
-        apply_states_context_hints(
-            select_states_context_only()
-            .select_from(devices_entities_cte)
-            .outerjoin(States, devices_entities_cte.c.context_id == States.context_id)
+        outerjoin_states_meta(
+            apply_states_context_hints(
+                select_states_context_only()
+                .select_from(devices_entities_cte)
+                .outerjoin(
+                    States, devices_entities_cte.c.context_id == States.context_id
+                )
+            )
         ),
     )
 
 
 def entities_devices_stmt(
-    start_day: dt,
-    end_day: dt,
+    start_day: float,
+    end_day: float,
     event_types: tuple[str, ...],
     entity_ids: list[str],
     json_quoted_entity_ids: list[str],
@@ -109,7 +116,7 @@ def entities_devices_stmt(
             entity_ids,
             json_quoted_entity_ids,
             json_quoted_device_ids,
-        ).order_by(Events.time_fired)
+        ).order_by(Events.time_fired_ts)
     )
     return stmt
 
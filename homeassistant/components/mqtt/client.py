@@ -2,15 +2,16 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Awaitable, Callable, Iterable
-from functools import lru_cache, partial, wraps
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
 from operator import attrgetter
 import ssl
 import time
-from typing import TYPE_CHECKING, Any, Union, cast
+from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
 import uuid
 
 import attr
@@ -69,9 +70,19 @@ _LOGGER = logging.getLogger(__name__)
 
 DISCOVERY_COOLDOWN = 2
 TIMEOUT_ACK = 10
+# Window in which subscribes and unsubscribes are collected into one packet
+SUBSCRIBE_COOLDOWN = 0.1
+# Maximum number of topics sent in a single SUBSCRIBE or UNSUBSCRIBE packet
+MAX_TOPICS_PER_PACKET = 500
+# Maximum number of received messages handled in one event loop iteration
+MAX_MESSAGES_PER_BATCH = 500
+# Interval over which the received messages per second are calculated
+THROUGHPUT_INTERVAL = 10
 
 SubscribePayloadType = Union[str, bytes]  # Only bytes if encoding is None
 
+_T = TypeVar("_T")
+
 
 def publish(
     hass: HomeAssistant,
@@ -235,12 +246,99 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
 
 
+class _TopicTrieNode:
+    """Node of the subscription topic trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class SubscriptionTrie:
+    """Wildcard aware index of subscriptions keyed by their topic filter.
+
+    Every level of a topic filter is a node in the trie, the `+` and `#`
+    wildcards are stored as regular children. Adding and removing a
+    subscription only touches the nodes on the path of its topic filter and
+    looking up the subscriptions matching a topic costs O(topic levels),
+    independent of the number of subscriptions.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicTrieNode()
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of subscriptions in the trie."""
+        return self._count
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription to the trie."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.subscriptions.append(subscription)
+        self._count += 1
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription from the trie and prune empty nodes."""
+        path: list[tuple[_TopicTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                raise ValueError(f"Subscription {subscription} is not indexed")
+            path.append((node, level))
+            node = child
+        node.subscriptions.remove(subscription)
+        self._count -= 1
+
+        for parent, level in reversed(path):
+            if node.children or node.subscriptions:
+                break
+            del parent.children[level]
+            node = parent
+
+    def matching_subscriptions(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter matching the topic."""
+        matches: list[Subscription] = []
+        # Topics starting with $ are not matched by a wildcard at the first level
+        wildcards = not topic.startswith("$")
+        nodes = [self._root]
+        for level in topic.split("/"):
+            next_nodes = []
+            for node in nodes:
+                children = node.children
+                if wildcards:
+                    if (child := children.get("#")) is not None:
+                        matches.extend(child.subscriptions)
+                    if (child := children.get("+")) is not None:
+                        next_nodes.append(child)
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+            if not next_nodes:
+                return matches
+            nodes = next_nodes
+            wildcards = True
+
+        for node in nodes:
+            matches.extend(node.subscriptions)
+            # A multi-level wildcard also matches its parent level
+            if (child := node.children.get("#")) is not None:
+                matches.extend(child.subscriptions)
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -311,6 +409,7 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: list[Subscription] = []
+        self._subscription_trie = SubscriptionTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -318,6 +417,20 @@ class MQTT:
         self._paho_lock = asyncio.Lock()
 
         self._pending_operations: dict[str, asyncio.Event] = {}
+        self._pending_subscriptions: dict[str, int] = {}
+        self._pending_unsubscribes: set[str] = set()
+        self._pending_subscriptions_done: asyncio.Future[None] | None = None
+        self._pending_operations_scheduled = False
+
+        # Messages received on the paho network thread, drained on the event loop
+        self._message_buffer: deque[mqtt.MQTTMessage] = deque()
+        self._message_drain_scheduled = False
+        self._messages_received = 0
+        self._message_batches = 0
+        self._max_message_backlog = 0
+        self._throughput_start = time.monotonic()
+        # The number of messages handled in each second of the throughput window
+        self._throughput_counts: deque[tuple[int, int]] = deque()
 
         if self.hass.state == CoreState.running:
             self._ha_started.set()
@@ -421,16 +534,14 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._subscription_trie.add(subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
             self._last_subscribe = time.time()
-            await self._async_perform_subscriptions(((topic, qos),))
+            await asyncio.shield(self._async_queue_subscriptions(((topic, qos),)))
 
         @callback
         def async_remove() -> None:
@@ -438,44 +549,142 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
+            self._subscription_trie.remove(subscription)
 
             # Only unsubscribe if currently connected.
             if self.connected:
-                self.hass.async_create_task(self._async_unsubscribe(topic))
+                self._async_queue_unsubscribe(topic)
 
         return async_remove
 
-    async def _async_unsubscribe(self, topic: str) -> None:
-        """Unsubscribe from a topic.
+    @callback
+    def _async_queue_subscriptions(
+        self, subscriptions: Iterable[tuple[str, int]]
+    ) -> asyncio.Future[None]:
+        """Queue subscriptions for the next SUBSCRIBE packet.
 
-        This method is a coroutine.
+        Returns a future which is done when the broker acknowledged the packet.
+        The future is shared by all subscribers of the batch, callers should
+        shield it from cancellation.
         """
-        if any(other.topic == topic for other in self.subscriptions):
-            # Other subscriptions on topic remaining - don't unsubscribe.
+        for topic, qos in subscriptions:
+            # Subscribing again supersedes a pending unsubscribe of the topic
+            self._pending_unsubscribes.discard(topic)
+            self._pending_subscriptions[topic] = max(
+                qos, self._pending_subscriptions.get(topic, 0)
+            )
+        self._async_schedule_pending_operations()
+        if self._pending_subscriptions_done is None:
+            self._pending_subscriptions_done = self.hass.loop.create_future()
+        return self._pending_subscriptions_done
+
+    @callback
+    def _async_queue_unsubscribe(self, topic: str) -> None:
+        """Queue a topic for the next UNSUBSCRIBE packet."""
+        self._pending_unsubscribes.add(topic)
+        self._async_schedule_pending_operations()
+
+    @callback
+    def _async_schedule_pending_operations(self) -> None:
+        """Schedule sending the queued subscribes and unsubscribes."""
+        if not self._pending_operations_scheduled:
+            self._pending_operations_scheduled = True
+            self.hass.async_create_task(self._async_perform_pending_operations())
+
+    async def _async_perform_pending_operations(self) -> None:
+        """Send the subscribes and unsubscribes queued during the cooldown."""
+        done: asyncio.Future[None] | None = None
+        try:
+            await asyncio.sleep(SUBSCRIBE_COOLDOWN)
+            done = self._pending_subscriptions_done
+            pending_subscriptions = self._pending_subscriptions
+            pending_unsubscribes = self._pending_unsubscribes
+            self._pending_operations_scheduled = False
+            self._pending_subscriptions_done = None
+            self._pending_subscriptions = {}
+            self._pending_unsubscribes = set()
+            await self._async_send_pending_operations(
+                pending_subscriptions, pending_unsubscribes
+            )
+        except asyncio.CancelledError:
+            if done is None:
+                # Cancelled during the cooldown, nothing was taken from the queue
+                done = self._pending_subscriptions_done
+                self._pending_operations_scheduled = False
+                self._pending_subscriptions_done = None
+            if done is not None and not done.done():
+                done.cancel()
+            raise
+        except Exception as err:  # pylint: disable=broad-except
+            if done is not None and not done.done():
+                done.set_exception(err)
+            else:
+                _LOGGER.exception("Unexpected error sending pending (un)subscribes")
+        else:
+            if done is not None and not done.done():
+                done.set_result(None)
+
+    async def _async_send_pending_operations(
+        self, pending_subscriptions: dict[str, int], pending_unsubscribes: set[str]
+    ) -> None:
+        """Send pending subscribes and unsubscribes of topics still (not) in use."""
+        if not self.connected:
+            # Active subscriptions are restored when the client reconnects
             return
 
+        active_topics = {subscription.topic for subscription in self.subscriptions}
+        if unsubscribes := [
+            topic for topic in pending_unsubscribes if topic not in active_topics
+        ]:
+            try:
+                await self._async_perform_unsubscribes(unsubscribes)
+            except HomeAssistantError as err:
+                _LOGGER.error("Failed to unsubscribe from %s: %s", unsubscribes, err)
+
+        await self._async_perform_subscriptions(
+            (topic, qos)
+            for topic, qos in pending_subscriptions.items()
+            if topic in active_topics
+        )
+
+    async def _async_perform_unsubscribes(self, topics: list[str]) -> None:
+        """Perform MQTT client unsubscribes, multiple topics per packet."""
+
+        def _process_client_unsubscribes() -> list[tuple[int, int]]:
+            """Initiate all unsubscribes on the MQTT client and return the results."""
+            unsubscribe_result_list = []
+            for chunk in _chunked(topics, MAX_TOPICS_PER_PACKET):
+                result, mid = self._mqttc.unsubscribe(
+                    chunk[0] if len(chunk) == 1 else chunk
+                )
+                unsubscribe_result_list.append((result, mid))
+                _LOGGER.debug("Unsubscribing from %s, mid: %s", chunk, mid)
+            return unsubscribe_result_list
+
         async with self._paho_lock:
-            result: int | None = None
-            result, mid = await self.hass.async_add_executor_job(
-                self._mqttc.unsubscribe, topic
+            results = await self.hass.async_add_executor_job(
+                _process_client_unsubscribes
             )
-            _LOGGER.debug("Unsubscribing from %s, mid: %s", topic, mid)
-            _raise_on_error(result)
-        await self._wait_for_mid(mid)
+
+        await self._async_wait_for_results(results)
 
     async def _async_perform_subscriptions(
         self, subscriptions: Iterable[tuple[str, int]]
     ) -> None:
-        """Perform MQTT client subscriptions."""
+        """Perform MQTT client subscriptions, multiple topics per packet."""
+        if not (subscriptions := list(subscriptions)):
+            return
 
         def _process_client_subscriptions() -> list[tuple[int, int]]:
             """Initiate all subscriptions on the MQTT client and return the results."""
             subscribe_result_list = []
-            for topic, qos in subscriptions:
-                result, mid = self._mqttc.subscribe(topic, qos)
+            for chunk in _chunked(subscriptions, MAX_TOPICS_PER_PACKET):
+                if len(chunk) == 1:
+                    result, mid = self._mqttc.subscribe(*chunk[0])
+                else:
+                    result, mid = self._mqttc.subscribe(chunk)
                 subscribe_result_list.append((result, mid))
-                _LOGGER.debug("Subscribing to %s, mid: %s", topic, mid)
+                _LOGGER.debug("Subscribing to %s, mid: %s", chunk, mid)
             return subscribe_result_list
 
         async with self._paho_lock:
@@ -483,6 +692,10 @@ class MQTT:
                 _process_client_subscriptions
             )
 
+        await self._async_wait_for_results(results)
+
+    async def _async_wait_for_results(self, results: list[tuple[int, int]]) -> None:
+        """Wait for the ACK of successful requests and raise on failed ones."""
         tasks = []
         errors = []
         for result, mid in results:
@@ -555,41 +768,107 @@ class MQTT:
             )
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        Messages are buffered and handled in batches on the event loop, the
+        loop is only woken up when the buffer was drained before.
+        """
+        self._message_buffer.append(msg)
+        # The flag is reset before draining starts, so a message appended
+        # while the loop drains is either picked up or triggers a new drain.
+        if not self._message_drain_scheduled:
+            self._message_drain_scheduled = True
+            self.hass.loop.call_soon_threadsafe(self._async_drain_messages)
+
+    @callback
+    def _async_drain_messages(self) -> None:
+        """Handle the messages buffered by the network thread."""
+        self._message_drain_scheduled = False
+        buffer = self._message_buffer
+        if (backlog := len(buffer)) > self._max_message_backlog:
+            self._max_message_backlog = backlog
+
+        handled = 0
+        while buffer and handled < MAX_MESSAGES_PER_BATCH:
+            self._mqtt_handle_message(buffer.popleft())
+            handled += 1
+        self._message_batches += 1
+
+        # Leave room for other work on the loop before handling the rest
+        if buffer and not self._message_drain_scheduled:
+            self._message_drain_scheduled = True
+            self.hass.loop.call_soon(self._async_drain_messages)
+
+        second = int(time.monotonic())
+        counts = self._throughput_counts
+        if counts and counts[-1][0] == second:
+            counts[-1] = (second, counts[-1][1] + handled)
+        else:
+            counts.append((second, handled))
+            self._async_trim_throughput_counts(second)
+
+    @callback
+    def _async_trim_throughput_counts(self, second: int) -> None:
+        """Remove the counts of the seconds before the throughput window."""
+        counts = self._throughput_counts
+        while counts and counts[0][0] <= second - THROUGHPUT_INTERVAL:
+            counts.popleft()
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+    @callback
+    def _async_messages_per_second(self) -> float:
+        """Return the messages handled per second over the throughput window."""
+        now = time.monotonic()
+        self._async_trim_throughput_counts(int(now))
+        if not self._throughput_counts:
+            return 0.0
+        window = min(now - self._throughput_start, THROUGHPUT_INTERVAL)
+        return sum(count for _, count in self._throughput_counts) / max(window, 1)
+
+    @callback
+    def async_get_message_statistics(self) -> dict[str, Any]:
+        """Return statistics about the received messages."""
+        return {
+            "received": self._messages_received,
+            "batches": self._message_batches,
+            "backlog": len(self._message_buffer),
+            "max_backlog": self._max_message_backlog,
+            "messages_per_second": round(self._async_messages_per_second(), 2),
+        }
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
-        _LOGGER.debug(
-            "Received message on %s%s: %s",
-            msg.topic,
-            " (retained)" if msg.retain else "",
-            msg.payload[0:8192],
-        )
+        self._messages_received += 1
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Received message on %s%s: %s",
+                msg.topic,
+                " (retained)" if msg.retain else "",
+                msg.payload[0:8192],
+            )
         timestamp = dt_util.utcnow()
 
-        subscriptions = self._matching_subscriptions(msg.topic)
+        subscriptions = self._subscription_trie.matching_subscriptions(msg.topic)
+        # Payloads decoded for the matching subscriptions, keyed by encoding
+        decoded_payloads: dict[str, SubscribePayloadType | None] = {}
 
         for subscription in subscriptions:
 
-            payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
-                try:
-                    payload = msg.payload.decode(subscription.encoding)
-                except (AttributeError, UnicodeDecodeError):
+            payload: SubscribePayloadType | None = msg.payload
+            if (encoding := subscription.encoding) is not None:
+                if encoding in decoded_payloads:
+                    payload = decoded_payloads[encoding]
+                else:
+                    try:
+                        payload = msg.payload.decode(encoding)
+                    except (AttributeError, UnicodeDecodeError):
+                        payload = None
+                    decoded_payloads[encoding] = payload
+                if payload is None:
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
                         msg.payload[0:8192],
                         msg.topic,
-                        subscription.encoding,
+                        encoding,
                         subscription.job,
                     )
                     continue
@@ -683,11 +962,7 @@ def _raise_on_error(result_code: int | None) -> None:
     _raise_on_errors((result_code,))
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
+def _chunked(items: list[_T], chunk_size: int) -> Iterable[list[_T]]:
+    """Split a list in lists of at most chunk_size items."""
+    for start in range(0, len(items), chunk_size):
+        yield items[start : start + chunk_size]
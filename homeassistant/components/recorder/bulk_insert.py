@@ -0,0 +1,221 @@
+"""Write events and states with bulk inserts instead of the ORM."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import Column, Table
+
+from homeassistant.core import Event, State
+import homeassistant.util.dt as dt_util
+
+from .db_schema import (
+    EVENT_ORIGIN_TO_IDX,
+    EventData,
+    Events,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+
+
+@dataclass
+class PendingRows:
+    """Rows collected for the next commit.
+
+    Rows that depend on an id that is only known once another pending
+    row has been inserted keep the key of that row instead:
+
+    events: (row, shared_data of a pending event_data row)
+    states: (row, shared_attrs of a pending state_attributes row,
+             entity_id of a pending states_meta row,
+             index of the pending previous state of the entity)
+    """
+
+    event_data: dict[str, dict[str, Any]] = field(default_factory=dict)
+    state_attributes: dict[str, dict[str, Any]] = field(default_factory=dict)
+    states_meta: dict[str, dict[str, Any]] = field(default_factory=dict)
+    events: list[tuple[dict[str, Any], str | None]] = field(default_factory=list)
+    states: list[tuple[dict[str, Any], str | None, str | None, int | None]] = field(
+        default_factory=list
+    )
+    # entity_id -> index of the last pending state of the entity
+    last_state_index: dict[str, int] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        """Return if there are any rows to write."""
+        return bool(self.events or self.states)
+
+
+@dataclass
+class WrittenIds:
+    """Ids assigned to the pending rows by the database."""
+
+    data_ids: dict[str, int]
+    attributes_ids: dict[str, int]
+    metadata_ids: dict[str, int]
+    last_state_ids: dict[str, int]
+
+
+def event_row_from_event(event: Event) -> dict[str, Any]:
+    """Create an events row from an event."""
+    return {
+        "event_type": event.event_type,
+        "event_data": None,
+        "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+        "time_fired": None,
+        "time_fired_ts": dt_util.utc_to_timestamp(event.time_fired),
+        "context_id": event.context.id,
+        "context_user_id": event.context.user_id,
+        "context_parent_id": event.context.parent_id,
+        "data_id": None,
+    }
+
+
+def state_row_from_event(event: Event) -> dict[str, Any]:
+    """Create a states row from a state_changed event.
+
+    Matches States.from_event.
+    """
+    state: State | None = event.data.get("new_state")
+    row: dict[str, Any] = {
+        "entity_id": None,
+        "attributes": None,
+        "context_id": event.context.id,
+        "context_user_id": event.context.user_id,
+        "context_parent_id": event.context.parent_id,
+        "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+        "old_state_id": None,
+        "attributes_id": None,
+        "metadata_id": None,
+    }
+    # None state means the state was removed from the state machine
+    if state is None:
+        row["state"] = ""
+        row["last_updated_ts"] = dt_util.utc_to_timestamp(event.time_fired)
+        row["last_changed_ts"] = None
+        return row
+
+    row["state"] = state.state
+    row["last_updated_ts"] = dt_util.utc_to_timestamp(state.last_updated)
+    if state.last_updated == state.last_changed:
+        row["last_changed_ts"] = None
+    else:
+        row["last_changed_ts"] = dt_util.utc_to_timestamp(state.last_changed)
+    return row
+
+
+def insert_rows_returning_ids(
+    connection: Connection, table: Table, id_column: Column, rows: list[dict]
+) -> list[int]:
+    """Insert rows and return their ids in order.
+
+    The ids are returned by the insert itself where the driver supports
+    RETURNING for executemany, otherwise the rows are inserted one by one
+    so the id of each row is known from its cursor. The ids cannot be
+    selected back after the insert since other connections, like the one
+    of a purge or of another program, can insert rows at the same time and
+    the database is free to hand out the ids out of order.
+    """
+    if connection.dialect.insert_executemany_returning:
+        return list(
+            connection.execute(insert(table).returning(id_column), rows).scalars()
+        )
+    stmt = insert(table)
+    return [connection.execute(stmt, row).inserted_primary_key[0] for row in rows]
+
+
+def write_pending_rows(connection: Connection, pending: PendingRows) -> WrittenIds:
+    """Insert the pending rows and resolve the ids they refer to."""
+    data_ids: dict[str, int] = {}
+    if pending.event_data:
+        data_ids = dict(
+            zip(
+                pending.event_data,
+                insert_rows_returning_ids(
+                    connection,
+                    EventData.__table__,
+                    EventData.data_id,
+                    list(pending.event_data.values()),
+                ),
+            )
+        )
+    attributes_ids: dict[str, int] = {}
+    if pending.state_attributes:
+        attributes_ids = dict(
+            zip(
+                pending.state_attributes,
+                insert_rows_returning_ids(
+                    connection,
+                    StateAttributes.__table__,
+                    StateAttributes.attributes_id,
+                    list(pending.state_attributes.values()),
+                ),
+            )
+        )
+
+    metadata_ids: dict[str, int] = {}
+    if pending.states_meta:
+        metadata_ids = dict(
+            zip(
+                pending.states_meta,
+                insert_rows_returning_ids(
+                    connection,
+                    StatesMeta.__table__,
+                    StatesMeta.metadata_id,
+                    list(pending.states_meta.values()),
+                ),
+            )
+        )
+
+    if pending.events:
+        event_rows = []
+        for row, shared_data in pending.events:
+            if shared_data is not None:
+                row["data_id"] = data_ids[shared_data]
+            event_rows.append(row)
+        connection.execute(insert(Events.__table__), event_rows)
+
+    # A state can only be inserted once the id of the previous state of
+    # the entity is known so entities that changed more than once since
+    # the last commit are inserted over multiple rounds.
+    state_ids: list[int | None] = [None] * len(pending.states)
+    remaining = list(range(len(pending.states)))
+    while remaining:
+        inserting: list[int] = []
+        deferred: list[int] = []
+        for idx in remaining:
+            row, shared_attrs, entity_id, previous_idx = pending.states[idx]
+            if previous_idx is not None:
+                if (old_state_id := state_ids[previous_idx]) is None:
+                    deferred.append(idx)
+                    continue
+                row["old_state_id"] = old_state_id
+            if shared_attrs is not None:
+                row["attributes_id"] = attributes_ids[shared_attrs]
+            if entity_id is not None:
+                row["metadata_id"] = metadata_ids[entity_id]
+            inserting.append(idx)
+        for idx, state_id in zip(
+            inserting,
+            insert_rows_returning_ids(
+                connection,
+                States.__table__,
+                States.state_id,
+                [pending.states[idx][0] for idx in inserting],
+            ),
+        ):
+            state_ids[idx] = state_id
+        remaining = deferred
+
+    return WrittenIds(
+        data_ids,
+        attributes_ids,
+        metadata_ids,
+        {
+            entity_id: state_ids[idx]  # type: ignore[misc]
+            for entity_id, idx in pending.last_state_index.items()
+        },
+    )
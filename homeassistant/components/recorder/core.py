@@ -41,6 +41,12 @@ from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 
 from . import migration, statistics
+from .bulk_insert import (
+    PendingRows,
+    event_row_from_event,
+    state_row_from_event,
+    write_pending_rows,
+)
 from .const import (
     DB_WORKER_PREFIX,
     KEEPALIVE_TIME,
@@ -56,6 +62,7 @@ from .db_schema import (
     Events,
     StateAttributes,
     States,
+    StatesMeta,
     StatisticsRuns,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
@@ -66,7 +73,12 @@ from .models import (
     process_timestamp,
 )
 from .pool import POOL_SIZE, MutexPool, RecorderPool
-from .queries import find_shared_attributes_id, find_shared_data_id
+from .purge import PurgeProgress
+from .queries import (
+    find_shared_attributes_id,
+    find_shared_data_id,
+    find_states_metadata_ids,
+)
 from .run_history import RunHistory
 from .tasks import (
     AdjustStatisticsTask,
@@ -89,6 +101,7 @@ from .util import (
     build_mysqldb_conv,
     dburl_to_path,
     end_incomplete_runs,
+    execute_stmt_lambda_element,
     is_second_sunday,
     move_away_broken_database,
     session_scope,
@@ -151,6 +164,7 @@ class Recorder(threading.Thread):
         entity_filter: Callable[[str], bool],
         exclude_t: list[str],
         exclude_attributes_by_domain: dict[str, set[str]],
+        bulk_insert: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -182,12 +196,20 @@ class Recorder(threading.Thread):
         self._event_data_ids: LRU = LRU(EVENT_DATA_ID_CACHE_SIZE)
         self._pending_state_attributes: dict[str, StateAttributes] = {}
         self._pending_event_data: dict[str, EventData] = {}
+        # There are few entities so all metadata_ids are kept
+        self._state_metadata_ids: dict[str, int] = {}
+        self._pending_states_meta: dict[str, StatesMeta] = {}
         self._pending_expunge: list[States] = []
+        # Used instead of the ORM unit of work when bulk_insert is enabled
+        self.bulk_insert = bulk_insert
+        self._pending_rows = PendingRows()
+        self._old_state_ids: dict[str, int] = {}
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
+        self.purge_progress: PurgeProgress | None = None
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
         self._exclude_attributes_by_domain = exclude_attributes_by_domain
@@ -238,6 +260,15 @@ class Recorder(threading.Thread):
         """Enable or disable recording events and states."""
         self.enabled = enable
 
+    def evict_state_metadata_ids(self, entity_ids: Iterable[str]) -> None:
+        """Forget the cached metadata_ids of entities.
+
+        Must be called in the recorder thread once their states_meta rows
+        are deleted.
+        """
+        for entity_id in entity_ids:
+            self._state_metadata_ids.pop(entity_id, None)
+
     @callback
     def async_start_executor(self) -> None:
         """Start the executor."""
@@ -702,7 +733,12 @@ class Recorder(threading.Thread):
     def _process_one_event(self, event: Event) -> None:
         if not self.enabled:
             return
-        if event.event_type == EVENT_STATE_CHANGED:
+        if self.bulk_insert:
+            if event.event_type == EVENT_STATE_CHANGED:
+                self._process_state_changed_event_into_rows(event)
+            else:
+                self._process_non_state_changed_event_into_rows(event)
+        elif event.event_type == EVENT_STATE_CHANGED:
             self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
@@ -746,6 +782,39 @@ class Recorder(threading.Thread):
                 return cast(int, data_id[0])
         return None
 
+    def _find_states_metadata_id_in_db(self, entity_id: str) -> int | None:
+        """Find the metadata_id of an entity_id in the db."""
+        assert self.event_session is not None
+        with self.event_session.no_autoflush:
+            if row := self.event_session.execute(
+                find_states_metadata_ids([entity_id])
+            ).first():
+                return cast(int, row[0])
+        return None
+
+    def get_states_metadata_ids(
+        self, session: Session, entity_ids: Iterable[str]
+    ) -> dict[str, int]:
+        """Return the metadata_ids of the entity_ids that have been recorded.
+
+        May be called from any thread, ids that are not cached yet are
+        looked up with the passed session.
+        """
+        cached = self._state_metadata_ids
+        metadata_ids: dict[str, int] = {}
+        missing: list[str] = []
+        for entity_id in entity_ids:
+            if (metadata_id := cached.get(entity_id)) is not None:
+                metadata_ids[entity_id] = metadata_id
+            else:
+                missing.append(entity_id)
+        if missing:
+            for metadata_id, entity_id in execute_stmt_lambda_element(
+                session, find_states_metadata_ids(missing)
+            ):
+                metadata_ids[entity_id] = metadata_id
+        return metadata_ids
+
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
         """Process any event into the session except state changed."""
         assert self.event_session is not None
@@ -821,18 +890,140 @@ class Recorder(threading.Thread):
                 self._pending_state_attributes[shared_attrs] = dbstate_attributes
                 self.event_session.add(dbstate_attributes)
 
-        if old_state := self._old_states.pop(dbstate.entity_id, None):
+        entity_id: str = event.data["entity_id"]
+        # Matching metadata found in the pending commit
+        if pending_states_meta := self._pending_states_meta.get(entity_id):
+            dbstate.states_meta_rel = pending_states_meta
+        # Matching metadata_id found in the cache
+        elif metadata_id := self._state_metadata_ids.get(entity_id):
+            dbstate.metadata_id = metadata_id
+        # Matching metadata found in the database
+        elif metadata_id := self._find_states_metadata_id_in_db(entity_id):
+            dbstate.metadata_id = self._state_metadata_ids[entity_id] = metadata_id
+        # No matching metadata found, save it in the DB
+        else:
+            dbstates_meta = StatesMeta(entity_id=entity_id)
+            dbstate.states_meta_rel = self._pending_states_meta[
+                entity_id
+            ] = dbstates_meta
+            self.event_session.add(dbstates_meta)
+
+        if old_state := self._old_states.pop(entity_id, None):
             if old_state.state_id:
                 dbstate.old_state_id = old_state.state_id
             else:
                 dbstate.old_state = old_state
         if event.data.get("new_state"):
-            self._old_states[dbstate.entity_id] = dbstate
+            self._old_states[entity_id] = dbstate
             self._pending_expunge.append(dbstate)
         else:
             dbstate.state = None
         self.event_session.add(dbstate)
 
+    def _process_non_state_changed_event_into_rows(self, event: Event) -> None:
+        """Process any event except state changed into the pending rows."""
+        pending = self._pending_rows
+        row = event_row_from_event(event)
+        if not event.data:
+            pending.events.append((row, None))
+            return
+
+        try:
+            shared_data_bytes = EventData.shared_data_bytes_from_event(event)
+        except JSON_ENCODE_EXCEPTIONS as ex:
+            _LOGGER.warning("Event is not JSON serializable: %s: %s", event, ex)
+            return
+
+        shared_data = shared_data_bytes.decode("utf-8")
+        # Matching data found in the pending commit
+        if shared_data in pending.event_data:
+            pending.events.append((row, shared_data))
+            return
+        # Matching data id found in the cache
+        if data_id := self._event_data_ids.get(shared_data):
+            row["data_id"] = data_id
+            pending.events.append((row, None))
+            return
+        data_hash = EventData.hash_shared_data_bytes(shared_data_bytes)
+        # Matching data found in the database
+        if data_id := self._find_shared_data_in_db(data_hash, shared_data):
+            self._event_data_ids[shared_data] = row["data_id"] = data_id
+            pending.events.append((row, None))
+            return
+        # No matching data found, save them in the DB
+        pending.event_data[shared_data] = {
+            "shared_data": shared_data,
+            "hash": data_hash,
+        }
+        pending.events.append((row, shared_data))
+
+    def _process_state_changed_event_into_rows(self, event: Event) -> None:
+        """Process a state_changed event into the pending rows."""
+        pending = self._pending_rows
+        try:
+            row = state_row_from_event(event)
+            shared_attrs_bytes = StateAttributes.shared_attrs_bytes_from_event(
+                event, self._exclude_attributes_by_domain
+            )
+        except JSON_ENCODE_EXCEPTIONS as ex:
+            _LOGGER.warning(
+                "State is not JSON serializable: %s: %s",
+                event.data.get("new_state"),
+                ex,
+            )
+            return
+
+        shared_attrs = shared_attrs_bytes.decode("utf-8")
+        pending_shared_attrs: str | None = None
+        # Matching attributes found in the pending commit
+        if shared_attrs in pending.state_attributes:
+            pending_shared_attrs = shared_attrs
+        # Matching attributes id found in the cache
+        elif attributes_id := self._state_attributes_ids.get(shared_attrs):
+            row["attributes_id"] = attributes_id
+        else:
+            attr_hash = StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
+            # Matching attributes found in the database
+            if attributes_id := self._find_shared_attr_in_db(attr_hash, shared_attrs):
+                row["attributes_id"] = attributes_id
+                self._state_attributes_ids[shared_attrs] = attributes_id
+            # No matching attributes found, save them in the DB
+            else:
+                pending.state_attributes[shared_attrs] = {
+                    "shared_attrs": shared_attrs,
+                    "hash": attr_hash,
+                }
+                pending_shared_attrs = shared_attrs
+
+        entity_id: str = event.data["entity_id"]
+        pending_entity_id: str | None = None
+        # Matching metadata found in the pending commit
+        if entity_id in pending.states_meta:
+            pending_entity_id = entity_id
+        # Matching metadata_id found in the cache
+        elif metadata_id := self._state_metadata_ids.get(entity_id):
+            row["metadata_id"] = metadata_id
+        # Matching metadata found in the database
+        elif metadata_id := self._find_states_metadata_id_in_db(entity_id):
+            row["metadata_id"] = self._state_metadata_ids[entity_id] = metadata_id
+        # No matching metadata found, save it in the DB
+        else:
+            pending.states_meta[entity_id] = {"entity_id": entity_id}
+            pending_entity_id = entity_id
+
+        # The previous state is either in the pending commit
+        # or was written by an earlier commit
+        previous_idx = pending.last_state_index.pop(entity_id, None)
+        if previous_idx is None:
+            row["old_state_id"] = self._old_state_ids.pop(entity_id, None)
+        if event.data.get("new_state"):
+            pending.last_state_index[entity_id] = len(pending.states)
+        else:
+            row["state"] = None
+        pending.states.append(
+            (row, pending_shared_attrs, pending_entity_id, previous_idx)
+        )
+
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
         if isinstance(err.__cause__, sqlite3.DatabaseError):
@@ -845,7 +1036,10 @@ class Recorder(threading.Thread):
 
     def _event_session_has_pending_writes(self) -> bool:
         return bool(
-            self.event_session and (self.event_session.new or self.event_session.dirty)
+            self.event_session
+            and (
+                self._pending_rows or self.event_session.new or self.event_session.dirty
+            )
         )
 
     def _commit_event_session_or_retry(self) -> None:
@@ -874,7 +1068,10 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         self._commits_without_expire += 1
 
-        self.event_session.commit()
+        if self._pending_rows:
+            self._commit_pending_rows()
+        else:
+            self.event_session.commit()
         if self._pending_expunge:
             for dbstate in self._pending_expunge:
                 # Expunge the state so its not expired
@@ -895,6 +1092,9 @@ class Recorder(threading.Thread):
         for event_data in self._pending_event_data.values():
             self._event_data_ids[event_data.shared_data] = event_data.data_id
         self._pending_event_data = {}
+        for states_meta in self._pending_states_meta.values():
+            self._state_metadata_ids[states_meta.entity_id] = states_meta.metadata_id
+        self._pending_states_meta = {}
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -903,6 +1103,28 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             self.event_session.expire_all()
 
+    def _commit_pending_rows(self) -> None:
+        """Write the pending rows with bulk inserts and commit them."""
+        assert self.event_session is not None
+        try:
+            written = write_pending_rows(
+                self.event_session.connection(), self._pending_rows
+            )
+            self.event_session.commit()
+        except Exception:
+            # Keep the pending rows so the commit can be retried
+            self.event_session.rollback()
+            raise
+        self._pending_rows = PendingRows()
+        # Same as the ORM path, we now know the ids of the
+        # new shared attributes and data and the latest states
+        for shared_attrs, attributes_id in written.attributes_ids.items():
+            self._state_attributes_ids[shared_attrs] = attributes_id
+        for shared_data, data_id in written.data_ids.items():
+            self._event_data_ids[shared_data] = data_id
+        self._state_metadata_ids.update(written.metadata_ids)
+        self._old_state_ids.update(written.last_state_ids)
+
     def _handle_sqlite_corruption(self) -> None:
         """Handle the sqlite3 database being corrupt."""
         self._close_event_session()
@@ -919,6 +1141,10 @@ class Recorder(threading.Thread):
         self._event_data_ids = {}
         self._pending_state_attributes = {}
         self._pending_event_data = {}
+        self._state_metadata_ids = {}
+        self._pending_states_meta = {}
+        self._pending_rows = PendingRows()
+        self._old_state_ids = {}
 
         if not self.event_session:
             return
@@ -12,7 +12,7 @@ from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_
 from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
 from homeassistant.helpers.typing import ConfigType
 
-from .db_schema import ENTITY_ID_IN_EVENT, OLD_ENTITY_ID_IN_EVENT, States
+from .db_schema import ENTITY_ID_IN_EVENT, OLD_ENTITY_ID_IN_EVENT, States, StatesMeta
 
 DOMAIN = "history"
 HISTORY_FILTERS = "history_filters"
@@ -184,14 +184,21 @@ class Filters:
         #  - Only pass if entity is included.  Ignore entity excludes.
         return i_entities
 
-    def states_entity_filter(self) -> ClauseList:
-        """Generate the entity filter query."""
+    def states_entity_filter(self, legacy: bool = False) -> ClauseList:
+        """Generate the entity filter query.
+
+        The filter is on the states_meta table unless legacy is set, in
+        which case it is on the entity_id column of the states table that
+        is no longer used for new rows.
+        """
 
         def _encoder(data: Any) -> Any:
             """Nothing to encode for states since there is no json."""
             return data
 
-        return self._generate_filter_for_columns((States.entity_id,), _encoder)
+        if legacy:
+            return self._generate_filter_for_columns((States.entity_id,), _encoder)
+        return self._generate_filter_for_columns((StatesMeta.entity_id,), _encoder)
 
     def events_entity_filter(self) -> ClauseList:
         """Generate the entity filter query."""
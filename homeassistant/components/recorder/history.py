@@ -1,15 +1,17 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
+from array import array
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from datetime import datetime
 from itertools import groupby
 import logging
+import math
 import time
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
 
-from sqlalchemy import Column, Text, and_, func, lambda_stmt, or_, select
+from sqlalchemy import Column, Float, Text, and_, func, lambda_stmt, or_, select
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.query import Query
 from sqlalchemy.orm.session import Session
@@ -25,14 +27,16 @@ from homeassistant.components.websocket_api.const import (
 from homeassistant.core import HomeAssistant, State, split_entity_id
 import homeassistant.util.dt as dt_util
 
-from .db_schema import RecorderRuns, StateAttributes, States
+from .db_schema import RecorderRuns, StateAttributes, States, StatesMeta
 from .filters import Filters
 from .models import (
     LazyState,
+    LazyStatePreSchema31,
     process_datetime_to_timestamp,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
     row_to_compressed_state,
+    row_to_compressed_state_pre_schema_31,
 )
 from .util import execute_stmt_lambda_element, session_scope
 
@@ -61,50 +65,122 @@ NEED_ATTRIBUTE_DOMAINS = {
     "water_heater",
 }
 
+# The entity_ids were moved to the states_meta table in schema 30 and the
+# times were moved to timestamp columns in schema 31. While the database
+# is migrated the instance reports the last schema version that was fully
+# migrated to, and the queries only use what that version has.
+STATES_META_SCHEMA_VERSION = 30
+TIMESTAMP_SCHEMA_VERSION = 31
+
 BASE_STATES = [
+    StatesMeta.entity_id,
+    States.state,
+    States.last_changed_ts,
+    States.last_updated_ts,
+]
+BASE_STATES_NO_LAST_CHANGED = [
+    StatesMeta.entity_id,
+    States.state,
+    literal(value=None, type_=Float).label("last_changed_ts"),
+    States.last_updated_ts,
+]
+QUERY_STATE_NO_ATTR = [
+    *BASE_STATES,
+    literal(value=None, type_=Text).label("attributes"),
+    literal(value=None, type_=Text).label("shared_attrs"),
+]
+QUERY_STATE_NO_ATTR_NO_LAST_CHANGED = [
+    *BASE_STATES_NO_LAST_CHANGED,
+    literal(value=None, type_=Text).label("attributes"),
+    literal(value=None, type_=Text).label("shared_attrs"),
+]
+QUERY_STATES = [
+    *BASE_STATES,
+    # Remove States.attributes once all attributes are in StateAttributes.shared_attrs
+    States.attributes,
+    StateAttributes.shared_attrs,
+]
+QUERY_STATES_NO_LAST_CHANGED = [
+    *BASE_STATES_NO_LAST_CHANGED,
+    # Remove States.attributes once all attributes are in StateAttributes.shared_attrs
+    States.attributes,
+    StateAttributes.shared_attrs,
+]
+# Remove the PRE_SCHEMA_31 queries once migrating
+# from before schema 31 is no longer supported
+PRE_SCHEMA_31_BASE_STATES = [
+    StatesMeta.entity_id,
+    States.state,
+    States.last_changed,
+    States.last_updated,
+]
+PRE_SCHEMA_31_BASE_STATES_NO_LAST_CHANGED = [
+    StatesMeta.entity_id,
+    States.state,
+    literal(value=None, type_=Text).label("last_changed"),
+    States.last_updated,
+]
+PRE_SCHEMA_31_QUERY_STATE_NO_ATTR = [
+    *PRE_SCHEMA_31_BASE_STATES,
+    literal(value=None, type_=Text).label("attributes"),
+    literal(value=None, type_=Text).label("shared_attrs"),
+]
+PRE_SCHEMA_31_QUERY_STATE_NO_ATTR_NO_LAST_CHANGED = [
+    *PRE_SCHEMA_31_BASE_STATES_NO_LAST_CHANGED,
+    literal(value=None, type_=Text).label("attributes"),
+    literal(value=None, type_=Text).label("shared_attrs"),
+]
+PRE_SCHEMA_31_QUERY_STATES = [
+    *PRE_SCHEMA_31_BASE_STATES,
+    States.attributes,
+    StateAttributes.shared_attrs,
+]
+PRE_SCHEMA_31_QUERY_STATES_NO_LAST_CHANGED = [
+    *PRE_SCHEMA_31_BASE_STATES_NO_LAST_CHANGED,
+    States.attributes,
+    StateAttributes.shared_attrs,
+]
+# Remove the LEGACY queries once migrating
+# from before schema 30 is no longer supported
+LEGACY_BASE_STATES = [
     States.entity_id,
     States.state,
     States.last_changed,
     States.last_updated,
 ]
-BASE_STATES_NO_LAST_CHANGED = [
+LEGACY_BASE_STATES_NO_LAST_CHANGED = [
     States.entity_id,
     States.state,
     literal(value=None, type_=Text).label("last_changed"),
     States.last_updated,
 ]
-QUERY_STATE_NO_ATTR = [
-    *BASE_STATES,
+LEGACY_QUERY_STATE_NO_ATTR = [
+    *LEGACY_BASE_STATES,
     literal(value=None, type_=Text).label("attributes"),
     literal(value=None, type_=Text).label("shared_attrs"),
 ]
-QUERY_STATE_NO_ATTR_NO_LAST_CHANGED = [
-    *BASE_STATES_NO_LAST_CHANGED,
+LEGACY_QUERY_STATE_NO_ATTR_NO_LAST_CHANGED = [
+    *LEGACY_BASE_STATES_NO_LAST_CHANGED,
     literal(value=None, type_=Text).label("attributes"),
     literal(value=None, type_=Text).label("shared_attrs"),
 ]
-# Remove QUERY_STATES_PRE_SCHEMA_25
-# and the migration_in_progress check
-# once schema 26 is created
 QUERY_STATES_PRE_SCHEMA_25 = [
-    *BASE_STATES,
+    *LEGACY_BASE_STATES,
     States.attributes,
     literal(value=None, type_=Text).label("shared_attrs"),
 ]
 QUERY_STATES_PRE_SCHEMA_25_NO_LAST_CHANGED = [
-    *BASE_STATES_NO_LAST_CHANGED,
+    *LEGACY_BASE_STATES_NO_LAST_CHANGED,
     States.attributes,
     literal(value=None, type_=Text).label("shared_attrs"),
 ]
-QUERY_STATES = [
-    *BASE_STATES,
-    # Remove States.attributes once all attributes are in StateAttributes.shared_attrs
+LEGACY_QUERY_STATES = [
+    *LEGACY_BASE_STATES,
     States.attributes,
     StateAttributes.shared_attrs,
 ]
-QUERY_STATES_NO_LAST_CHANGED = [
-    *BASE_STATES_NO_LAST_CHANGED,
-    # Remove States.attributes once all attributes are in StateAttributes.shared_attrs
+LEGACY_QUERY_STATES_NO_LAST_CHANGED = [
+    *LEGACY_BASE_STATES_NO_LAST_CHANGED,
     States.attributes,
     StateAttributes.shared_attrs,
 ]
@@ -114,22 +190,127 @@ def _schema_version(hass: HomeAssistant) -> int:
     return recorder.get_instance(hass).schema_version
 
 
+def _metadata_ids(
+    hass: HomeAssistant, session: Session, entity_ids: list[str] | None
+) -> list[int]:
+    """Return the metadata_ids of the entity_ids that have been recorded."""
+    if not entity_ids:
+        return []
+    return list(
+        recorder.get_instance(hass)
+        .get_states_metadata_ids(session, entity_ids)
+        .values()
+    )
+
+
 def lambda_stmt_and_join_attributes(
     schema_version: int, no_attributes: bool, include_last_changed: bool = True
 ) -> tuple[StatementLambdaElement, bool]:
     """Return the lambda_stmt and if StateAttributes should be joined.
 
+    The states_meta table is always joined to get the entity_id.
+
     Because these are lambda_stmt the values inside the lambdas need
     to be explicitly written out to avoid caching the wrong values.
     """
+    if schema_version < STATES_META_SCHEMA_VERSION:
+        return _legacy_lambda_stmt_and_join_attributes(
+            schema_version, no_attributes, include_last_changed
+        )
+    if schema_version < TIMESTAMP_SCHEMA_VERSION:
+        return _pre_schema_31_lambda_stmt_and_join_attributes(
+            no_attributes, include_last_changed
+        )
     # If no_attributes was requested we do the query
     # without the attributes fields and do not join the
     # state_attributes table
     if no_attributes:
         if include_last_changed:
-            return lambda_stmt(lambda: select(*QUERY_STATE_NO_ATTR)), False
+            return (
+                lambda_stmt(
+                    lambda: select(*QUERY_STATE_NO_ATTR)
+                    .select_from(States)
+                    .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                ),
+                False,
+            )
+        return (
+            lambda_stmt(
+                lambda: select(*QUERY_STATE_NO_ATTR_NO_LAST_CHANGED)
+                .select_from(States)
+                .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            ),
+            False,
+        )
+    if include_last_changed:
+        return (
+            lambda_stmt(
+                lambda: select(*QUERY_STATES)
+                .select_from(States)
+                .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            ),
+            True,
+        )
+    return (
+        lambda_stmt(
+            lambda: select(*QUERY_STATES_NO_LAST_CHANGED)
+            .select_from(States)
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        ),
+        True,
+    )
+
+
+def _pre_schema_31_lambda_stmt_and_join_attributes(
+    no_attributes: bool, include_last_changed: bool
+) -> tuple[StatementLambdaElement, bool]:
+    """Return the lambda_stmt for a schema without the timestamp columns."""
+    if no_attributes:
+        if include_last_changed:
+            return (
+                lambda_stmt(
+                    lambda: select(*PRE_SCHEMA_31_QUERY_STATE_NO_ATTR)
+                    .select_from(States)
+                    .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                ),
+                False,
+            )
+        return (
+            lambda_stmt(
+                lambda: select(*PRE_SCHEMA_31_QUERY_STATE_NO_ATTR_NO_LAST_CHANGED)
+                .select_from(States)
+                .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            ),
+            False,
+        )
+    if include_last_changed:
+        return (
+            lambda_stmt(
+                lambda: select(*PRE_SCHEMA_31_QUERY_STATES)
+                .select_from(States)
+                .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            ),
+            True,
+        )
+    return (
+        lambda_stmt(
+            lambda: select(*PRE_SCHEMA_31_QUERY_STATES_NO_LAST_CHANGED)
+            .select_from(States)
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        ),
+        True,
+    )
+
+
+def _legacy_lambda_stmt_and_join_attributes(
+    schema_version: int, no_attributes: bool, include_last_changed: bool
+) -> tuple[StatementLambdaElement, bool]:
+    """Return the lambda_stmt for a schema without the states_meta table."""
+    if no_attributes:
+        if include_last_changed:
+            return lambda_stmt(lambda: select(*LEGACY_QUERY_STATE_NO_ATTR)), False
         return (
-            lambda_stmt(lambda: select(*QUERY_STATE_NO_ATTR_NO_LAST_CHANGED)),
+            lambda_stmt(lambda: select(*LEGACY_QUERY_STATE_NO_ATTR_NO_LAST_CHANGED)),
             False,
         )
     # If we in the process of migrating schema we do
@@ -145,12 +326,9 @@ def lambda_stmt_and_join_attributes(
             lambda_stmt(lambda: select(*QUERY_STATES_PRE_SCHEMA_25_NO_LAST_CHANGED)),
             False,
         )
-    # Finally if no migration is in progress and no_attributes
-    # was not requested, we query both attributes columns and
-    # join state_attributes
     if include_last_changed:
-        return lambda_stmt(lambda: select(*QUERY_STATES)), True
-    return lambda_stmt(lambda: select(*QUERY_STATES_NO_LAST_CHANGED)), True
+        return lambda_stmt(lambda: select(*LEGACY_QUERY_STATES)), True
+    return lambda_stmt(lambda: select(*LEGACY_QUERY_STATES_NO_LAST_CHANGED)), True
 
 
 def get_significant_states(
@@ -183,6 +361,18 @@ def get_significant_states(
 
 
 def _ignore_domains_filter(query: Query) -> Query:
+    """Add a filter to ignore domains we do not fetch history for."""
+    return query.filter(
+        and_(
+            *[
+                ~StatesMeta.entity_id.like(entity_domain)
+                for entity_domain in IGNORE_DOMAINS_ENTITY_ID_LIKE
+            ]
+        )
+    )
+
+
+def _legacy_ignore_domains_filter(query: Query) -> Query:
     """Add a filter to ignore domains we do not fetch history for."""
     return query.filter(
         and_(
@@ -199,6 +389,7 @@ def _significant_states_stmt(
     start_time: datetime,
     end_time: datetime | None,
     entity_ids: list[str] | None,
+    metadata_ids: list[int],
     filters: Filters | None,
     significant_changes_only: bool,
     no_attributes: bool,
@@ -207,20 +398,42 @@ def _significant_states_stmt(
     stmt, join_attributes = lambda_stmt_and_join_attributes(
         schema_version, no_attributes, include_last_changed=not significant_changes_only
     )
+    legacy = schema_version < STATES_META_SCHEMA_VERSION
+    pre_schema_31 = schema_version < TIMESTAMP_SCHEMA_VERSION
     if (
         entity_ids
         and len(entity_ids) == 1
         and significant_changes_only
         and split_entity_id(entity_ids[0])[0] not in SIGNIFICANT_DOMAINS
     ):
+        if pre_schema_31:
+            stmt += lambda q: q.filter(
+                (States.last_changed == States.last_updated)
+                | States.last_changed.is_(None)
+            )
+        else:
+            stmt += lambda q: q.filter(
+                (States.last_changed_ts == States.last_updated_ts)
+                | States.last_changed_ts.is_(None)
+            )
+    elif significant_changes_only and legacy:
         stmt += lambda q: q.filter(
-            (States.last_changed == States.last_updated) | States.last_changed.is_(None)
+            or_(
+                *[
+                    States.entity_id.like(entity_domain)
+                    for entity_domain in SIGNIFICANT_DOMAINS_ENTITY_ID_LIKE
+                ],
+                (
+                    (States.last_changed == States.last_updated)
+                    | States.last_changed.is_(None)
+                ),
+            )
         )
-    elif significant_changes_only:
+    elif significant_changes_only and pre_schema_31:
         stmt += lambda q: q.filter(
             or_(
                 *[
-                    States.entity_id.like(entity_domain)
+                    StatesMeta.entity_id.like(entity_domain)
                     for entity_domain in SIGNIFICANT_DOMAINS_ENTITY_ID_LIKE
                 ],
                 (
@@ -229,9 +442,31 @@ def _significant_states_stmt(
                 ),
             )
         )
+    elif significant_changes_only:
+        stmt += lambda q: q.filter(
+            or_(
+                *[
+                    StatesMeta.entity_id.like(entity_domain)
+                    for entity_domain in SIGNIFICANT_DOMAINS_ENTITY_ID_LIKE
+                ],
+                (
+                    (States.last_changed_ts == States.last_updated_ts)
+                    | States.last_changed_ts.is_(None)
+                ),
+            )
+        )
 
-    if entity_ids:
+    if entity_ids and legacy:
         stmt += lambda q: q.filter(States.entity_id.in_(entity_ids))
+    elif entity_ids:
+        stmt += lambda q: q.filter(States.metadata_id.in_(metadata_ids))
+    elif legacy:
+        stmt += _legacy_ignore_domains_filter
+        if filters and filters.has_config:
+            legacy_entity_filter = filters.states_entity_filter(legacy=True)
+            stmt = stmt.add_criteria(
+                lambda q: q.filter(legacy_entity_filter), track_on=[filters]
+            )
     else:
         stmt += _ignore_domains_filter
         if filters and filters.has_config:
@@ -240,15 +475,31 @@ def _significant_states_stmt(
                 lambda q: q.filter(entity_filter), track_on=[filters]
             )
 
-    stmt += lambda q: q.filter(States.last_updated > start_time)
-    if end_time:
-        stmt += lambda q: q.filter(States.last_updated < end_time)
+    if pre_schema_31:
+        stmt += lambda q: q.filter(States.last_updated > start_time)
+        if end_time:
+            stmt += lambda q: q.filter(States.last_updated < end_time)
+    else:
+        start_time_ts = start_time.timestamp()
+        stmt += lambda q: q.filter(States.last_updated_ts > start_time_ts)
+        if end_time:
+            end_time_ts = end_time.timestamp()
+            stmt += lambda q: q.filter(States.last_updated_ts < end_time_ts)
 
     if join_attributes:
         stmt += lambda q: q.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
-    stmt += lambda q: q.order_by(States.entity_id, States.last_updated)
+    if legacy:
+        stmt += lambda q: q.order_by(States.entity_id, States.last_updated)
+    elif pre_schema_31 and entity_ids:
+        stmt += lambda q: q.order_by(States.metadata_id, States.last_updated)
+    elif pre_schema_31:
+        stmt += lambda q: q.order_by(StatesMeta.entity_id, States.last_updated)
+    elif entity_ids:
+        stmt += lambda q: q.order_by(States.metadata_id, States.last_updated_ts)
+    else:
+        stmt += lambda q: q.order_by(StatesMeta.entity_id, States.last_updated_ts)
     return stmt
 
 
@@ -282,6 +533,7 @@ def get_significant_states_with_session(
         start_time,
         end_time,
         entity_ids,
+        _metadata_ids(hass, session, entity_ids),
         filters,
         significant_changes_only,
         no_attributes,
@@ -337,6 +589,7 @@ def _state_changed_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
     entity_id: str | None,
+    metadata_id: int | None,
     no_attributes: bool,
     descending: bool,
     limit: int | None,
@@ -344,22 +597,52 @@ def _state_changed_during_period_stmt(
     stmt, join_attributes = lambda_stmt_and_join_attributes(
         schema_version, no_attributes, include_last_changed=False
     )
-    stmt += lambda q: q.filter(
-        ((States.last_changed == States.last_updated) | States.last_changed.is_(None))
-        & (States.last_updated > start_time)
-    )
-    if end_time:
-        stmt += lambda q: q.filter(States.last_updated < end_time)
-    if entity_id:
+    legacy = schema_version < STATES_META_SCHEMA_VERSION
+    pre_schema_31 = schema_version < TIMESTAMP_SCHEMA_VERSION
+    if pre_schema_31:
+        stmt += lambda q: q.filter(
+            (
+                (States.last_changed == States.last_updated)
+                | States.last_changed.is_(None)
+            )
+            & (States.last_updated > start_time)
+        )
+        if end_time:
+            stmt += lambda q: q.filter(States.last_updated < end_time)
+    else:
+        start_time_ts = start_time.timestamp()
+        stmt += lambda q: q.filter(
+            (
+                (States.last_changed_ts == States.last_updated_ts)
+                | States.last_changed_ts.is_(None)
+            )
+            & (States.last_updated_ts > start_time_ts)
+        )
+        if end_time:
+            end_time_ts = end_time.timestamp()
+            stmt += lambda q: q.filter(States.last_updated_ts < end_time_ts)
+    if entity_id and legacy:
         stmt += lambda q: q.filter(States.entity_id == entity_id)
+    elif entity_id:
+        stmt += lambda q: q.filter(States.metadata_id == metadata_id)
     if join_attributes:
         stmt += lambda q: q.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
-    if descending:
-        stmt += lambda q: q.order_by(States.entity_id, States.last_updated.desc())
+    if legacy:
+        if descending:
+            stmt += lambda q: q.order_by(States.entity_id, States.last_updated.desc())
+        else:
+            stmt += lambda q: q.order_by(States.entity_id, States.last_updated)
+    elif pre_schema_31:
+        if descending:
+            stmt += lambda q: q.order_by(States.metadata_id, States.last_updated.desc())
+        else:
+            stmt += lambda q: q.order_by(States.metadata_id, States.last_updated)
+    elif descending:
+        stmt += lambda q: q.order_by(States.metadata_id, States.last_updated_ts.desc())
     else:
-        stmt += lambda q: q.order_by(States.entity_id, States.last_updated)
+        stmt += lambda q: q.order_by(States.metadata_id, States.last_updated_ts)
     if limit:
         stmt += lambda q: q.limit(limit)
     return stmt
@@ -380,11 +663,18 @@ def state_changes_during_period(
     entity_ids = [entity_id] if entity_id is not None else None
 
     with session_scope(hass=hass) as session:
+        schema_version = _schema_version(hass)
+        metadata_id: int | None = None
+        if entity_id and schema_version >= STATES_META_SCHEMA_VERSION:
+            if not (metadata_ids := _metadata_ids(hass, session, entity_ids)):
+                return {}
+            metadata_id = metadata_ids[0]
         stmt = _state_changed_during_period_stmt(
-            _schema_version(hass),
+            schema_version,
             start_time,
             end_time,
             entity_id,
+            metadata_id,
             no_attributes,
             descending,
             limit,
@@ -405,24 +695,197 @@ def state_changes_during_period(
         )
 
 
+class NumericHistory(NamedTuple):
+    """Timestamps and values of the numeric states of an entity."""
+
+    timestamps: array[float]
+    values: array[float]
+
+
+def _numeric_states_stmt(
+    schema_version: int,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    metadata_ids: list[int],
+) -> StatementLambdaElement:
+    """Query the state changes of the entities without attributes.
+
+    The rows are keyed by metadata_id, or by entity_id before schema 30.
+    """
+    if schema_version < STATES_META_SCHEMA_VERSION:
+        stmt = lambda_stmt(
+            lambda: select(
+                States.entity_id.label("key"), States.state, States.last_updated
+            ).filter(States.entity_id.in_(entity_ids))
+        )
+        stmt += lambda q: q.filter(
+            (
+                (States.last_changed == States.last_updated)
+                | States.last_changed.is_(None)
+            )
+            & (States.last_updated > start_time)
+        )
+        if end_time:
+            stmt += lambda q: q.filter(States.last_updated < end_time)
+        stmt += lambda q: q.order_by("key", States.last_updated)
+        return stmt
+
+    if schema_version < TIMESTAMP_SCHEMA_VERSION:
+        stmt = lambda_stmt(
+            lambda: select(
+                States.metadata_id.label("key"), States.state, States.last_updated
+            ).filter(States.metadata_id.in_(metadata_ids))
+        )
+        stmt += lambda q: q.filter(
+            (
+                (States.last_changed == States.last_updated)
+                | States.last_changed.is_(None)
+            )
+            & (States.last_updated > start_time)
+        )
+        if end_time:
+            stmt += lambda q: q.filter(States.last_updated < end_time)
+        stmt += lambda q: q.order_by("key", States.last_updated)
+        return stmt
+
+    start_time_ts = start_time.timestamp()
+    stmt = lambda_stmt(
+        lambda: select(
+            States.metadata_id.label("key"), States.state, States.last_updated_ts
+        ).filter(States.metadata_id.in_(metadata_ids))
+    )
+    stmt += lambda q: q.filter(
+        (
+            (States.last_changed_ts == States.last_updated_ts)
+            | States.last_changed_ts.is_(None)
+        )
+        & (States.last_updated_ts > start_time_ts)
+    )
+    if end_time:
+        end_time_ts = end_time.timestamp()
+        stmt += lambda q: q.filter(States.last_updated_ts < end_time_ts)
+    stmt += lambda q: q.order_by("key", States.last_updated_ts)
+    return stmt
+
+
+def _append_numeric(series: NumericHistory, timestamp: float, state: str) -> None:
+    """Append a state to the series if it is a finite number."""
+    try:
+        value = float(state)
+    except (TypeError, ValueError):
+        return
+    if math.isfinite(value):
+        series.timestamps.append(timestamp)
+        series.values.append(value)
+
+
+def get_numeric_history(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    start_time: datetime,
+    end_time: datetime | None = None,
+    include_start_time_state: bool = True,
+) -> dict[str, NumericHistory]:
+    """Return the numeric state changes of entities during a UTC period.
+
+    The timestamps are epoch floats and the values are the states parsed
+    as floats, states that are not numbers are left out. The rows are
+    appended to the arrays as they are read so no State or dict is
+    created per row.
+    """
+    entity_ids = [entity_id.lower() for entity_id in entity_ids]
+    result = {
+        entity_id: NumericHistory(array("d"), array("d")) for entity_id in entity_ids
+    }
+    with session_scope(hass=hass) as session:
+        if include_start_time_state:
+            start_timestamp = process_datetime_to_timestamp(start_time)
+            for row in _get_rows_with_session(
+                hass, session, start_time, entity_ids, no_attributes=True
+            ):
+                _append_numeric(result[row.entity_id], start_timestamp, row.state)
+
+        schema_version = _schema_version(hass)
+        series_by_key: dict[str | int, NumericHistory]
+        if schema_version < STATES_META_SCHEMA_VERSION:
+            series_by_key = dict(result)
+            metadata_ids = []
+        else:
+            series_by_key = {
+                metadata_id: result[entity_id]
+                for entity_id, metadata_id in recorder.get_instance(hass)
+                .get_states_metadata_ids(session, entity_ids)
+                .items()
+            }
+            metadata_ids = list(series_by_key)
+
+        rows = execute_stmt_lambda_element(
+            session,
+            _numeric_states_stmt(
+                schema_version, start_time, end_time, entity_ids, metadata_ids
+            ),
+            start_time,
+            end_time,
+        )
+        for key, group in groupby(rows, lambda row: row.key):
+            series = series_by_key[key]
+            if schema_version < TIMESTAMP_SCHEMA_VERSION:
+                for row in group:
+                    _append_numeric(
+                        series,
+                        process_datetime_to_timestamp(row.last_updated),
+                        row.state,
+                    )
+                continue
+            for row in group:
+                _append_numeric(series, row.last_updated_ts, row.state)
+
+    return {
+        entity_id: series for entity_id, series in result.items() if series.timestamps
+    }
+
+
 def _get_last_state_changes_stmt(
-    schema_version: int, number_of_states: int, entity_id: str | None
+    schema_version: int,
+    number_of_states: int,
+    entity_id: str | None,
+    metadata_id: int | None,
 ) -> StatementLambdaElement:
     stmt, join_attributes = lambda_stmt_and_join_attributes(
         schema_version, False, include_last_changed=False
     )
-    stmt += lambda q: q.filter(
-        (States.last_changed == States.last_updated) | States.last_changed.is_(None)
-    )
-    if entity_id:
+    legacy = schema_version < STATES_META_SCHEMA_VERSION
+    pre_schema_31 = schema_version < TIMESTAMP_SCHEMA_VERSION
+    if pre_schema_31:
+        stmt += lambda q: q.filter(
+            (States.last_changed == States.last_updated) | States.last_changed.is_(None)
+        )
+    else:
+        stmt += lambda q: q.filter(
+            (States.last_changed_ts == States.last_updated_ts)
+            | States.last_changed_ts.is_(None)
+        )
+    if entity_id and legacy:
         stmt += lambda q: q.filter(States.entity_id == entity_id)
+    elif entity_id:
+        stmt += lambda q: q.filter(States.metadata_id == metadata_id)
     if join_attributes:
         stmt += lambda q: q.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
-    stmt += lambda q: q.order_by(States.entity_id, States.last_updated.desc()).limit(
-        number_of_states
-    )
+    if legacy:
+        stmt += lambda q: q.order_by(
+            States.entity_id, States.last_updated.desc()
+        ).limit(number_of_states)
+    elif pre_schema_31:
+        stmt += lambda q: q.order_by(
+            States.metadata_id, States.last_updated.desc()
+        ).limit(number_of_states)
+    else:
+        stmt += lambda q: q.order_by(
+            States.metadata_id, States.last_updated_ts.desc()
+        ).limit(number_of_states)
     return stmt
 
 
@@ -435,8 +898,14 @@ def get_last_state_changes(
     entity_ids = [entity_id] if entity_id is not None else None
 
     with session_scope(hass=hass) as session:
+        schema_version = _schema_version(hass)
+        metadata_id: int | None = None
+        if entity_id and schema_version >= STATES_META_SCHEMA_VERSION:
+            if not (metadata_ids := _metadata_ids(hass, session, entity_ids)):
+                return {}
+            metadata_id = metadata_ids[0]
         stmt = _get_last_state_changes_stmt(
-            _schema_version(hass), number_of_states, entity_id
+            schema_version, number_of_states, entity_id, metadata_id
         )
         states = list(execute_stmt_lambda_element(session, stmt))
         return cast(
@@ -457,6 +926,7 @@ def _get_states_for_entites_stmt(
     run_start: datetime,
     utc_point_in_time: datetime,
     entity_ids: list[str],
+    metadata_ids: list[int],
     no_attributes: bool,
 ) -> StatementLambdaElement:
     """Baked query to get states for specific entities."""
@@ -465,19 +935,50 @@ def _get_states_for_entites_stmt(
     )
     # We got an include-list of entities, accelerate the query by filtering already
     # in the inner query.
-    stmt += lambda q: q.where(
-        States.state_id
-        == (
-            select(func.max(States.state_id).label("max_state_id"))
-            .filter(
-                (States.last_updated >= run_start)
-                & (States.last_updated < utc_point_in_time)
-            )
-            .filter(States.entity_id.in_(entity_ids))
-            .group_by(States.entity_id)
-            .subquery()
-        ).c.max_state_id
-    )
+    if schema_version < STATES_META_SCHEMA_VERSION:
+        stmt += lambda q: q.where(
+            States.state_id
+            == (
+                select(func.max(States.state_id).label("max_state_id"))
+                .filter(
+                    (States.last_updated >= run_start)
+                    & (States.last_updated < utc_point_in_time)
+                )
+                .filter(States.entity_id.in_(entity_ids))
+                .group_by(States.entity_id)
+                .subquery()
+            ).c.max_state_id
+        )
+    elif schema_version < TIMESTAMP_SCHEMA_VERSION:
+        stmt += lambda q: q.where(
+            States.state_id
+            == (
+                select(func.max(States.state_id).label("max_state_id"))
+                .filter(
+                    (States.last_updated >= run_start)
+                    & (States.last_updated < utc_point_in_time)
+                )
+                .filter(States.metadata_id.in_(metadata_ids))
+                .group_by(States.metadata_id)
+                .subquery()
+            ).c.max_state_id
+        )
+    else:
+        run_start_ts = process_datetime_to_timestamp(run_start)
+        utc_point_in_time_ts = utc_point_in_time.timestamp()
+        stmt += lambda q: q.where(
+            States.state_id
+            == (
+                select(func.max(States.state_id).label("max_state_id"))
+                .filter(
+                    (States.last_updated_ts >= run_start_ts)
+                    & (States.last_updated_ts < utc_point_in_time_ts)
+                )
+                .filter(States.metadata_id.in_(metadata_ids))
+                .group_by(States.metadata_id)
+                .subquery()
+            ).c.max_state_id
+        )
     if join_attributes:
         stmt += lambda q: q.outerjoin(
             StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
@@ -486,10 +987,48 @@ def _get_states_for_entites_stmt(
 
 
 def _generate_most_recent_states_by_date(
+    run_start_ts: float,
+    utc_point_in_time_ts: float,
+) -> Subquery:
+    """Generate the sub query for the most recent states by data."""
+    return (
+        select(
+            States.metadata_id.label("max_metadata_id"),
+            func.max(States.last_updated_ts).label("max_last_updated"),
+        )
+        .filter(
+            (States.last_updated_ts >= run_start_ts)
+            & (States.last_updated_ts < utc_point_in_time_ts)
+        )
+        .group_by(States.metadata_id)
+        .subquery()
+    )
+
+
+def _pre_schema_31_generate_most_recent_states_by_date(
     run_start: datetime,
     utc_point_in_time: datetime,
 ) -> Subquery:
-    """Generate the sub query for the most recent states by data."""
+    """Generate the sub query for the most recent states by data before schema 31."""
+    return (
+        select(
+            States.metadata_id.label("max_metadata_id"),
+            func.max(States.last_updated).label("max_last_updated"),
+        )
+        .filter(
+            (States.last_updated >= run_start)
+            & (States.last_updated < utc_point_in_time)
+        )
+        .group_by(States.metadata_id)
+        .subquery()
+    )
+
+
+def _legacy_generate_most_recent_states_by_date(
+    run_start: datetime,
+    utc_point_in_time: datetime,
+) -> Subquery:
+    """Generate the sub query for the most recent states by data before schema 30."""
     return (
         select(
             States.entity_id.label("max_entity_id"),
@@ -519,29 +1058,93 @@ def _get_states_for_all_stmt(
     # query, then filter out unwanted domains as well as applying the custom filter.
     # This filtering can't be done in the inner query because the domain column is
     # not indexed and we can't control what's in the custom filter.
-    most_recent_states_by_date = _generate_most_recent_states_by_date(
-        run_start, utc_point_in_time
-    )
-    stmt += lambda q: q.where(
-        States.state_id
-        == (
-            select(func.max(States.state_id).label("max_state_id"))
-            .join(
-                most_recent_states_by_date,
-                and_(
-                    States.entity_id == most_recent_states_by_date.c.max_entity_id,
-                    States.last_updated
-                    == most_recent_states_by_date.c.max_last_updated,
-                ),
+    if schema_version < STATES_META_SCHEMA_VERSION:
+        legacy_most_recent_states_by_date = _legacy_generate_most_recent_states_by_date(
+            run_start, utc_point_in_time
+        )
+        stmt += lambda q: q.where(
+            States.state_id
+            == (
+                select(func.max(States.state_id).label("max_state_id"))
+                .join(
+                    legacy_most_recent_states_by_date,
+                    and_(
+                        States.entity_id
+                        == legacy_most_recent_states_by_date.c.max_entity_id,
+                        States.last_updated
+                        == legacy_most_recent_states_by_date.c.max_last_updated,
+                    ),
+                )
+                .group_by(States.entity_id)
+                .subquery()
+            ).c.max_state_id,
+        )
+        stmt += _legacy_ignore_domains_filter
+        if filters and filters.has_config:
+            legacy_entity_filter = filters.states_entity_filter(legacy=True)
+            stmt = stmt.add_criteria(
+                lambda q: q.filter(legacy_entity_filter), track_on=[filters]
             )
-            .group_by(States.entity_id)
-            .subquery()
-        ).c.max_state_id,
-    )
-    stmt += _ignore_domains_filter
-    if filters and filters.has_config:
-        entity_filter = filters.states_entity_filter()
-        stmt = stmt.add_criteria(lambda q: q.filter(entity_filter), track_on=[filters])
+    elif schema_version < TIMESTAMP_SCHEMA_VERSION:
+        pre_schema_31_most_recent_states_by_date = (
+            _pre_schema_31_generate_most_recent_states_by_date(
+                run_start, utc_point_in_time
+            )
+        )
+        stmt += lambda q: q.where(
+            States.state_id
+            == (
+                select(func.max(States.state_id).label("max_state_id"))
+                .join(
+                    pre_schema_31_most_recent_states_by_date,
+                    and_(
+                        States.metadata_id
+                        == pre_schema_31_most_recent_states_by_date.c.max_metadata_id,
+                        States.last_updated
+                        == pre_schema_31_most_recent_states_by_date.c.max_last_updated,
+                    ),
+                )
+                .group_by(States.metadata_id)
+                .subquery()
+            ).c.max_state_id,
+        )
+        stmt += _ignore_domains_filter
+        if filters and filters.has_config:
+            pre_schema_31_entity_filter = filters.states_entity_filter()
+            stmt = stmt.add_criteria(
+                lambda q: q.filter(pre_schema_31_entity_filter), track_on=[filters]
+            )
+        stmt += lambda q: q.order_by(StatesMeta.entity_id)
+    else:
+        most_recent_states_by_date = _generate_most_recent_states_by_date(
+            process_datetime_to_timestamp(run_start), utc_point_in_time.timestamp()
+        )
+        stmt += lambda q: q.where(
+            States.state_id
+            == (
+                select(func.max(States.state_id).label("max_state_id"))
+                .join(
+                    most_recent_states_by_date,
+                    and_(
+                        States.metadata_id
+                        == most_recent_states_by_date.c.max_metadata_id,
+                        States.last_updated_ts
+                        == most_recent_states_by_date.c.max_last_updated,
+                    ),
+                )
+                .group_by(States.metadata_id)
+                .subquery()
+            ).c.max_state_id,
+        )
+        stmt += _ignore_domains_filter
+        if filters and filters.has_config:
+            entity_filter = filters.states_entity_filter()
+            stmt = stmt.add_criteria(
+                lambda q: q.filter(entity_filter), track_on=[filters]
+            )
+        # Grouping by metadata_id no longer returns the rows sorted by
+        # entity_id so sort them explicitly, there is only one per entity
+        stmt += lambda q: q.order_by(StatesMeta.entity_id)
     if join_attributes:
         stmt += lambda q: q.outerjoin(
             StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
@@ -560,11 +1163,20 @@ def _get_rows_with_session(
 ) -> Iterable[Row]:
     """Return the states at a specific point in time."""
     schema_version = _schema_version(hass)
+    metadata_ids: list[int] = []
+    if entity_ids and schema_version >= STATES_META_SCHEMA_VERSION:
+        if not (metadata_ids := _metadata_ids(hass, session, entity_ids)):
+            return []
+
     if entity_ids and len(entity_ids) == 1:
         return execute_stmt_lambda_element(
             session,
             _get_single_entity_states_stmt(
-                schema_version, utc_point_in_time, entity_ids[0], no_attributes
+                schema_version,
+                utc_point_in_time,
+                entity_ids[0],
+                metadata_ids[0] if metadata_ids else None,
+                no_attributes,
             ),
         )
 
@@ -579,7 +1191,12 @@ def _get_rows_with_session(
     # since the last recorder run started.
     if entity_ids:
         stmt = _get_states_for_entites_stmt(
-            schema_version, run.start, utc_point_in_time, entity_ids, no_attributes
+            schema_version,
+            run.start,
+            utc_point_in_time,
+            entity_ids,
+            metadata_ids,
+            no_attributes,
         )
     else:
         stmt = _get_states_for_all_stmt(
@@ -593,6 +1210,7 @@ def _get_single_entity_states_stmt(
     schema_version: int,
     utc_point_in_time: datetime,
     entity_id: str,
+    metadata_id: int | None,
     no_attributes: bool = False,
 ) -> StatementLambdaElement:
     # Use an entirely different (and extremely fast) query if we only
@@ -600,14 +1218,34 @@ def _get_single_entity_states_stmt(
     stmt, join_attributes = lambda_stmt_and_join_attributes(
         schema_version, no_attributes, include_last_changed=True
     )
-    stmt += (
-        lambda q: q.filter(
-            States.last_updated < utc_point_in_time,
-            States.entity_id == entity_id,
+    if schema_version < STATES_META_SCHEMA_VERSION:
+        stmt += (
+            lambda q: q.filter(
+                States.last_updated < utc_point_in_time,
+                States.entity_id == entity_id,
+            )
+            .order_by(States.last_updated.desc())
+            .limit(1)
+        )
+    elif schema_version < TIMESTAMP_SCHEMA_VERSION:
+        stmt += (
+            lambda q: q.filter(
+                States.last_updated < utc_point_in_time,
+                States.metadata_id == metadata_id,
+            )
+            .order_by(States.last_updated.desc())
+            .limit(1)
+        )
+    else:
+        utc_point_in_time_ts = utc_point_in_time.timestamp()
+        stmt += (
+            lambda q: q.filter(
+                States.last_updated_ts < utc_point_in_time_ts,
+                States.metadata_id == metadata_id,
+            )
+            .order_by(States.last_updated_ts.desc())
+            .limit(1)
         )
-        .order_by(States.last_updated.desc())
-        .limit(1)
-    )
     if join_attributes:
         stmt += lambda q: q.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
@@ -615,6 +1253,26 @@ def _get_single_entity_states_stmt(
     return stmt
 
 
+def _row_last_updated_timestamp(row: Row) -> float:
+    """Return the last_updated of a row as a timestamp."""
+    return cast(float, row.last_updated_ts)
+
+
+def _row_last_updated_isoformat(row: Row) -> str:
+    """Return the last_updated of a row in isoformat."""
+    return dt_util.utc_from_timestamp(row.last_updated_ts).isoformat()
+
+
+def _legacy_row_last_updated_timestamp(row: Row) -> float:
+    """Return the last_updated of a row from before schema 31 as a timestamp."""
+    return process_datetime_to_timestamp(row.last_updated)
+
+
+def _legacy_row_last_updated_isoformat(row: Row) -> str:
+    """Return the last_updated of a row from before schema 31 in isoformat."""
+    return process_timestamp_to_utc_isoformat(row.last_updated)
+
+
 def _sorted_states_to_dict(
     hass: HomeAssistant,
     session: Session,
@@ -638,16 +1296,24 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
-    if compressed_state_format:
+    _row_time: Callable[[Row], float | str]
+    if _schema_version(hass) < TIMESTAMP_SCHEMA_VERSION:
+        if compressed_state_format:
+            state_class = row_to_compressed_state_pre_schema_31
+            _row_time = _legacy_row_last_updated_timestamp
+        else:
+            state_class = LazyStatePreSchema31  # type: ignore[assignment]
+            _row_time = _legacy_row_last_updated_isoformat
+    elif compressed_state_format:
         state_class = row_to_compressed_state
-        _process_timestamp: Callable[
-            [datetime], float | str
-        ] = process_datetime_to_timestamp
+        _row_time = _row_last_updated_timestamp
+    else:
+        state_class = LazyState  # type: ignore[assignment]
+        _row_time = _row_last_updated_isoformat
+    if compressed_state_format:
         attr_time = COMPRESSED_STATE_LAST_UPDATED
         attr_state = COMPRESSED_STATE_STATE
     else:
-        state_class = LazyState  # type: ignore[assignment]
-        _process_timestamp = process_timestamp_to_utc_isoformat
         attr_time = LAST_CHANGED_KEY
         attr_state = STATE_KEY
 
@@ -721,7 +1387,7 @@ def _sorted_states_to_dict(
                     #
                     # We use last_updated for for last_changed since its the same
                     #
-                    attr_time: _process_timestamp(row.last_updated),
+                    attr_time: _row_time(row),
                 }
             )
             prev_state = state
@@ -6,7 +6,17 @@ import logging
 from typing import cast
 
 import sqlalchemy
-from sqlalchemy import ForeignKeyConstraint, MetaData, Table, func, text
+from sqlalchemy import (
+    Column,
+    ForeignKeyConstraint,
+    MetaData,
+    Table,
+    distinct,
+    func,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import (
     DatabaseError,
@@ -17,16 +27,24 @@ from sqlalchemy.exc import (
 )
 from sqlalchemy.orm.session import Session
 from sqlalchemy.schema import AddConstraint, DropConstraint
-from sqlalchemy.sql.expression import true
+from sqlalchemy.sql.expression import TextClause, true
 
 from homeassistant.core import HomeAssistant
 
-from .const import SupportedDialect
+from .const import DATA_INSTANCE, MAX_ROWS_TO_PURGE, SupportedDialect
 from .db_schema import (
+    ENTITY_ID_LAST_UPDATED_INDEX,
+    LAST_UPDATED_INDEX,
+    LAST_UPDATED_INDEX_TS,
+    METADATA_ID_LAST_UPDATED_INDEX,
+    METADATA_ID_LAST_UPDATED_INDEX_TS,
     SCHEMA_VERSION,
     TABLE_STATES,
     Base,
+    Events,
     SchemaChanges,
+    States,
+    StatesMeta,
     Statistics,
     StatisticsMeta,
     StatisticsRuns,
@@ -42,6 +60,8 @@ from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+TIMESTAMP_MIGRATION_BATCH_SIZE = 250000
+
 
 def raise_if_exception_missing_str(ex: Exception, match_substrs: Iterable[str]) -> None:
     """Raise an exception if the exception and cause do not contain the match substrs."""
@@ -92,9 +112,17 @@ def migrate_schema(
         _apply_update(hass, engine, session_maker, new_version, current_version)
         with session_scope(session=session_maker()) as session:
             session.add(SchemaChanges(schema_version=new_version))
+        # The queries that run while the database is migrated use what
+        # the last fully migrated version has
+        hass.data[DATA_INSTANCE].schema_version = new_version
 
         _LOGGER.info("Upgrade to version %s done", new_version)
 
+    if current_version < 31:
+        # The datetime columns are only cleared once the queries use the
+        # timestamp columns
+        _clear_legacy_time_columns(session_maker)
+
 
 def _create_index(
     session_maker: Callable[[], Session], table_name: str, index_name: str
@@ -734,10 +762,201 @@ def _apply_update(  # noqa: C901
             _create_index(
                 session_maker, "statistics_meta", "ix_statistics_meta_statistic_id"
             )
+    elif new_version == 30:
+        # The states_meta table was created by create_all
+        _add_columns(session_maker, "states", [f"metadata_id {big_int}"])
+        _create_index(session_maker, "states", METADATA_ID_LAST_UPDATED_INDEX)
+        _migrate_entity_ids_to_states_meta(session_maker)
+        _drop_index(session_maker, "states", ENTITY_ID_LAST_UPDATED_INDEX)
+    elif new_version == 31:
+        # Filling the columns is faster before they are indexed
+        timestamp_type = (
+            "FLOAT" if dialect == SupportedDialect.SQLITE else "DOUBLE PRECISION"
+        )
+        _add_columns(session_maker, "events", [f"time_fired_ts {timestamp_type}"])
+        _add_columns(
+            session_maker,
+            "states",
+            [f"last_updated_ts {timestamp_type}", f"last_changed_ts {timestamp_type}"],
+        )
+        _migrate_columns_to_timestamp(session_maker, engine)
+        _create_index(session_maker, "events", "ix_events_time_fired_ts")
+        _create_index(session_maker, "events", "ix_events_event_type_time_fired_ts")
+        _create_index(session_maker, "states", LAST_UPDATED_INDEX_TS)
+        _create_index(session_maker, "states", METADATA_ID_LAST_UPDATED_INDEX_TS)
+        _drop_index(session_maker, "events", "ix_events_time_fired")
+        _drop_index(session_maker, "events", "ix_events_event_type_time_fired")
+        _drop_index(session_maker, "states", LAST_UPDATED_INDEX)
+        _drop_index(session_maker, "states", METADATA_ID_LAST_UPDATED_INDEX)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
 
+def _migrate_entity_ids_to_states_meta(session_maker: Callable[[], Session]) -> None:
+    """Move the entity_ids of the states table to the states_meta table.
+
+    The states of each entity are moved in batches, each in its own
+    transaction, so the migration can be resumed if it is interrupted.
+    """
+    with session_scope(session=session_maker()) as session:
+        entity_ids: list[str] = [
+            entity_id
+            for (entity_id,) in session.execute(
+                select(distinct(States.entity_id)).filter(States.entity_id.isnot(None))
+            )
+        ]
+    _LOGGER.warning(
+        "Moving the entity_ids of %s entities to the states_meta table. Note: this "
+        "can take several minutes on large databases and slow computers. Please "
+        "be patient!",
+        len(entity_ids),
+    )
+    for entity_id in entity_ids:
+        with session_scope(session=session_maker()) as session:
+            if (
+                metadata_id := session.execute(
+                    select(StatesMeta.metadata_id).filter(
+                        StatesMeta.entity_id == entity_id
+                    )
+                ).scalar()
+            ) is None:
+                states_meta = StatesMeta(entity_id=entity_id)
+                session.add(states_meta)
+                session.flush()
+                metadata_id = states_meta.metadata_id
+        # Keep going until there are no states left for the entity, the
+        # batches are bounded like the purge to stay within the bind limits
+        while True:
+            with session_scope(session=session_maker()) as session:
+                if not (
+                    state_ids := session.execute(
+                        select(States.state_id)
+                        .filter(States.entity_id == entity_id)
+                        .limit(MAX_ROWS_TO_PURGE)
+                    )
+                    .scalars()
+                    .all()
+                ):
+                    break
+                session.execute(
+                    update(States)
+                    .filter(States.state_id.in_(state_ids))
+                    .values(metadata_id=metadata_id, entity_id=None)
+                    .execution_options(synchronize_session=False)
+                )
+
+
+def _migrate_columns_to_timestamp(
+    session_maker: Callable[[], Session], engine: Engine
+) -> None:
+    """Copy the datetime columns of the events and states tables to timestamps.
+
+    The datetime columns are kept so the queries of the previous schema keep
+    working until the migration is done, they are cleared afterwards by
+    _clear_legacy_time_columns.
+    """
+    _LOGGER.warning(
+        "Converting the times of the events and states tables to timestamps. "
+        "Note: this can take several minutes on large databases and slow "
+        "computers. Please be patient!"
+    )
+    dialect = engine.dialect.name
+    if dialect == SupportedDialect.SQLITE:
+        # SQLite stores the datetimes as text in UTC
+        events_stmt = text(
+            "UPDATE events SET time_fired_ts="
+            "CASE WHEN time_fired IS NULL THEN 0 ELSE "
+            "STRFTIME('%s',time_fired) + "
+            "CAST(SUBSTR(time_fired,-7) AS FLOAT) END "
+            "WHERE event_id >= :start AND event_id < :end"
+        )
+        states_stmt = text(
+            "UPDATE states SET last_updated_ts="
+            "CASE WHEN last_updated IS NULL THEN 0 ELSE "
+            "STRFTIME('%s',last_updated) + "
+            "CAST(SUBSTR(last_updated,-7) AS FLOAT) END, "
+            "last_changed_ts="
+            "STRFTIME('%s',last_changed) + "
+            "CAST(SUBSTR(last_changed,-7) AS FLOAT) "
+            "WHERE state_id >= :start AND state_id < :end"
+        )
+    elif dialect == SupportedDialect.MYSQL:
+        # The datetimes are stored without a time zone in UTC, TIMESTAMPDIFF
+        # does not depend on the time zone of the session like UNIX_TIMESTAMP
+        events_stmt = text(
+            "UPDATE events SET time_fired_ts="
+            "IF(time_fired IS NULL,0,"
+            "TIMESTAMPDIFF(MICROSECOND,'1970-01-01 00:00:00',time_fired)/1000000) "
+            "WHERE event_id >= :start AND event_id < :end"
+        )
+        states_stmt = text(
+            "UPDATE states SET last_updated_ts="
+            "IF(last_updated IS NULL,0,"
+            "TIMESTAMPDIFF(MICROSECOND,'1970-01-01 00:00:00',last_updated)/1000000), "
+            "last_changed_ts="
+            "TIMESTAMPDIFF(MICROSECOND,'1970-01-01 00:00:00',last_changed)/1000000 "
+            "WHERE state_id >= :start AND state_id < :end"
+        )
+    else:
+        events_stmt = text(
+            "UPDATE events SET time_fired_ts="
+            "CASE WHEN time_fired IS NULL THEN 0 ELSE "
+            "EXTRACT(EPOCH FROM time_fired) END "
+            "WHERE event_id >= :start AND event_id < :end"
+        )
+        states_stmt = text(
+            "UPDATE states SET last_updated_ts="
+            "CASE WHEN last_updated IS NULL THEN 0 ELSE "
+            "EXTRACT(EPOCH FROM last_updated) END, "
+            "last_changed_ts=EXTRACT(EPOCH FROM last_changed) "
+            "WHERE state_id >= :start AND state_id < :end"
+        )
+    _execute_in_id_ranges(session_maker, events_stmt, Events.event_id)
+    _execute_in_id_ranges(session_maker, states_stmt, States.state_id)
+
+
+def _clear_legacy_time_columns(session_maker: Callable[[], Session]) -> None:
+    """Clear the datetime columns which were converted to timestamps."""
+    _execute_in_id_ranges(
+        session_maker,
+        text(
+            "UPDATE events SET time_fired=NULL "
+            "WHERE event_id >= :start AND event_id < :end"
+        ),
+        Events.event_id,
+    )
+    _execute_in_id_ranges(
+        session_maker,
+        text(
+            "UPDATE states SET last_updated=NULL, last_changed=NULL "
+            "WHERE state_id >= :start AND state_id < :end"
+        ),
+        States.state_id,
+    )
+
+
+def _execute_in_id_ranges(
+    session_maker: Callable[[], Session], stmt: TextClause, id_column: Column
+) -> None:
+    """Execute a statement over the rows of a table in ranges of the primary key.
+
+    Each range is a transaction of its own to keep the transactions small, the
+    range is found through the primary key so no batch has to scan the rows
+    handled by the previous batches.
+    """
+    with session_scope(session=session_maker()) as session:
+        min_id, max_id = session.execute(
+            select(func.min(id_column), func.max(id_column))
+        ).one()
+    if min_id is None:
+        return
+    for start in range(min_id, max_id + 1, TIMESTAMP_MIGRATION_BATCH_SIZE):
+        with session_scope(session=session_maker()) as session:
+            session.connection().execute(
+                stmt, {"start": start, "end": start + TIMESTAMP_MIGRATION_BATCH_SIZE}
+            )
+
+
 def _inspect_schema_version(session: Session) -> int:
     """Determine the schema version by inspecting the db structure.
 
@@ -751,7 +970,7 @@ def _inspect_schema_version(session: Session) -> int:
     indexes = inspector.get_indexes("events")
 
     for index in indexes:
-        if index["column_names"] == ["time_fired"]:
+        if index["column_names"] in (["time_fired"], ["time_fired_ts"]):
             # Schema addition from version 1 detected. New DB.
             session.add(StatisticsRuns(start=get_start_time()))
             session.add(SchemaChanges(schema_version=SCHEMA_VERSION))
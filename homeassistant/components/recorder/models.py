@@ -172,6 +172,85 @@ class LazyState(State):
         """Set context."""
         self._context = value
 
+    @property  # type: ignore[override]
+    def last_changed(self) -> datetime:  # type: ignore[override]
+        """Last changed datetime."""
+        if self._last_changed is None:
+            if (last_changed_ts := self._row.last_changed_ts) is not None:
+                self._last_changed = dt_util.utc_from_timestamp(last_changed_ts)
+            else:
+                self._last_changed = self.last_updated
+        return self._last_changed
+
+    @last_changed.setter
+    def last_changed(self, value: datetime) -> None:
+        """Set last changed datetime."""
+        self._last_changed = value
+
+    @property  # type: ignore[override]
+    def last_updated(self) -> datetime:  # type: ignore[override]
+        """Last updated datetime."""
+        if self._last_updated is None:
+            self._last_updated = dt_util.utc_from_timestamp(self._row.last_updated_ts)
+        return self._last_updated
+
+    @last_updated.setter
+    def last_updated(self, value: datetime) -> None:
+        """Set last updated datetime."""
+        self._last_updated = value
+
+    def as_dict(self) -> dict[str, Any]:  # type: ignore[override]
+        """Return a dict representation of the LazyState.
+
+        Async friendly.
+
+        To be used for JSON serialization.
+        """
+        if self._last_changed is None and self._last_updated is None:
+            last_updated_ts: float = self._row.last_updated_ts
+            last_updated_isoformat = dt_util.utc_from_timestamp(
+                last_updated_ts
+            ).isoformat()
+            if (
+                last_changed_ts := self._row.last_changed_ts
+            ) is None or last_changed_ts == last_updated_ts:
+                last_changed_isoformat = last_updated_isoformat
+            else:
+                last_changed_isoformat = dt_util.utc_from_timestamp(
+                    last_changed_ts
+                ).isoformat()
+        else:
+            last_updated_isoformat = self.last_updated.isoformat()
+            if self.last_changed == self.last_updated:
+                last_changed_isoformat = last_updated_isoformat
+            else:
+                last_changed_isoformat = self.last_changed.isoformat()
+        return {
+            "entity_id": self.entity_id,
+            "state": self.state,
+            "attributes": self._attributes or self.attributes,
+            "last_changed": last_changed_isoformat,
+            "last_updated": last_updated_isoformat,
+        }
+
+    def __eq__(self, other: Any) -> bool:
+        """Return the comparison."""
+        return (
+            other.__class__ in [self.__class__, State]
+            and self.entity_id == other.entity_id
+            and self.state == other.state
+            and self.attributes == other.attributes
+        )
+
+
+class LazyStatePreSchema31(LazyState):
+    """A lazy version of core State for rows from before schema 31.
+
+    Those rows store the times as datetime columns instead of timestamps.
+    """
+
+    __slots__: list[str] = []
+
     @property  # type: ignore[override]
     def last_changed(self) -> datetime:  # type: ignore[override]
         """Last changed datetime."""
@@ -233,15 +312,6 @@ class LazyState(State):
             "last_updated": last_updated_isoformat,
         }
 
-    def __eq__(self, other: Any) -> bool:
-        """Return the comparison."""
-        return (
-            other.__class__ in [self.__class__, State]
-            and self.entity_id == other.entity_id
-            and self.state == other.state
-            and self.attributes == other.attributes
-        )
-
 
 def decode_attributes_from_row(
     row: Row, attr_cache: dict[str, dict[str, Any]]
@@ -270,6 +340,28 @@ def row_to_compressed_state(
         COMPRESSED_STATE_STATE: row.state,
         COMPRESSED_STATE_ATTRIBUTES: decode_attributes_from_row(row, attr_cache),
     }
+    if start_time:
+        comp_state[COMPRESSED_STATE_LAST_UPDATED] = start_time.timestamp()
+    else:
+        row_last_updated_ts: float = row.last_updated_ts
+        comp_state[COMPRESSED_STATE_LAST_UPDATED] = row_last_updated_ts
+        if (
+            row_last_changed_ts := row.last_changed_ts
+        ) and row_last_updated_ts != row_last_changed_ts:
+            comp_state[COMPRESSED_STATE_LAST_CHANGED] = row_last_changed_ts
+    return comp_state
+
+
+def row_to_compressed_state_pre_schema_31(
+    row: Row,
+    attr_cache: dict[str, dict[str, Any]],
+    start_time: datetime | None = None,
+) -> dict[str, Any]:
+    """Convert a database row from before schema 31 to a compressed state."""
+    comp_state = {
+        COMPRESSED_STATE_STATE: row.state,
+        COMPRESSED_STATE_ATTRIBUTES: decode_attributes_from_row(row, attr_cache),
+    }
     if start_time:
         comp_state[COMPRESSED_STATE_LAST_UPDATED] = start_time.timestamp()
     else:
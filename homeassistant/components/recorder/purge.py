@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from datetime import datetime
 from functools import partial
 from itertools import islice, zip_longest
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
@@ -14,7 +16,7 @@ from sqlalchemy.sql.expression import distinct
 from homeassistant.const import EVENT_STATE_CHANGED
 
 from .const import MAX_ROWS_TO_PURGE, SupportedDialect
-from .db_schema import Events, StateAttributes, States
+from .db_schema import Events, StateAttributes, States, StatesMeta
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_sqlite,
@@ -48,6 +50,48 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# A purge task stops selecting new batches once it has run this long so
+# the events that queued up meanwhile are written before the next slice
+PURGE_SLICE_SECONDS = 1.0
+
+
+@dataclass
+class PurgeProgress:
+    """Progress of a purge that runs over several slices."""
+
+    purge_before: datetime
+    slices: int = 0
+    busy_seconds: float = 0
+    states: int = 0
+    events: int = 0
+    state_attributes: int = 0
+    event_data: int = 0
+
+    @property
+    def rows(self) -> int:
+        """Return the number of rows purged so far."""
+        return self.states + self.events + self.state_attributes + self.event_data
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the rows purged per second spent purging."""
+        if not self.busy_seconds:
+            return 0.0
+        return self.rows / self.busy_seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the progress."""
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "slices": self.slices,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "states": self.states,
+            "events": self.events,
+            "state_attributes": self.state_attributes,
+            "event_data": self.event_data,
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
 
 def take(take_num: int, iterable: Iterable) -> list[Any]:
     """Return first n items of the iterable as a list.
@@ -76,12 +120,52 @@ def purge_old_data(
 ) -> bool:
     """Purge events and states older than purge_before.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Runs a single slice of the purge and returns False if the
+    caller needs to run another one.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    progress = instance.purge_progress
+    if progress is None or progress.purge_before != purge_before:
+        progress = instance.purge_progress = PurgeProgress(purge_before)
+    slice_start = time.monotonic()
+    try:
+        finished = _purge_old_data_slice(
+            instance,
+            progress,
+            slice_start + PURGE_SLICE_SECONDS,
+            repack,
+            apply_filter,
+            events_batch_size,
+            states_batch_size,
+        )
+    finally:
+        progress.slices += 1
+        progress.busy_seconds += time.monotonic() - slice_start
+    if finished:
+        instance.purge_progress = None
+        _LOGGER.debug(
+            "Purged %s rows in %s slices at %.1f rows per second",
+            progress.rows,
+            progress.slices,
+            progress.rows_per_second,
+        )
+    return finished
+
+
+def _purge_old_data_slice(
+    instance: Recorder,
+    progress: PurgeProgress,
+    deadline: float,
+    repack: bool,
+    apply_filter: bool,
+    events_batch_size: int,
+    states_batch_size: int,
+) -> bool:
+    """Run a slice of the purge until the deadline passes."""
+    purge_before = progress.purge_before
     using_sqlite = instance.dialect_name == SupportedDialect.SQLITE
 
     with session_scope(session=instance.get_session()) as session:
@@ -92,7 +176,7 @@ def purge_old_data(
                 "Purge running in legacy format as there are states with event_id remaining"
             )
             has_more_to_purge |= _purge_legacy_format(
-                instance, session, purge_before, using_sqlite
+                instance, session, progress, using_sqlite
             )
         else:
             _LOGGER.debug(
@@ -100,10 +184,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before, using_sqlite
+                instance, session, progress, states_batch_size, deadline, using_sqlite
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before, using_sqlite
+                instance, session, progress, events_batch_size, deadline, using_sqlite
             )
 
         statistics_runs = _select_statistics_runs_to_purge(session, purge_before)
@@ -137,7 +221,7 @@ def _purging_legacy_format(session: Session) -> bool:
 
 
 def _purge_legacy_format(
-    instance: Recorder, session: Session, purge_before: datetime, using_sqlite: bool
+    instance: Recorder, session: Session, progress: PurgeProgress, using_sqlite: bool
 ) -> bool:
     """Purge rows that are still linked by the event_ids."""
     (
@@ -146,22 +230,29 @@ def _purge_legacy_format(
         attributes_ids,
         data_ids,
     ) = _select_legacy_event_state_and_attributes_and_data_ids_to_purge(
-        session, purge_before
+        session, progress.purge_before
     )
     if state_ids:
         _purge_state_ids(instance, session, state_ids)
-    _purge_unused_attributes_ids(instance, session, attributes_ids, using_sqlite)
+        progress.states += len(state_ids)
+    progress.state_attributes += _purge_unused_attributes_ids(
+        instance, session, attributes_ids, using_sqlite
+    )
     if event_ids:
         _purge_event_ids(session, event_ids)
-    _purge_unused_data_ids(instance, session, data_ids, using_sqlite)
+        progress.events += len(event_ids)
+    progress.event_data += _purge_unused_data_ids(
+        instance, session, data_ids, using_sqlite
+    )
     return bool(event_ids or state_ids or attributes_ids or data_ids)
 
 
 def _purge_states_and_attributes_ids(
     instance: Recorder,
     session: Session,
+    progress: PurgeProgress,
     states_batch_size: int,
-    purge_before: datetime,
+    deadline: float,
     using_sqlite: bool,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
@@ -176,15 +267,20 @@ def _purge_states_and_attributes_ids(
     attributes_ids_batch: set[int] = set()
     for _ in range(states_batch_size):
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before
+            session, progress.purge_before
         )
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
-        attributes_ids_batch = attributes_ids_batch | attributes_ids
+        progress.states += len(state_ids)
+        attributes_ids_batch |= attributes_ids
+        if time.monotonic() > deadline:
+            break
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch, using_sqlite)
+    progress.state_attributes += _purge_unused_attributes_ids(
+        instance, session, attributes_ids_batch, using_sqlite
+    )
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -195,13 +291,14 @@ def _purge_states_and_attributes_ids(
 def _purge_events_and_data_ids(
     instance: Recorder,
     session: Session,
+    progress: PurgeProgress,
     events_batch_size: int,
-    purge_before: datetime,
+    deadline: float,
     using_sqlite: bool,
 ) -> bool:
-    """Purge states and linked attributes id in a batch.
+    """Purge events and linked data ids in a batch.
 
-    Returns true if there are more states to purge.
+    Returns true if there are more events to purge.
     """
     has_remaining_event_ids_to_purge = True
     # There are more events relative to data_ids so
@@ -210,14 +307,21 @@ def _purge_events_and_data_ids(
     # MAX_ROWS_TO_PURGE
     data_ids_batch: set[int] = set()
     for _ in range(events_batch_size):
-        event_ids, data_ids = _select_event_data_ids_to_purge(session, purge_before)
+        event_ids, data_ids = _select_event_data_ids_to_purge(
+            session, progress.purge_before
+        )
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
-        data_ids_batch = data_ids_batch | data_ids
+        progress.events += len(event_ids)
+        data_ids_batch |= data_ids
+        if time.monotonic() > deadline:
+            break
 
-    _purge_unused_data_ids(instance, session, data_ids_batch, using_sqlite)
+    progress.event_data += _purge_unused_data_ids(
+        instance, session, data_ids_batch, using_sqlite
+    )
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -231,7 +335,7 @@ def _select_state_attributes_ids_to_purge(
     """Return sets of state and attribute ids to purge."""
     state_ids = set()
     attributes_ids = set()
-    for state in session.execute(find_states_to_purge(purge_before)).all():
+    for state in session.execute(find_states_to_purge(purge_before.timestamp())).all():
         state_ids.add(state.state_id)
         if state.attributes_id:
             attributes_ids.add(state.attributes_id)
@@ -249,7 +353,7 @@ def _select_event_data_ids_to_purge(
     """Return sets of event and data ids to purge."""
     event_ids = set()
     data_ids = set()
-    for event in session.execute(find_events_to_purge(purge_before)).all():
+    for event in session.execute(find_events_to_purge(purge_before.timestamp())).all():
         event_ids.add(event.event_id)
         if event.data_id:
             data_ids.add(event.data_id)
@@ -332,11 +436,16 @@ def _purge_unused_attributes_ids(
     session: Session,
     attributes_ids_batch: set[int],
     using_sqlite: bool,
-) -> None:
-    if unused_attribute_ids_set := _select_unused_attributes_ids(
-        session, attributes_ids_batch, using_sqlite
-    ):
-        _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+) -> int:
+    """Purge the attributes ids that are no longer used and return how many."""
+    purged = 0
+    for attributes_ids_chunk in chunked(attributes_ids_batch, MAX_ROWS_TO_PURGE):
+        if unused_attribute_ids_set := _select_unused_attributes_ids(
+            session, set(attributes_ids_chunk), using_sqlite
+        ):
+            _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+            purged += len(unused_attribute_ids_set)
+    return purged
 
 
 def _select_unused_event_data_ids(
@@ -373,12 +482,16 @@ def _select_unused_event_data_ids(
 
 def _purge_unused_data_ids(
     instance: Recorder, session: Session, data_ids_batch: set[int], using_sqlite: bool
-) -> None:
-
-    if unused_data_ids_set := _select_unused_event_data_ids(
-        session, data_ids_batch, using_sqlite
-    ):
-        _purge_batch_data_ids(instance, session, unused_data_ids_set)
+) -> int:
+    """Purge the event data ids that are no longer used and return how many."""
+    purged = 0
+    for data_ids_chunk in chunked(data_ids_batch, MAX_ROWS_TO_PURGE):
+        if unused_data_ids_set := _select_unused_event_data_ids(
+            session, set(data_ids_chunk), using_sqlite
+        ):
+            _purge_batch_data_ids(instance, session, unused_data_ids_set)
+            purged += len(unused_data_ids_set)
+    return purged
 
 
 def _select_statistics_runs_to_purge(
@@ -418,7 +531,9 @@ def _select_legacy_event_state_and_attributes_and_data_ids_to_purge(
     still need to be able to purge them.
     """
     events = session.execute(
-        find_legacy_event_state_and_attributes_and_data_ids_to_purge(purge_before)
+        find_legacy_event_state_and_attributes_and_data_ids_to_purge(
+            purge_before.timestamp()
+        )
     ).all()
     _LOGGER.debug("Selected %s event ids to remove", len(events))
     event_ids = set()
@@ -469,6 +584,14 @@ def _evict_purged_states_from_old_states_cache(
     for purged_state_id in purged_state_ids.intersection(old_state_reversed):
         old_states.pop(old_state_reversed[purged_state_id], None)
 
+    # The bulk insert pipeline only keeps the ids of the old states
+    old_state_ids = instance._old_state_ids  # pylint: disable=protected-access
+    old_state_ids_reversed = {
+        state_id: entity_id for entity_id, state_id in old_state_ids.items()
+    }
+    for purged_state_id in purged_state_ids.intersection(old_state_ids_reversed):
+        old_state_ids.pop(old_state_ids_reversed[purged_state_id], None)
+
 
 def _evict_purged_data_from_data_cache(
     instance: Recorder, purged_data_ids: set[int]
@@ -572,13 +695,20 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     using_sqlite = instance.dialect_name == SupportedDialect.SQLITE
 
     # Check if excluded entity_ids are in database
-    excluded_entity_ids: list[str] = [
-        entity_id
-        for (entity_id,) in session.query(distinct(States.entity_id)).all()
+    excluded_metadata_ids: dict[int, str] = {
+        metadata_id: entity_id
+        for metadata_id, entity_id in session.query(
+            StatesMeta.metadata_id, StatesMeta.entity_id
+        ).all()
         if not instance.entity_filter(entity_id)
-    ]
-    if len(excluded_entity_ids) > 0:
-        _purge_filtered_states(instance, session, excluded_entity_ids, using_sqlite)
+    }
+    if len(excluded_metadata_ids) > 0:
+        if not _purge_filtered_states(
+            instance, session, list(excluded_metadata_ids), using_sqlite
+        ):
+            # The entities are no longer recorded so their
+            # metadata can go once all their states are gone
+            _purge_states_meta(instance, session, excluded_metadata_ids)
         return False
 
     # Check if excluded event_types are in database
@@ -597,21 +727,24 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
 def _purge_filtered_states(
     instance: Recorder,
     session: Session,
-    excluded_entity_ids: list[str],
+    excluded_metadata_ids: list[int],
     using_sqlite: bool,
-) -> None:
-    """Remove filtered states and linked events."""
+) -> bool:
+    """Remove filtered states and linked events.
+
+    Returns False if there were no states left to remove.
+    """
     state_ids: list[int]
     attributes_ids: list[int]
     event_ids: list[int]
-    state_ids, attributes_ids, event_ids = zip(
-        *(
-            session.query(States.state_id, States.attributes_id, States.event_id)
-            .filter(States.entity_id.in_(excluded_entity_ids))
-            .limit(MAX_ROWS_TO_PURGE)
-            .all()
-        )
-    )
+    if not (
+        rows := session.query(States.state_id, States.attributes_id, States.event_id)
+        .filter(States.metadata_id.in_(excluded_metadata_ids))
+        .limit(MAX_ROWS_TO_PURGE)
+        .all()
+    ):
+        return False
+    state_ids, attributes_ids, event_ids = zip(*rows)
     event_ids = [id_ for id_ in event_ids if id_ is not None]
     _LOGGER.debug(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
@@ -622,6 +755,18 @@ def _purge_filtered_states(
         session, {id_ for id_ in attributes_ids if id_ is not None}, using_sqlite
     )
     _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+    return True
+
+
+def _purge_states_meta(
+    instance: Recorder, session: Session, metadata_ids: dict[int, str]
+) -> None:
+    """Remove states_meta rows that no longer have any states."""
+    session.query(StatesMeta).filter(StatesMeta.metadata_id.in_(metadata_ids)).delete(
+        synchronize_session=False
+    )
+    instance.evict_state_metadata_ids(metadata_ids.values())
+    _LOGGER.debug("Deleted %s states_meta", len(metadata_ids))
 
 
 def _purge_filtered_events(
@@ -660,15 +805,22 @@ def purge_entity_data(instance: Recorder, entity_filter: Callable[[str], bool])
     """Purge states and events of specified entities."""
     using_sqlite = instance.dialect_name == SupportedDialect.SQLITE
     with session_scope(session=instance.get_session()) as session:
-        selected_entity_ids: list[str] = [
-            entity_id
-            for (entity_id,) in session.query(distinct(States.entity_id)).all()
+        selected_metadata_ids: dict[int, str] = {
+            metadata_id: entity_id
+            for metadata_id, entity_id in session.query(
+                StatesMeta.metadata_id, StatesMeta.entity_id
+            ).all()
             if entity_filter(entity_id)
-        ]
-        _LOGGER.debug("Purging entity data for %s", selected_entity_ids)
-        if len(selected_entity_ids) > 0:
-            # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-            _purge_filtered_states(instance, session, selected_entity_ids, using_sqlite)
+        }
+        _LOGGER.debug(
+            "Purging entity data for %s", list(selected_metadata_ids.values())
+        )
+        # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events
+        # record. The states_meta rows are kept since the entities may still be
+        # recorded.
+        if len(selected_metadata_ids) > 0 and _purge_filtered_states(
+            instance, session, list(selected_metadata_ids), using_sqlite
+        ):
             _LOGGER.debug("Purging entity data hasn't fully completed yet")
             return False
 
@@ -152,11 +152,17 @@ def ws_info(
     migration_in_progress = async_migration_in_progress(hass)
     recording = instance.recording if instance else False
     thread_alive = instance.is_alive() if instance else False
+    purge_progress = (
+        instance.purge_progress.as_dict()
+        if instance and instance.purge_progress
+        else None
+    )
 
     recorder_info = {
         "backlog": backlog,
         "max_backlog": MAX_QUEUE_BACKLOG,
         "migration_in_progress": migration_in_progress,
+        "purge_progress": purge_progress,
         "recording": recording,
         "thread_running": thread_alive,
     }
@@ -41,6 +41,7 @@ from homeassistant.helpers.script import (
     ATTR_MAX,
     CONF_MAX,
     CONF_MAX_EXCEEDED,
+    ReferenceIndex,
     Script,
     script_stack_cv,
 )
@@ -71,6 +72,8 @@ SCRIPT_TURN_ONOFF_SCHEMA = make_entity_service_schema(
 )
 RELOAD_SERVICE_SCHEMA = vol.Schema({})
 
+DATA_REFERENCE_INDEX = "script_reference_index"
+
 
 @bind_hass
 def is_on(hass, entity_id):
@@ -81,16 +84,10 @@ def is_on(hass, entity_id):
 @callback
 def scripts_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     """Return all scripts that reference the entity."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if entity_id in script_entity.script.referenced_entities
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].referencing_entity(entity_id)
 
 
 @callback
@@ -110,16 +107,10 @@ def entities_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_device(hass: HomeAssistant, device_id: str) -> list[str]:
     """Return all scripts that reference the device."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if device_id in script_entity.script.referenced_devices
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].referencing_device(device_id)
 
 
 @callback
@@ -139,16 +130,10 @@ def devices_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_area(hass: HomeAssistant, area_id: str) -> list[str]:
     """Return all scripts that reference the area."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if area_id in script_entity.script.referenced_areas
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].referencing_area(area_id)
 
 
 @callback
@@ -168,6 +153,7 @@ def areas_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Load the scripts from the configuration."""
     hass.data[DOMAIN] = component = EntityComponent(LOGGER, DOMAIN, hass)
+    hass.data[DATA_REFERENCE_INDEX] = ReferenceIndex()
 
     # Process integration platforms right away since
     # we will create entities before firing EVENT_COMPONENT_LOADED
@@ -436,12 +422,20 @@ class ScriptEntity(ToggleEntity, RestoreEntity):
 
     async def async_added_to_hass(self) -> None:
         """Restore last triggered on startup."""
+        self.hass.data[DATA_REFERENCE_INDEX].async_add(
+            self.entity_id,
+            self.script.referenced_entities,
+            self.script.referenced_devices,
+            self.script.referenced_areas,
+        )
+
         if state := await self.async_get_last_state():
             if last_triggered := state.attributes.get("last_triggered"):
                 self.script.last_triggered = parse_datetime(last_triggered)
 
     async def async_will_remove_from_hass(self):
         """Stop script and remove service when it will be removed from Home Assistant."""
+        self.hass.data[DATA_REFERENCE_INDEX].async_remove(self.entity_id)
         await self.script.async_stop()
 
         # remove service
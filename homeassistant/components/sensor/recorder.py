@@ -29,6 +29,7 @@ from homeassistant.const import (
     ENERGY_KILO_WATT_HOUR,
     ENERGY_MEGA_WATT_HOUR,
     ENERGY_WATT_HOUR,
+    EVENT_STATE_CHANGED,
     POWER_KILO_WATT,
     POWER_WATT,
     PRESSURE_BAR,
@@ -44,7 +45,7 @@ from homeassistant.const import (
     VOLUME_CUBIC_FEET,
     VOLUME_CUBIC_METERS,
 )
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 import homeassistant.util.dt as dt_util
@@ -127,6 +128,12 @@ WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Running statistics of the sensors, collected from state_changed events
+DATA_ACCUMULATOR = "sensor_statistics_accumulator"
+
+PERIOD = datetime.timedelta(minutes=5)
+# Number of compiled periods to keep after the current period
+KEEP_PERIODS = 2
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -385,6 +392,269 @@ def _last_reset_as_utc_isoformat(last_reset_s: Any, entity_id: str) -> str | Non
     return dt_util.as_utc(last_reset).isoformat()
 
 
+def _period_start(time: datetime.datetime) -> datetime.datetime:
+    """Return the start of the 5-minute period time is in."""
+    return time.replace(minute=time.minute - time.minute % 5, second=0, microsecond=0)
+
+
+def _normalize_state(
+    device_class: str | None, state: State
+) -> tuple[float, str | None] | None:
+    """Normalize the unit of a single state, matching _normalize_states.
+
+    Returns None if the state is not numeric.
+    Raises HomeAssistantError if the unit is not supported.
+    """
+    try:
+        fstate = _parse_float(state.state)
+    except ValueError:
+        return None
+    unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    if device_class not in UNIT_CONVERSIONS:
+        return fstate, unit
+    if unit not in UNIT_CONVERSIONS[device_class]:
+        raise HomeAssistantError
+    return UNIT_CONVERSIONS[device_class][unit](fstate), unit
+
+
+class _PeriodStatistics:
+    """Statistics of a sensor during a 5-minute period.
+
+    Measurement sensors keep a running time weighted average, min and max.
+    Other sensors keep the states of the period since their sum depends on
+    the last compiled statistics.
+    """
+
+    __slots__ = (
+        "accumulated",
+        "first_time",
+        "fstate",
+        "last_time",
+        "max",
+        "min",
+        "needs_database",
+        "states",
+        "units",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the period."""
+        self.accumulated = 0.0
+        self.first_time: datetime.datetime | None = None
+        self.fstate: float | None = None
+        self.last_time: datetime.datetime | None = None
+        self.max: float | None = None
+        self.min: float | None = None
+        self.needs_database = False
+        self.states: list[State] | None = None
+        self.units: set[str | None] = set()
+
+    def add_fstate(
+        self, fstate: float, unit: str | None, time: datetime.datetime
+    ) -> None:
+        """Add a numeric state, matching _time_weighted_average."""
+        if self.fstate is None:
+            # Adjust start time, if there was no last known state
+            self.first_time = time
+        else:
+            assert self.last_time is not None
+            self.accumulated += self.fstate * (time - self.last_time).total_seconds()
+        self.fstate = fstate
+        self.last_time = time
+        self.units.add(unit)
+        if self.min is None or fstate < self.min:
+            self.min = fstate
+        if self.max is None or fstate > self.max:
+            self.max = fstate
+
+    def mean(self, end: datetime.datetime) -> float:
+        """Return the time weighted average until end."""
+        assert self.fstate is not None
+        assert self.first_time is not None and self.last_time is not None
+        accumulated = (
+            self.accumulated + self.fstate * (end - self.last_time).total_seconds()
+        )
+        return accumulated / (end - self.first_time).total_seconds()
+
+
+class _SensorStatistics:
+    """Statistics periods of a sensor."""
+
+    __slots__ = ("covered_from", "device_class", "last_state", "periods", "state_class")
+
+    def __init__(
+        self,
+        state_class: str,
+        device_class: str | None,
+        covered_from: datetime.datetime,
+    ) -> None:
+        """Initialize the sensor."""
+        self.state_class = state_class
+        self.device_class = device_class
+        # Periods starting before this may have missed state changes
+        self.covered_from = covered_from
+        self.last_state: State | None = None
+        self.periods: dict[datetime.datetime, _PeriodStatistics] = {}
+
+    def _new_period(self, start: datetime.datetime) -> _PeriodStatistics:
+        """Start a period from the last known state."""
+        period = _PeriodStatistics()
+        if self.state_class != STATE_CLASS_MEASUREMENT:
+            period.states = [self.last_state] if self.last_state else []
+        elif self.last_state is not None:
+            self._add_state(period, self.last_state, start)
+        return period
+
+    def _add_state(
+        self, period: _PeriodStatistics, state: State, time: datetime.datetime
+    ) -> None:
+        """Add a state to the running statistics of a measurement period."""
+        try:
+            normalized = _normalize_state(self.device_class, state)
+        except HomeAssistantError:
+            # Let the database path log about the unsupported unit
+            period.needs_database = True
+            return
+        if normalized is not None:
+            period.add_fstate(*normalized, time)
+
+    def add_state(self, state: State) -> None:
+        """Add a new state of the sensor."""
+        start = _period_start(state.last_updated)
+        if (period := self.periods.get(start)) is None:
+            period = self.periods[start] = self._new_period(start)
+            for old_start in [
+                old_start
+                for old_start in self.periods
+                if old_start < start - KEEP_PERIODS * PERIOD
+            ]:
+                del self.periods[old_start]
+        if period.states is not None:
+            period.states.append(state)
+        # Only state changes are significant for measurements,
+        # which is what the database path fetches as well
+        elif state.last_changed == state.last_updated:
+            self._add_state(period, state, state.last_updated)
+        self.last_state = state
+
+    def get_period(self, start: datetime.datetime) -> _PeriodStatistics | None:
+        """Return the statistics for a period which is fully covered."""
+        if start < self.covered_from:
+            return None
+        if (period := self.periods.get(start)) is not None:
+            return period
+        # The state did not change during the period
+        if self.last_state is None or self.last_state.last_updated >= start:
+            return None
+        return self._new_period(start)
+
+
+class StatisticsAccumulator:
+    """Accumulate the statistics of sensors from their state changes.
+
+    This saves fetching and normalizing the history of all sensors from the
+    database when compiling 5-minute statistics. The database is still used
+    for periods which were not fully observed, e.g. after a restart.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the accumulator."""
+        self.hass = hass
+        self._sensors: dict[str, _SensorStatistics] = {}
+
+    @callback
+    def async_setup(self) -> None:
+        """Start tracking the state changes of sensors."""
+        # Only periods starting after now are fully observed
+        covered_from = _period_start(dt_util.utcnow()) + PERIOD
+        for state in self.hass.states.async_all(DOMAIN):
+            if (state_class := state.attributes.get(ATTR_STATE_CLASS)) in STATE_CLASSES:
+                sensor = self._sensors[state.entity_id] = _SensorStatistics(
+                    state_class, state.attributes.get(ATTR_DEVICE_CLASS), covered_from
+                )
+                sensor.last_state = state
+        self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=self._async_sensor_filter,
+            run_immediately=True,
+        )
+
+    @callback
+    def _async_sensor_filter(self, event: Event) -> bool:
+        """Filter state changes of sensors."""
+        return bool(event.data["entity_id"].startswith(f"{DOMAIN}."))
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Add a state change."""
+        entity_id: str = event.data["entity_id"]
+        new_state: State | None = event.data["new_state"]
+        if new_state is None or (
+            (state_class := new_state.attributes.get(ATTR_STATE_CLASS))
+            not in STATE_CLASSES
+        ):
+            self._sensors.pop(entity_id, None)
+            return
+
+        device_class = new_state.attributes.get(ATTR_DEVICE_CLASS)
+        sensor = self._sensors.get(entity_id)
+        if (
+            sensor is None
+            or sensor.state_class != state_class
+            or sensor.device_class != device_class
+            or (
+                sensor.last_state is not None
+                and new_state.last_updated < sensor.last_state.last_updated
+            )
+        ):
+            start = _period_start(new_state.last_updated)
+            # Without an earlier state, the database has nothing to add
+            # for the current period
+            if event.data["old_state"] is not None:
+                start += PERIOD
+            sensor = self._sensors[entity_id] = _SensorStatistics(
+                state_class, device_class, start
+            )
+        sensor.add_state(new_state)
+
+    def get_period(
+        self, state: State, start: datetime.datetime, end: datetime.datetime
+    ) -> _PeriodStatistics | None:
+        """Return the statistics of a sensor during a fully observed period.
+
+        Runs in the recorder thread, periods which are compiled are not
+        modified by the event loop anymore.
+        """
+        if (
+            end - start != PERIOD
+            or start != _period_start(start)
+            or end > dt_util.utcnow()
+            or (sensor := self._sensors.get(state.entity_id)) is None
+            or sensor.state_class != state.attributes[ATTR_STATE_CLASS]
+            or sensor.device_class != state.attributes.get(ATTR_DEVICE_CLASS)
+            or (period := sensor.get_period(start)) is None
+        ):
+            return None
+        if period.states is not None:
+            return period if period.states else None
+        if (
+            period.fstate is None
+            or period.needs_database
+            or (sensor.device_class not in UNIT_CONVERSIONS and len(period.units) > 1)
+        ):
+            # Let the database path handle the warnings
+            return None
+        return period
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Set up the sensor recorder platform."""
+    accumulator = hass.data[DATA_ACCUMULATOR] = StatisticsAccumulator(hass)
+    accumulator.async_setup()
+
+
 def compile_statistics(
     hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
 ) -> statistics.PlatformCompiledStatistics:
@@ -412,24 +682,41 @@ def _compile_statistics(  # noqa: C901
         hass, session, statistic_ids=[i.entity_id for i in sensor_states]
     )
 
-    # Get history between start and end
+    # Use the accumulated statistics of the sensors where possible
+    history_list: MutableMapping[str, list[State]] = {}
+    accumulated: dict[str, _PeriodStatistics] = {}
+    if accumulator := hass.data.get(DATA_ACCUMULATOR):
+        for _state in sensor_states:
+            if (period := accumulator.get_period(_state, start, end)) is None:
+                continue
+            if period.states is not None:
+                history_list[_state.entity_id] = period.states
+            else:
+                accumulated[_state.entity_id] = period
+
+    # Get history between start and end for the other sensors
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id
+        for i in sensor_states
+        if "sum" in wanted_statistics[i.entity_id] and i.entity_id not in history_list
     ]
-    history_list: MutableMapping[str, list[State]] = {}
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
-        )
+        history_list = {
+            **history_list,
+            **history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_full_history,
+                significant_changes_only=False,
+            ),
+        }
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
+        and i.entity_id not in accumulated
     ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
@@ -443,17 +730,29 @@ def _compile_statistics(  # noqa: C901
     # If there are no recent state changes, the sensor's state may already be pruned
     # from the recorder. Get the state from the state machine instead.
     for _state in sensor_states:
-        if _state.entity_id not in history_list:
+        if _state.entity_id not in history_list and _state.entity_id not in accumulated:
             history_list[_state.entity_id] = [_state]
 
-    to_process = []
+    to_process: list[
+        tuple[str, str | None, str, list[tuple[float, State]], _PeriodStatistics | None]
+    ] = []
     to_query = []
     for _state in sensor_states:
         entity_id = _state.entity_id
+        device_class = _state.attributes.get(ATTR_DEVICE_CLASS)
+        state_class = _state.attributes[ATTR_STATE_CLASS]
+
+        if (period := accumulated.get(entity_id)) is not None:
+            if device_class in DEVICE_CLASS_UNITS:
+                unit = DEVICE_CLASS_UNITS[device_class]
+            else:
+                unit = next(iter(period.units))
+            to_process.append((entity_id, unit, state_class, [], period))
+            continue
+
         if entity_id not in history_list:
             continue
 
-        device_class = _state.attributes.get(ATTR_DEVICE_CLASS)
         entity_history = history_list[entity_id]
         unit, fstates = _normalize_states(
             hass,
@@ -467,9 +766,7 @@ def _compile_statistics(  # noqa: C901
         if not fstates:
             continue
 
-        state_class = _state.attributes[ATTR_STATE_CLASS]
-
-        to_process.append((entity_id, unit, state_class, fstates))
+        to_process.append((entity_id, unit, state_class, fstates, None))
         if "sum" in wanted_statistics[entity_id]:
             to_query.append(entity_id)
 
@@ -481,6 +778,7 @@ def _compile_statistics(  # noqa: C901
         unit,
         state_class,
         fstates,
+        period,
     ) in to_process:
         # Check metadata
         if old_metadata := old_metadatas.get(entity_id):
@@ -515,6 +813,14 @@ def _compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
+        if period is not None:
+            # Measurements accumulated from the state changes
+            stat["max"] = period.max
+            stat["min"] = period.min
+            stat["mean"] = period.mean(end)
+            result.append({"meta": meta, "stat": stat})
+            continue
+
         if "max" in wanted_statistics[entity_id]:
             stat["max"] = max(*itertools.islice(zip(*fstates), 1))  # type: ignore[typeddict-item]
         if "min" in wanted_statistics[entity_id]:
@@ -14,6 +14,7 @@ from homeassistant.const import __version__
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 
 from .connection import ActiveConnection
+from .const import SUPPORTED_FEATURES
 from .error import Disconnect
 
 if TYPE_CHECKING:
@@ -30,13 +31,21 @@ AUTH_MESSAGE_SCHEMA: Final = vol.Schema(
         vol.Required("type"): TYPE_AUTH,
         vol.Exclusive("api_password", "auth"): str,
         vol.Exclusive("access_token", "auth"): str,
+        vol.Optional("supported_features"): {str: int},
     }
 )
 
 
-def auth_ok_message() -> dict[str, str]:
-    """Return an auth_ok message."""
-    return {"type": TYPE_AUTH_OK, "ha_version": __version__}
+def auth_ok_message(supported_features: dict[str, int] | None = None) -> dict[str, Any]:
+    """Return an auth_ok message.
+
+    The protocol features that were enabled are only included if the
+    client asked for any.
+    """
+    message: dict[str, Any] = {"type": TYPE_AUTH_OK, "ha_version": __version__}
+    if supported_features:
+        message["supported_features"] = supported_features
+    return message
 
 
 def auth_required_message() -> dict[str, str]:
@@ -85,7 +94,17 @@ class AuthPhase:
                 msg["access_token"]
             )
             if refresh_token is not None:
-                conn = await self._async_finish_auth(refresh_token.user, refresh_token)
+                conn = await self._async_finish_auth(
+                    refresh_token.user,
+                    refresh_token,
+                    {
+                        feature: enabled
+                        for feature, enabled in msg.get(
+                            "supported_features", {}
+                        ).items()
+                        if feature in SUPPORTED_FEATURES
+                    },
+                )
                 conn.subscriptions[
                     "auth"
                 ] = self._hass.auth.async_register_revoke_token_callback(
@@ -99,12 +118,20 @@ class AuthPhase:
         raise Disconnect
 
     async def _async_finish_auth(
-        self, user: User, refresh_token: RefreshToken
+        self,
+        user: User,
+        refresh_token: RefreshToken,
+        supported_features: dict[str, int],
     ) -> ActiveConnection:
         """Create an active connection."""
         self._logger.debug("Auth OK")
         await process_success_login(self._request)
-        self._send_message(auth_ok_message())
+        self._send_message(auth_ok_message(supported_features))
         return ActiveConnection(
-            self._logger, self._hass, self._send_message, user, refresh_token
+            self._logger,
+            self._hass,
+            self._send_message,
+            user,
+            refresh_token,
+            supported_features,
         )
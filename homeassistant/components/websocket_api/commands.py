@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import AsyncGenerator, Callable
 import datetime as dt
+from functools import partial
 import json
 from typing import Any, cast
 
@@ -27,12 +28,25 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
+    async_get_template_render_stats,
     async_track_template_result,
 )
-from homeassistant.helpers.json import JSON_DUMP, ExtendedJSONEncoder
+from homeassistant.helpers.json import (
+    JSON_DUMP,
+    JSON_ENCODE_EXCEPTIONS,
+    ExtendedJSONEncoder,
+)
 from homeassistant.helpers.service import async_get_all_descriptions
-from homeassistant.loader import IntegrationNotFound, async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.loader import (
+    DATA_IMPORT_TIMES,
+    IntegrationNotFound,
+    async_get_integration,
+)
+from homeassistant.setup import (
+    DATA_BOOTSTRAP_TIMINGS,
+    DATA_SETUP_TIME,
+    async_get_loaded_integrations,
+)
 from homeassistant.util.json import (
     find_paths_unserializable_data,
     format_unserializable_data,
@@ -42,6 +56,12 @@ from . import const, decorators, messages
 from .connection import ActiveConnection
 from .const import ERR_NOT_FOUND
 
+# Number of states serialized before yielding to the event loop
+STATES_CHUNK_SIZE = 1000
+
+TO_REPLACE = "__TO_REPLACE__"
+TO_REPLACE_JSON = '"__TO_REPLACE__"'
+
 
 @callback
 def async_register_commands(
@@ -58,9 +78,12 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_bootstrap_timings)
+    async_reg(hass, handle_integration_import_times)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_template_render_stats)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
@@ -228,57 +251,77 @@ def _async_get_allowed_states(
     ]
 
 
-@callback
+async def _async_serialize_states(
+    states: list[State], serialize: Callable[[State], bytes]
+) -> AsyncGenerator[list[tuple[State, bytes]], None]:
+    """Serialize states to their cached json in chunks.
+
+    The json of each state is cached on the state so reconnecting clients
+    mostly reuse it. Encoding states that are not cached yet can take a
+    while with large state machines so we yield to the event loop after
+    each chunk. States that cannot be serialized are skipped.
+    """
+    for start in range(0, len(states), STATES_CHUNK_SIZE):
+        if start:
+            await asyncio.sleep(0)
+        chunk: list[tuple[State, bytes]] = []
+        for state in states[start : start + STATES_CHUNK_SIZE]:
+            try:
+                chunk.append((state, serialize(state)))
+            except JSON_ENCODE_EXCEPTIONS:
+                pass
+        yield chunk
+
+
+def _log_unserializable(connection: ActiveConnection, response: Any) -> None:
+    """Log the paths to the data that could not be serialized."""
+    connection.logger.error(
+        "Unable to serialize to JSON. Bad data found at %s",
+        format_unserializable_data(
+            find_paths_unserializable_data(response, dump=JSON_DUMP)
+        ),
+    )
+
+
 @decorators.websocket_command({vol.Required("type"): "get_states"})
-def handle_get_states(
+@decorators.async_response
+async def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
     states = _async_get_allowed_states(hass, connection)
-
-    # JSON serialize here so we can recover if it blows up due to the
-    # state machine containing unserializable data. This command is required
-    # to succeed for the UI to show.
-    response = messages.result_message(msg["id"], states)
-    try:
-        connection.send_message(JSON_DUMP(response))
-        return
-    except (ValueError, TypeError):
-        connection.logger.error(
-            "Unable to serialize to JSON. Bad data found at %s",
-            format_unserializable_data(
-                find_paths_unserializable_data(response, dump=JSON_DUMP)
-            ),
-        )
-    del response
-
-    # If we can't serialize, we'll filter out unserializable states
-    serialized = []
-    for state in states:
-        try:
-            serialized.append(JSON_DUMP(state))
-        except (ValueError, TypeError):
-            # Error is already logged above
-            pass
-
-    # We now have partially serialized states. Craft some JSON.
-    response2 = JSON_DUMP(messages.result_message(msg["id"], ["TO_REPLACE"]))
-    response2 = response2.replace('"TO_REPLACE"', ", ".join(serialized))
-    connection.send_message(response2)
+    # The json of each chunk is joined and decoded on its own so
+    # large state machines do not block the event loop
+    parts: list[str] = []
+    serialized = 0
+    async for chunk in _async_serialize_states(states, State.as_dict_json):
+        serialized += len(chunk)
+        if chunk:
+            parts.append(b",".join(state_json for _, state_json in chunk).decode())
+    if serialized != len(states):
+        _log_unserializable(connection, messages.result_message(msg["id"], states))
+    # The states are already json so craft the response around them
+    prefix, suffix = JSON_DUMP(messages.result_message(msg["id"], TO_REPLACE)).split(
+        TO_REPLACE_JSON, 1
+    )
+    connection.send_message(f"{prefix}[{','.join(parts)}]{suffix}")
 
 
-@callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
     }
 )
-def handle_subscribe_entities(
+@decorators.async_response
+async def handle_subscribe_entities(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle subscribe entities command."""
     entity_ids = set(msg.get("entity_ids", []))
+    # Changes that happen while the initial states are being serialized
+    # are held back until they have been sent
+    pending_events: list[Event] | None = []
 
     @callback
     def forward_entity_changes(event: Event) -> None:
@@ -289,6 +332,9 @@ def handle_subscribe_entities(
             return
         if entity_ids and event.data["entity_id"] not in entity_ids:
             return
+        if pending_events is not None:
+            pending_events.append(event)
+            return
 
         connection.send_message(
             lambda: messages.cached_state_diff_message(msg["id"], event)
@@ -297,47 +343,53 @@ def handle_subscribe_entities(
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
+    states = [
+        state
+        for state in _async_get_allowed_states(hass, connection)
+        if not entity_ids or state.entity_id in entity_ids
+    ]
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
         EVENT_STATE_CHANGED, forward_entity_changes, run_immediately=True
     )
     connection.send_result(msg["id"])
-    data: dict[str, dict[str, dict]] = {
-        messages.ENTITY_EVENT_ADD: {
-            state.entity_id: messages.compressed_state_dict_add(state)
-            for state in states
-            if not entity_ids or state.entity_id in entity_ids
-        }
-    }
 
-    # JSON serialize here so we can recover if it blows up due to the
-    # state machine containing unserializable data. This command is required
-    # to succeed for the UI to show.
-    response = messages.event_message(msg["id"], data)
-    try:
-        connection.send_message(JSON_DUMP(response))
-        return
-    except (ValueError, TypeError):
-        connection.logger.error(
-            "Unable to serialize to JSON. Bad data found at %s",
-            format_unserializable_data(
-                find_paths_unserializable_data(response, dump=JSON_DUMP)
+    # The json of each chunk is joined and decoded on its own so
+    # large state machines do not block the event loop
+    parts: list[str] = []
+    serialized = 0
+    async for chunk in _async_serialize_states(states, State.as_compressed_state_json):
+        serialized += len(chunk)
+        if chunk:
+            parts.append(
+                b",".join(
+                    b'"%s":%s' % (state.entity_id.encode(), state_json)
+                    for state, state_json in chunk
+                ).decode()
+            )
+    # The states are already json so craft the event around them
+    prefix, suffix = JSON_DUMP(
+        messages.event_message(msg["id"], {messages.ENTITY_EVENT_ADD: TO_REPLACE})
+    ).split(TO_REPLACE_JSON, 1)
+    connection.send_message(f"{prefix}{{{','.join(parts)}}}{suffix}")
+    if serialized != len(states):
+        _log_unserializable(
+            connection,
+            messages.event_message(
+                msg["id"],
+                {
+                    messages.ENTITY_EVENT_ADD: {
+                        state.entity_id: state.as_compressed_state() for state in states
+                    }
+                },
             ),
         )
-    del response
 
-    add_entities = data[messages.ENTITY_EVENT_ADD]
-    cannot_serialize: list[str] = []
-    for entity_id, state_dict in add_entities.items():
-        try:
-            JSON_DUMP(state_dict)
-        except (ValueError, TypeError):
-            cannot_serialize.append(entity_id)
-
-    for entity_id in cannot_serialize:
-        del add_entities[entity_id]
-
-    connection.send_message(JSON_DUMP(messages.event_message(msg["id"], data)))
+    queued_events = pending_events or []
+    pending_events = None
+    for event in queued_events:
+        connection.send_message(
+            partial(messages.cached_state_diff_message, msg["id"], event)
+        )
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -410,6 +462,64 @@ async def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/bootstrap_timings"})
+def handle_integration_bootstrap_timings(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle bootstrap timings command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {"phase": phase, "seconds": phase_timedelta.total_seconds()}
+            for phase, phase_timedelta in cast(
+                dict[str, dt.timedelta], hass.data.get(DATA_BOOTSTRAP_TIMINGS, {})
+            ).items()
+        ],
+    )
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/import_times"})
+def handle_integration_import_times(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration import times command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {"domain": integration, "seconds": seconds}
+            for integration, seconds in cast(
+                dict[str, float], hass.data.get(DATA_IMPORT_TIMES, {})
+            ).items()
+        ],
+    )
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "template/render_stats"})
+@decorators.require_admin
+def handle_template_render_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle template render stats command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {
+                "template": template.template,
+                "renders": stats.renders,
+                "seconds": stats.render_time,
+            }
+            for template, stats in sorted(
+                async_get_template_render_stats(hass),
+                key=lambda item: item[1].render_time,
+                reverse=True,
+            )
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
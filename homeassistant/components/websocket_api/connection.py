@@ -34,6 +34,7 @@ class ActiveConnection:
         send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
         user: User,
         refresh_token: RefreshToken,
+        supported_features: dict[str, int] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
@@ -41,6 +42,7 @@ class ActiveConnection:
         self.send_message = send_message
         self.user = user
         self.refresh_token_id = refresh_token.id
+        self.supported_features = supported_features or {}
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         current_connection.set(self)
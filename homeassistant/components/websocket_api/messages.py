@@ -7,9 +7,10 @@ from typing import Any, Final
 
 import voluptuous as vol
 
+from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.json import JSON_DUMP, JSON_ENCODE_EXCEPTIONS
 from homeassistant.util.json import (
     find_paths_unserializable_data,
     format_unserializable_data,
@@ -38,6 +39,10 @@ BASE_COMMAND_MESSAGE_SCHEMA: Final = vol.Schema({vol.Required("id"): cv.positive
 
 IDEN_TEMPLATE: Final = "__IDEN__"
 IDEN_JSON_TEMPLATE: Final = '"__IDEN__"'
+OLD_STATE_TEMPLATE: Final = "__OLD_STATE__"
+OLD_STATE_JSON_TEMPLATE: Final = '"__OLD_STATE__"'
+NEW_STATE_TEMPLATE: Final = "__NEW_STATE__"
+NEW_STATE_JSON_TEMPLATE: Final = '"__NEW_STATE__"'
 
 STATE_DIFF_ADDITIONS = "+"
 STATE_DIFF_REMOVALS = "-"
@@ -86,9 +91,44 @@ def _cached_event_message(event: Event) -> str:
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
     """
+    if event.event_type == EVENT_STATE_CHANGED:
+        try:
+            return _state_changed_event_message_json(event)
+        except JSON_ENCODE_EXCEPTIONS:
+            # Let message_to_json log the unserializable data
+            pass
     return message_to_json(event_message(IDEN_TEMPLATE, event))
 
 
+def _state_changed_event_message_json(event: Event) -> str:
+    """Serialize a state_changed event reusing the cached json of its states."""
+    event_dict = event.as_dict()
+    data = event_dict["data"]
+    states_json: list[tuple[str, str]] = []
+    for key, template, json_template in (
+        ("old_state", OLD_STATE_TEMPLATE, OLD_STATE_JSON_TEMPLATE),
+        ("new_state", NEW_STATE_TEMPLATE, NEW_STATE_JSON_TEMPLATE),
+    ):
+        if isinstance(state := data.get(key), State):
+            states_json.append((json_template, state.as_dict_json().decode("utf-8")))
+            data[key] = template
+    message = JSON_DUMP(event_message(IDEN_TEMPLATE, event_dict))
+    # Locate the placeholders before splicing in any state json since the
+    # states themselves can contain the placeholder strings
+    splices = sorted(
+        (message.index(json_template), json_template, state_json)
+        for json_template, state_json in states_json
+    )
+    parts: list[str] = []
+    end = 0
+    for start, json_template, state_json in splices:
+        parts.append(message[end:start])
+        parts.append(state_json)
+        end = start + len(json_template)
+    parts.append(message[end:])
+    return "".join(parts)
+
+
 def cached_state_diff_message(iden: int, event: Event) -> str:
     """Return an event message.
 
@@ -108,6 +148,22 @@ def _cached_state_diff_message(event: Event) -> str:
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
     """
+    if (
+        isinstance(new_state := event.data["new_state"], State)
+        and event.data["old_state"] is None
+    ):
+        try:
+            state_json = new_state.as_compressed_state_json().decode("utf-8")
+        except JSON_ENCODE_EXCEPTIONS:
+            # Let message_to_json log the unserializable data
+            pass
+        else:
+            return JSON_DUMP(
+                event_message(
+                    IDEN_TEMPLATE,
+                    {ENTITY_EVENT_ADD: {new_state.entity_id: NEW_STATE_TEMPLATE}},
+                )
+            ).replace(NEW_STATE_JSON_TEMPLATE, state_json, 1)
     return message_to_json(event_message(IDEN_TEMPLATE, _state_diff_event(event)))
 
 
@@ -176,19 +232,7 @@ def compressed_state_dict_add(state: State) -> dict[str, Any]:
 
     Sends c (context) as a string if it only contains an id.
     """
-    if state.context.parent_id is None and state.context.user_id is None:
-        context: dict[str, Any] | str = state.context.id
-    else:
-        context = state.context.as_dict()
-    compressed_state: dict[str, Any] = {
-        COMPRESSED_STATE_STATE: state.state,
-        COMPRESSED_STATE_ATTRIBUTES: state.attributes,
-        COMPRESSED_STATE_CONTEXT: context,
-        COMPRESSED_STATE_LAST_CHANGED: state.last_changed.timestamp(),
-    }
-    if state.last_changed != state.last_updated:
-        compressed_state[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated.timestamp()
-    return compressed_state
+    return state.as_compressed_state()
 
 
 def message_to_json(message: dict[str, Any]) -> str:
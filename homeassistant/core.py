@@ -21,9 +21,10 @@ import functools
 import logging
 import os
 import pathlib
+from random import getrandbits
 import re
 import threading
-from time import monotonic
+from time import monotonic, time
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -45,9 +46,15 @@ from . import block_async_io, loader, util
 from .backports.enum import StrEnum
 from .const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_CONTEXT,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
     CONF_UNIT_SYSTEM_IMPERIAL,
     EVENT_CALL_SERVICE,
     EVENT_CORE_CONFIG_UPDATE,
@@ -73,6 +80,7 @@ from .exceptions import (
     ServiceNotFound,
     Unauthorized,
 )
+from .helpers.json import json_bytes
 from .util import dt as dt_util, location, ulid as ulid_util
 from .util.async_ import (
     fire_coroutine_threadsafe,
@@ -720,7 +728,13 @@ class HomeAssistant:
 class Context:
     """The context that triggered something."""
 
-    __slots__ = ("user_id", "parent_id", "id", "origin_event")
+    __slots__ = (
+        "user_id",
+        "parent_id",
+        "_id",
+        "_ulid_value",
+        "origin_event",
+    )
 
     def __init__(
         self,
@@ -729,11 +743,36 @@ class Context:
         id: str | None = None,  # pylint: disable=redefined-builtin
     ) -> None:
         """Init the context."""
-        self.id = id or ulid_util.ulid()
+        self._id = id or None
+        if self._id is None:
+            # Most contexts are never serialized or compared so only
+            # capture the parts of the ULID now and encode it on first use.
+            self._ulid_value = int(time() * 1000) << 80 | getrandbits(80)
         self.user_id = user_id
         self.parent_id = parent_id
         self.origin_event: Event | None = None
 
+    @property
+    def id(self) -> str:  # pylint: disable=invalid-name
+        """Return the id of the context."""
+        if self._id is None:
+            self._id = ulid_util.ulid_encode(self._ulid_value)
+        return self._id
+
+    def _copy_without_origin(self) -> Context:
+        """Return a copy of the context that does not reference its origin event.
+
+        The id is not generated if it has not been used yet.
+        """
+        context = Context.__new__(Context)
+        context._id = self._id
+        if self._id is None:
+            context._ulid_value = self._ulid_value
+        context.user_id = self.user_id
+        context.parent_id = self.parent_id
+        context.origin_event = None
+        return context
+
     def __eq__(self, other: Any) -> bool:
         """Compare contexts."""
         return bool(self.__class__ == other.__class__ and self.id == other.id)
@@ -821,12 +860,27 @@ class _FilterableJob(NamedTuple):
     run_immediately: bool
 
 
+class _KeyedListeners:
+    """Listeners of an event type indexed by a value of the event data."""
+
+    __slots__ = ("data", "domains", "count")
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        # Event data key -> event data value -> listeners
+        self.data: dict[str, dict[Any, list[_FilterableJob]]] = {}
+        # Domain of the entity_id in the event data -> listeners
+        self.domains: dict[str, list[_FilterableJob]] = {}
+        self.count = 0
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJob]] = {}
+        self._keyed_listeners: dict[str, _KeyedListeners] = {}
         self._hass = hass
 
     @callback
@@ -835,7 +889,10 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + keyed_listeners.count
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -872,12 +929,13 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
+        listeners = self._listeners.get(event_type)
+        keyed_listeners = self._keyed_listeners.get(event_type)
 
         # EVENT_HOMEASSISTANT_CLOSE should go only to this listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        match_all_listeners = None
+        if event_type != EVENT_HOMEASSISTANT_CLOSE:
+            match_all_listeners = self._listeners.get(MATCH_ALL)
 
         event = Event(event_type, event_data, origin, time_fired, context)
         if not event.context.origin_event:
@@ -885,9 +943,48 @@ class EventBus:
 
         _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
-            return
+        if match_all_listeners is not None:
+            self._async_run_listeners(event, match_all_listeners)
+        if listeners is not None:
+            self._async_run_listeners(event, listeners)
+        if keyed_listeners is not None and event_data:
+            self._async_run_keyed_listeners(event, event_data, keyed_listeners)
+
+    @callback
+    def _async_run_keyed_listeners(
+        self,
+        event: Event,
+        event_data: dict[str, Any],
+        keyed_listeners: _KeyedListeners,
+    ) -> None:
+        """Run the listeners indexed by a value of the event data."""
+        for data_key, value_listeners in keyed_listeners.data.items():
+            if (value := event_data.get(data_key)) is None:
+                continue
+            try:
+                listeners = value_listeners.get(value)
+            except TypeError:
+                # Unhashable values, like a list of entity_ids, are never indexed
+                continue
+            if listeners is not None:
+                self._async_run_listeners(event, listeners)
+
+        if keyed_listeners.domains and isinstance(
+            entity_id := event_data.get(ATTR_ENTITY_ID), str
+        ):
+            listeners = keyed_listeners.domains.get(entity_id.partition(".")[0])
+            if listeners is not None:
+                self._async_run_listeners(event, listeners)
+
+    @callback
+    def _async_run_listeners(
+        self, event: Event, listeners: list[_FilterableJob]
+    ) -> None:
+        """Run the listeners for an event.
 
+        Listeners are removed by replacing the list, so the list can safely be
+        iterated while a listener unsubscribes.
+        """
         for job, event_filter, run_immediately in listeners:
             if event_filter is not None:
                 try:
@@ -967,6 +1064,110 @@ class EventBus:
 
         return remove_listener
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        data_key: str,
+        values: Iterable[Any],
+        listener: Callable[[Event], None | Awaitable[None]],
+        run_immediately: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with one of the data values.
+
+        The listener is only run for events where event.data[data_key] is one
+        of values, for example the entity_id of state_changed events. Unlike
+        an event_filter, the listeners are found with a dict lookup, so firing
+        an event does not touch the listeners of other values.
+
+        Keyed listeners run after the listeners registered with async_listen,
+        the entity_id keyed ones before the ones of async_listen_domain.
+
+        This method must be run in the event loop.
+        """
+        if run_immediately and not is_callback(listener):
+            raise HomeAssistantError(f"Event listener {listener} is not a callback")
+        keyed_listeners = self._keyed_listeners.setdefault(
+            event_type, _KeyedListeners()
+        )
+        return self._async_listen_keyed_job(
+            event_type,
+            keyed_listeners.data.setdefault(data_key, {}),
+            values,
+            _FilterableJob(HassJob(listener), None, run_immediately),
+        )
+
+    @callback
+    def async_listen_domain(
+        self,
+        event_type: str,
+        domains: Iterable[str],
+        listener: Callable[[Event], None | Awaitable[None]],
+        run_immediately: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type for entities of the domains.
+
+        The listener is only run for events where the domain of
+        event.data[ATTR_ENTITY_ID] is one of domains.
+        It runs after the other listeners of the event, see async_listen_keyed.
+
+        This method must be run in the event loop.
+        """
+        if run_immediately and not is_callback(listener):
+            raise HomeAssistantError(f"Event listener {listener} is not a callback")
+        keyed_listeners = self._keyed_listeners.setdefault(
+            event_type, _KeyedListeners()
+        )
+        return self._async_listen_keyed_job(
+            event_type,
+            keyed_listeners.domains,
+            domains,
+            _FilterableJob(HassJob(listener), None, run_immediately),
+        )
+
+    @callback
+    def _async_listen_keyed_job(
+        self,
+        event_type: str,
+        index: dict[Any, list[_FilterableJob]],
+        values: Iterable[Any],
+        filterable_job: _FilterableJob,
+    ) -> CALLBACK_TYPE:
+        values = set(values)
+        for value in values:
+            index.setdefault(value, []).append(filterable_job)
+        self._keyed_listeners[event_type].count += 1
+        removed = False
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            nonlocal removed
+            if removed:
+                _LOGGER.error(
+                    "Unable to remove unknown job listener %s", filterable_job
+                )
+                return
+            removed = True
+            keyed_listeners = self._keyed_listeners[event_type]
+            for value in values:
+                # Replace the list instead of removing in place as the event may
+                # currently be fired, see _async_run_listeners
+                listeners = index[value]
+                if remaining := [job for job in listeners if job is not filterable_job]:
+                    index[value] = remaining
+                else:
+                    del index[value]
+            keyed_listeners.count -= 1
+            if not keyed_listeners.count:
+                del self._keyed_listeners[event_type]
+            else:
+                for data_key, value_listeners in list(keyed_listeners.data.items()):
+                    if not value_listeners:
+                        del keyed_listeners.data[data_key]
+
+        return remove_listener
+
     def listen_once(
         self, event_type: str, listener: Callable[[Event], None | Awaitable[None]]
     ) -> CALLBACK_TYPE:
@@ -1035,10 +1236,16 @@ class EventBus:
         This method must be run in the event loop.
         """
         try:
-            self._listeners[event_type].remove(filterable_job)
-
-            # delete event_type list if empty
-            if not self._listeners[event_type]:
+            listeners = self._listeners[event_type]
+            # Replace the list instead of removing in place as the event may
+            # currently be fired, see _async_run_listeners
+            remaining = [job for job in listeners if job is not filterable_job]
+            if len(remaining) == len(listeners):
+                raise ValueError
+            if remaining:
+                self._listeners[event_type] = remaining
+            else:
+                # delete event_type list if empty
                 self._listeners.pop(event_type)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
@@ -1074,6 +1281,10 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_dict_json",
+        "_as_compressed_state",
+        "_as_compressed_state_json",
+        "_attributes_json",
     ]
 
     def __init__(
@@ -1103,12 +1314,62 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        self.attributes = (
+            attributes
+            if isinstance(attributes, ReadOnlyDict)
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
+        self._as_dict_json: bytes | None = None
+        self._as_compressed_state: ReadOnlyDict[str, Any] | None = None
+        self._as_compressed_state_json: bytes | None = None
+        self._attributes_json: bytes | None = None
+
+    def _async_evolve(
+        self,
+        state: str,
+        attributes: Mapping[str, Any],
+        last_changed: datetime.datetime,
+        last_updated: datetime.datetime,
+        context: Context,
+    ) -> State:
+        """Return a new state for the same entity.
+
+        This skips the entity id validation and splitting that was already
+        done for this state and only copies the attributes if they are not
+        already read-only.
+        """
+        if state != self.state and not valid_state(state):
+            raise InvalidStateError(
+                f"Invalid state encountered for entity ID: {self.entity_id}. "
+                "State max length is 255 characters."
+            )
+        new = State.__new__(State)
+        new.entity_id = self.entity_id
+        new.state = state
+        new.attributes = (
+            attributes
+            if isinstance(attributes, ReadOnlyDict)
+            else ReadOnlyDict(attributes)
+        )
+        new.last_updated = last_updated
+        new.last_changed = last_changed
+        new.context = context
+        new.domain = self.domain
+        new.object_id = self.object_id
+        # pylint: disable=protected-access
+        new._as_dict = None
+        new._as_dict_json = None
+        new._as_compressed_state = None
+        new._as_compressed_state_json = None
+        new._attributes_json = (
+            self._attributes_json if new.attributes is self.attributes else None
+        )
+        return new
 
     def __hash__(self) -> int:
         """Make the state hashable.
@@ -1150,6 +1411,61 @@ class State:
             )
         return self._as_dict
 
+    def as_dict_json(self) -> bytes:
+        """Return a JSON representation of the State.
+
+        The JSON is generated once and shared by all consumers.
+        """
+        if self._as_dict_json is None:
+            self._as_dict_json = json_bytes(self.as_dict())
+        return self._as_dict_json
+
+    def as_compressed_state(self) -> ReadOnlyDict[str, Any]:
+        """Build a compressed dict of the State.
+
+        Omits the lu (last_updated) if it matches (lc) last_changed.
+
+        Sends c (context) as a string if it only contains an id.
+        """
+        if self._as_compressed_state is None:
+            context = self.context
+            compressed_context: dict[str, Any] | str
+            if context.parent_id is None and context.user_id is None:
+                compressed_context = context.id
+            else:
+                compressed_context = context.as_dict()
+            compressed_state: dict[str, Any] = {
+                COMPRESSED_STATE_STATE: self.state,
+                COMPRESSED_STATE_ATTRIBUTES: self.attributes,
+                COMPRESSED_STATE_CONTEXT: compressed_context,
+                COMPRESSED_STATE_LAST_CHANGED: self.last_changed.timestamp(),
+            }
+            if self.last_changed != self.last_updated:
+                compressed_state[
+                    COMPRESSED_STATE_LAST_UPDATED
+                ] = self.last_updated.timestamp()
+            self._as_compressed_state = ReadOnlyDict(compressed_state)
+        return self._as_compressed_state
+
+    def as_compressed_state_json(self) -> bytes:
+        """Return a JSON representation of the compressed State.
+
+        The JSON is generated once and shared by all consumers.
+        """
+        if self._as_compressed_state_json is None:
+            self._as_compressed_state_json = json_bytes(self.as_compressed_state())
+        return self._as_compressed_state_json
+
+    def attributes_json(self) -> bytes:
+        """Return a JSON representation of the attributes.
+
+        The JSON is generated once and shared by all consumers. States that
+        keep the attributes of the previous state also keep its JSON.
+        """
+        if self._attributes_json is None:
+            self._attributes_json = json_bytes(self.attributes)
+        return self._attributes_json
+
     @classmethod
     def from_dict(cls: type[_StateT], json_dict: dict[str, Any]) -> _StateT | None:
         """Initialize a state from a dict.
@@ -1197,8 +1513,8 @@ class State:
         since it can never be garbage collected as each event would
         reference the previous one.
         """
-        self.context = Context(
-            self.context.user_id, self.context.parent_id, self.context.id
+        self.context = (
+            self.context._copy_without_origin()  # pylint: disable=protected-access
         )
 
     def __eq__(self, other: Any) -> bool:
@@ -1227,6 +1543,8 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
+        # Domain -> entity_id -> State, to answer domain queries without a scan
+        self._domain_index: dict[str, dict[str, State]] = {}
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -1250,12 +1568,12 @@ class StateMachine:
             return list(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), ()))
 
         return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
+            entity_id
+            for domain_states in self._domain_states(domain_filter)
+            for entity_id in domain_states
         ]
 
     @callback
@@ -1270,10 +1588,10 @@ class StateMachine:
             return len(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return len(self._domain_index.get(domain_filter.lower(), ()))
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        return sum(
+            len(domain_states) for domain_states in self._domain_states(domain_filter)
         )
 
     def all(self, domain_filter: str | Iterable[str] | None = None) -> list[State]:
@@ -1294,10 +1612,23 @@ class StateMachine:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            if (domain_states := self._domain_index.get(domain_filter.lower())) is None:
+                return []
+            return list(domain_states.values())
+
+        return [
+            state
+            for domain_states in self._domain_states(domain_filter)
+            for state in domain_states.values()
+        ]
 
+    @callback
+    def _domain_states(self, domains: Iterable[str]) -> list[dict[str, State]]:
+        """Return the states indexed for each of the domains."""
         return [
-            state for state in self._states.values() if state.domain in domain_filter
+            domain_states
+            for domain in dict.fromkeys(domains)
+            if (domain_states := self._domain_index.get(domain)) is not None
         ]
 
     def get(self, entity_id: str) -> State | None:
@@ -1341,6 +1672,11 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+
         old_state.expire()
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
@@ -1434,19 +1770,22 @@ class StateMachine:
         now = dt_util.utcnow()
 
         if context is None:
-            context = Context(id=ulid_util.ulid(dt_util.utc_to_timestamp(now)))
-        state = State(
-            entity_id,
-            new_state,
-            attributes,
-            last_changed,
-            now,
-            context,
-            old_state is None,
-        )
-        if old_state is not None:
+            context = Context()
+        if old_state is None:
+            state = State(entity_id, new_state, attributes, None, now, context)
+        else:
+            state = old_state._async_evolve(  # pylint: disable=protected-access
+                new_state,
+                old_state.attributes if same_attr else attributes,
+                last_changed or now,
+                now,
+                context,
+            )
             old_state.expire()
         self._states[entity_id] = state
+        if (domain_states := self._domain_index.get(state.domain)) is None:
+            domain_states = self._domain_index[state.domain] = {}
+        domain_states[entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -51,6 +51,16 @@ class _DeviceIndex(NamedTuple):
     connections: dict[tuple[str, str], str]
 
 
+class _DeviceAttrIndex(NamedTuple):
+    """Registered device ids by area and config entry.
+
+    The device ids are kept in dicts to preserve the insertion order.
+    """
+
+    area_id: dict[str, dict[str, None]]
+    config_entry_id: dict[str, dict[str, None]]
+
+
 class DeviceEntryDisabler(StrEnum):
     """What disabled a device entry."""
 
@@ -127,6 +137,38 @@ class DeletedDeviceEntry:
         )
 
 
+def _device_to_storage_dict(entry: DeviceEntry) -> dict[str, Any]:
+    """Return the dict of a device to store in a file."""
+    return {
+        "config_entries": list(entry.config_entries),
+        "connections": list(entry.connections),
+        "identifiers": list(entry.identifiers),
+        "manufacturer": entry.manufacturer,
+        "model": entry.model,
+        "name": entry.name,
+        "sw_version": entry.sw_version,
+        "hw_version": entry.hw_version,
+        "entry_type": entry.entry_type,
+        "id": entry.id,
+        "via_device_id": entry.via_device_id,
+        "area_id": entry.area_id,
+        "name_by_user": entry.name_by_user,
+        "disabled_by": entry.disabled_by,
+        "configuration_url": entry.configuration_url,
+    }
+
+
+def _deleted_device_to_storage_dict(entry: DeletedDeviceEntry) -> dict[str, Any]:
+    """Return the dict of a deleted device to store in a file."""
+    return {
+        "config_entries": list(entry.config_entries),
+        "connections": list(entry.connections),
+        "identifiers": list(entry.identifiers),
+        "id": entry.id,
+        "orphaned_timestamp": entry.orphaned_timestamp,
+    }
+
+
 def format_mac(mac: str) -> str:
     """Format the mac address string for entry into dev reg."""
     to_test = mac
@@ -215,6 +257,7 @@ class DeviceRegistry:
     deleted_devices: dict[str, DeletedDeviceEntry]
     _registered_index: _DeviceIndex
     _deleted_index: _DeviceIndex
+    _attr_index: _DeviceAttrIndex
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the device registry."""
@@ -226,6 +269,10 @@ class DeviceRegistry:
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
         )
+        self._stored_devices = storage.StoredRecords(_device_to_storage_dict)
+        self._stored_deleted_devices = storage.StoredRecords(
+            _deleted_device_to_storage_dict
+        )
         self._clear_index()
 
     @callback
@@ -268,6 +315,7 @@ class DeviceRegistry:
         else:
             devices_index = self._registered_index
             self.devices[device.id] = device
+            _add_device_to_attr_index(self._attr_index, device)
 
         _add_device_to_index(devices_index, device)
 
@@ -279,6 +327,7 @@ class DeviceRegistry:
         else:
             devices_index = self._registered_index
             self.devices.pop(device.id)
+            _remove_device_from_attr_index(self._attr_index, device)
 
         _remove_device_from_index(devices_index, device)
 
@@ -289,17 +338,25 @@ class DeviceRegistry:
         devices_index = self._registered_index
         _remove_device_from_index(devices_index, old_device)
         _add_device_to_index(devices_index, new_device)
+        if (
+            old_device.area_id != new_device.area_id
+            or old_device.config_entries != new_device.config_entries
+        ):
+            _remove_device_from_attr_index(self._attr_index, old_device)
+            _add_device_to_attr_index(self._attr_index, new_device)
 
     def _clear_index(self) -> None:
         """Clear the index."""
         self._registered_index = _DeviceIndex(identifiers={}, connections={})
         self._deleted_index = _DeviceIndex(identifiers={}, connections={})
+        self._attr_index = _DeviceAttrIndex(area_id={}, config_entry_id={})
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
         self._clear_index()
         for device in self.devices.values():
             _add_device_to_index(self._registered_index, device)
+            _add_device_to_attr_index(self._attr_index, device)
         for deleted_device in self.deleted_devices.values():
             _add_device_to_index(self._deleted_index, deleted_device)
 
@@ -618,36 +675,10 @@ class DeviceRegistry:
         """Return data of device registry to store in a file."""
         data = {}
 
-        data["devices"] = [
-            {
-                "config_entries": list(entry.config_entries),
-                "connections": list(entry.connections),
-                "identifiers": list(entry.identifiers),
-                "manufacturer": entry.manufacturer,
-                "model": entry.model,
-                "name": entry.name,
-                "sw_version": entry.sw_version,
-                "hw_version": entry.hw_version,
-                "entry_type": entry.entry_type,
-                "id": entry.id,
-                "via_device_id": entry.via_device_id,
-                "area_id": entry.area_id,
-                "name_by_user": entry.name_by_user,
-                "disabled_by": entry.disabled_by,
-                "configuration_url": entry.configuration_url,
-            }
-            for entry in self.devices.values()
-        ]
-        data["deleted_devices"] = [
-            {
-                "config_entries": list(entry.config_entries),
-                "connections": list(entry.connections),
-                "identifiers": list(entry.identifiers),
-                "id": entry.id,
-                "orphaned_timestamp": entry.orphaned_timestamp,
-            }
-            for entry in self.deleted_devices.values()
-        ]
+        data["devices"] = self._stored_devices.as_list(self.devices)
+        data["deleted_devices"] = self._stored_deleted_devices.as_list(
+            self.deleted_devices
+        )
 
         return data
 
@@ -696,9 +727,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self.async_update_device(dev_id, area_id=None)
+        for device in async_entries_for_area(self, area_id):
+            self.async_update_device(device.id, area_id=None)
 
 
 @callback
@@ -729,7 +759,10 @@ async def async_get_registry(hass: HomeAssistant) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    attr_index = registry._attr_index  # pylint: disable=protected-access
+    return [
+        registry.devices[device_id] for device_id in attr_index.area_id.get(area_id, ())
+    ]
 
 
 @callback
@@ -737,10 +770,10 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
+    attr_index = registry._attr_index  # pylint: disable=protected-access
     return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
+        registry.devices[device_id]
+        for device_id in attr_index.config_entry_id.get(config_entry_id, ())
     ]
 
 
@@ -902,3 +935,29 @@ def _remove_device_from_index(
     for connection in device.connections:
         if connection in devices_index.connections:
             del devices_index.connections[connection]
+
+
+def _add_device_to_attr_index(
+    attr_index: _DeviceAttrIndex, device: DeviceEntry
+) -> None:
+    """Add a registered device to the area and config entry index."""
+    if device.area_id is not None:
+        attr_index.area_id.setdefault(device.area_id, {})[device.id] = None
+    for config_entry_id in device.config_entries:
+        attr_index.config_entry_id.setdefault(config_entry_id, {})[device.id] = None
+
+
+def _remove_device_from_attr_index(
+    attr_index: _DeviceAttrIndex, device: DeviceEntry
+) -> None:
+    """Remove a registered device from the area and config entry index."""
+    for index, keys in (
+        (attr_index.area_id, () if device.area_id is None else (device.area_id,)),
+        (attr_index.config_entry_id, device.config_entries),
+    ):
+        for key in keys:
+            if (device_ids := index.get(key)) is None:
+                continue
+            device_ids.pop(device.id, None)
+            if not device_ids:
+                del index[key]
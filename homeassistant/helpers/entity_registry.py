@@ -166,6 +166,32 @@ class RegistryEntry:
         hass.states.async_set(self.entity_id, STATE_UNAVAILABLE, attrs)
 
 
+def _entry_to_storage_dict(entry: RegistryEntry) -> dict[str, Any]:
+    """Return the dict of an entry to store in a file."""
+    return {
+        "area_id": entry.area_id,
+        "capabilities": entry.capabilities,
+        "config_entry_id": entry.config_entry_id,
+        "device_class": entry.device_class,
+        "device_id": entry.device_id,
+        "disabled_by": entry.disabled_by,
+        "entity_category": entry.entity_category,
+        "entity_id": entry.entity_id,
+        "hidden_by": entry.hidden_by,
+        "icon": entry.icon,
+        "id": entry.id,
+        "name": entry.name,
+        "options": entry.options,
+        "original_device_class": entry.original_device_class,
+        "original_icon": entry.original_icon,
+        "original_name": entry.original_name,
+        "platform": entry.platform,
+        "supported_features": entry.supported_features,
+        "unique_id": entry.unique_id,
+        "unit_of_measurement": entry.unit_of_measurement,
+    }
+
+
 class EntityRegistryStore(storage.Store):
     """Store entity registry data."""
 
@@ -179,9 +205,12 @@ class EntityRegistryStore(storage.Store):
 class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entry
+    - device_id -> entity_ids
+    - area_id -> entity_ids
+    - config_entry_id -> entity_ids
     """
 
     def __init__(self) -> None:
@@ -189,22 +218,51 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        # The entity_ids are kept in dicts to preserve the insertion order
+        self._device_id_index: dict[str, dict[str, None]] = {}
+        self._area_id_index: dict[str, dict[str, None]] = {}
+        self._config_entry_id_index: dict[str, dict[str, None]] = {}
 
     def __setitem__(self, key: str, entry: RegistryEntry) -> None:
         """Add an item."""
-        if key in self:
-            old_entry = self[key]
+        old_entry = self.get(key)
+        if old_entry is not None:
             del self._entry_ids[old_entry.id]
             del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
         super().__setitem__(key, entry)
         self._entry_ids.__setitem__(entry.id, entry)
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        for index, old_value, value in (
+            (
+                self._device_id_index,
+                old_entry and old_entry.device_id,
+                entry.device_id,
+            ),
+            (self._area_id_index, old_entry and old_entry.area_id, entry.area_id),
+            (
+                self._config_entry_id_index,
+                old_entry and old_entry.config_entry_id,
+                entry.config_entry_id,
+            ),
+        ):
+            if old_value == value:
+                continue
+            if old_value is not None:
+                _remove_from_index(index, old_value, key)
+            if value is not None:
+                index.setdefault(value, {})[key] = None
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         self._entry_ids.__delitem__(entry.id)
         self._index.__delitem__((entry.domain, entry.platform, entry.unique_id))
+        if entry.device_id is not None:
+            _remove_from_index(self._device_id_index, entry.device_id, key)
+        if entry.area_id is not None:
+            _remove_from_index(self._area_id_index, entry.area_id, key)
+        if entry.config_entry_id is not None:
+            _remove_from_index(self._config_entry_id_index, entry.config_entry_id, key)
         super().__delitem__(key)
 
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
@@ -215,6 +273,31 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         """Get entry from id."""
         return self._entry_ids.get(key)
 
+    def get_entries_for_device_id(self, device_id: str) -> list[RegistryEntry]:
+        """Get entries for device."""
+        return [self.data[key] for key in self._device_id_index.get(device_id, ())]
+
+    def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for area."""
+        return [self.data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for config entry."""
+        return [
+            self.data[key]
+            for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
+
+def _remove_from_index(index: dict[str, dict[str, None]], value: str, key: str) -> None:
+    """Remove a key from a secondary index."""
+    keys = index[value]
+    del keys[key]
+    if not keys:
+        del index[value]
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -231,6 +314,7 @@ class EntityRegistry:
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
         )
+        self._stored_entities = storage.StoredRecords(_entry_to_storage_dict)
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
         )
@@ -765,50 +849,21 @@ class EntityRegistry:
         """Return data of entity registry to store in a file."""
         data: dict[str, Any] = {}
 
-        data["entities"] = [
-            {
-                "area_id": entry.area_id,
-                "capabilities": entry.capabilities,
-                "config_entry_id": entry.config_entry_id,
-                "device_class": entry.device_class,
-                "device_id": entry.device_id,
-                "disabled_by": entry.disabled_by,
-                "entity_category": entry.entity_category,
-                "entity_id": entry.entity_id,
-                "hidden_by": entry.hidden_by,
-                "icon": entry.icon,
-                "id": entry.id,
-                "name": entry.name,
-                "options": entry.options,
-                "original_device_class": entry.original_device_class,
-                "original_icon": entry.original_icon,
-                "original_name": entry.original_name,
-                "platform": entry.platform,
-                "supported_features": entry.supported_features,
-                "unique_id": entry.unique_id,
-                "unit_of_measurement": entry.unit_of_measurement,
-            }
-            for entry in self.entities.values()
-        ]
+        data["entities"] = self._stored_entities.as_list(self.entities)
 
         return data
 
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
-            self.async_remove(entity_id)
+        for entry in self.entities.get_entries_for_config_entry_id(config_entry):
+            self.async_remove(entry.entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self.async_update_entity(entity_id, area_id=None)
+        for entry in self.entities.get_entries_for_area_id(area_id):
+            self.async_update_entity(entry.entity_id, area_id=None)
 
 
 @callback
@@ -843,9 +898,8 @@ def async_entries_for_device(
     """Return entries that match a device."""
     return [
         entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+        for entry in registry.entities.get_entries_for_device_id(device_id)
+        if not entry.disabled_by or include_disabled_entities
     ]
 
 
@@ -854,7 +908,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.entities.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -862,11 +916,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -54,6 +54,8 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TRACK_TEMPLATE_ROUTER = "track_template_router"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -91,6 +93,18 @@ class TrackTemplate:
     rate_limit: timedelta | None = None
 
 
+@dataclass
+class TemplateRenderStats:
+    """Class for keeping track of the renders of a tracked template.
+
+    renders: Number of times the template was rendered
+    render_time: Total time spent rendering the template in seconds
+    """
+
+    renders: int = 0
+    render_time: float = 0.0
+
+
 @dataclass
 class TrackTemplateResult:
     """Class for result of template tracking.
@@ -709,6 +723,188 @@ def async_track_state_change_filtered(
     return tracker
 
 
+class _TemplateStateRouter:
+    """Route state changes to the tracked templates that depend on them.
+
+    All template trackers share a single state_changed listener and the
+    entity and domain multimaps of the templates to re-render, so a state
+    change is only checked against the templates that depend on it. The
+    templates of a tracker that are triggered by the same event are
+    re-rendered together in a single refresh.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the router."""
+        self.hass = hass
+        self._track_states: dict[
+            _TrackTemplateResultInfo, dict[Template, TrackStates]
+        ] = {}
+        self._all: dict[_TrackTemplateResultInfo, set[Template]] = {}
+        self._entities: dict[str, dict[_TrackTemplateResultInfo, set[Template]]] = {}
+        self._domains: dict[str, dict[_TrackTemplateResultInfo, set[Template]]] = {}
+        self._listener: CALLBACK_TYPE | None = None
+
+    @property
+    def trackers(self) -> Iterable[_TrackTemplateResultInfo]:
+        """Return the template trackers."""
+        return self._track_states
+
+    @callback
+    def async_update(
+        self,
+        tracker: _TrackTemplateResultInfo,
+        track_states: dict[Template, TrackStates],
+    ) -> None:
+        """Update the state changes that re-render the templates of a tracker."""
+        last_track_states = self._track_states.get(tracker, {})
+        self._track_states[tracker] = track_states
+
+        for template in last_track_states.keys() | track_states.keys():
+            last = last_track_states.get(template)
+            new = track_states.get(template)
+            if last == new:
+                continue
+            if last is not None:
+                self._unindex(tracker, template, last)
+            if new is not None:
+                self._index(tracker, template, new)
+
+        self._async_update_listener()
+
+    @callback
+    def async_remove(self, tracker: _TrackTemplateResultInfo) -> None:
+        """Remove a tracker."""
+        for template, track_states in self._track_states.pop(tracker, {}).items():
+            self._unindex(tracker, template, track_states)
+
+        self._async_update_listener()
+
+    def _index(
+        self,
+        tracker: _TrackTemplateResultInfo,
+        template: Template,
+        track_states: TrackStates,
+    ) -> None:
+        if track_states.all_states:
+            self._all.setdefault(tracker, set()).add(template)
+            return
+
+        for entity_id in track_states.entities:
+            self._entities.setdefault(entity_id, {}).setdefault(tracker, set()).add(
+                template
+            )
+        for domain in track_states.domains:
+            self._domains.setdefault(domain, {}).setdefault(tracker, set()).add(
+                template
+            )
+
+    def _unindex(
+        self,
+        tracker: _TrackTemplateResultInfo,
+        template: Template,
+        track_states: TrackStates,
+    ) -> None:
+        if track_states.all_states:
+            _discard_tracked_template(self._all, tracker, template)
+            return
+
+        for entity_id in track_states.entities:
+            _discard_tracked_template(self._entities[entity_id], tracker, template)
+            if not self._entities[entity_id]:
+                del self._entities[entity_id]
+        for domain in track_states.domains:
+            _discard_tracked_template(self._domains[domain], tracker, template)
+            if not self._domains[domain]:
+                del self._domains[domain]
+
+    @callback
+    def _async_update_listener(self) -> None:
+        """Listen to state changes only while templates depend on them."""
+        if self._all or self._entities or self._domains:
+            if self._listener is None:
+                self._listener = self.hass.bus.async_listen(
+                    EVENT_STATE_CHANGED,
+                    self._async_dispatch,
+                    event_filter=self._async_filter,
+                )
+        elif self._listener is not None:
+            self._listener()
+            self._listener = None
+
+    @callback
+    def _async_filter(self, event: Event) -> bool:
+        """Filter state changes that no template depends on."""
+        entity_id: str = event.data[ATTR_ENTITY_ID]
+        return (
+            bool(self._all)
+            or entity_id in self._entities
+            or split_entity_id(entity_id)[0] in self._domains
+        )
+
+    @callback
+    def _async_dispatch(self, event: Event) -> None:
+        """Re-render the templates that depend on the state change."""
+        entity_id: str = event.data[ATTR_ENTITY_ID]
+        triggered: dict[_TrackTemplateResultInfo, set[Template]] = {}
+
+        for index in (
+            self._entities.get(entity_id),
+            self._domains.get(split_entity_id(entity_id)[0]),
+            self._all,
+        ):
+            if not index:
+                continue
+            for tracker, templates in index.items():
+                if tracker in triggered:
+                    triggered[tracker].update(templates)
+                else:
+                    triggered[tracker] = set(templates)
+
+        for tracker, templates in triggered.items():
+            # The tracker was removed while handling the event
+            if tracker not in self._track_states:
+                continue
+            try:
+                tracker.async_refresh_templates(event, templates)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while processing state change for %s", entity_id
+                )
+
+
+def _discard_tracked_template(
+    index: dict[_TrackTemplateResultInfo, set[Template]],
+    tracker: _TrackTemplateResultInfo,
+    template: Template,
+) -> None:
+    """Remove a template of a tracker from an index."""
+    templates = index[tracker]
+    templates.discard(template)
+    if not templates:
+        del index[tracker]
+
+
+@callback
+def _async_get_template_router(hass: HomeAssistant) -> _TemplateStateRouter:
+    """Return the template state router."""
+    if (router := hass.data.get(TRACK_TEMPLATE_ROUTER)) is None:
+        router = hass.data[TRACK_TEMPLATE_ROUTER] = _TemplateStateRouter(hass)
+    return cast(_TemplateStateRouter, router)
+
+
+@callback
+@bind_hass
+def async_get_template_render_stats(
+    hass: HomeAssistant,
+) -> list[tuple[Template, TemplateRenderStats]]:
+    """Return the render statistics of the tracked templates."""
+    return [
+        (template, stats)
+        for tracker in _async_get_template_router(hass).trackers
+        for template, stats in tracker.render_stats.items()
+    ]
+
+
 @callback
 @bind_hass
 def async_track_template(
@@ -821,8 +1017,10 @@ class _TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
-        self._track_state_changes: _TrackStateChangeFiltered | None = None
+        self._router = _async_get_template_router(hass)
+        self._last_track_states = TrackStates(False, set(), set())
         self._time_listeners: dict[Template, Callable[[], None]] = {}
+        self.render_stats: dict[Template, TemplateRenderStats] = {}
 
     def async_setup(self, raise_on_template_error: bool, strict: bool = False) -> None:
         """Activation of template tracking."""
@@ -833,8 +1031,8 @@ class _TrackTemplateResultInfo:
         if super_template is not None:
             template = super_template.template
             variables = super_template.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict
+            self._info[template] = info = self._render_to_info(
+                template, variables, strict=strict
             )
 
             # If the super template did not render to True, don't update other templates
@@ -854,8 +1052,8 @@ class _TrackTemplateResultInfo:
                 continue
             template = track_template_.template
             variables = track_template_.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict
+            self._info[template] = info = self._render_to_info(
+                template, variables, strict=strict
             )
 
             if info.exception:
@@ -867,9 +1065,7 @@ class _TrackTemplateResultInfo:
                     exc_info=info.exception,
                 )
 
-        self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
-        )
+        self._update_track_states()
         self._update_time_listeners()
         _LOGGER.debug(
             "Template group %s listens for %s, first render blocker by super template: %s",
@@ -881,12 +1077,43 @@ class _TrackTemplateResultInfo:
     @property
     def listeners(self) -> dict[str, bool | set[str]]:
         """State changes that will cause a re-render."""
-        assert self._track_state_changes
+        track_states = self._last_track_states
         return {
-            **self._track_state_changes.listeners,
+            _ALL_LISTENER: track_states.all_states,
+            _ENTITIES_LISTENER: track_states.entities,
+            _DOMAINS_LISTENER: track_states.domains,
             "time": bool(self._time_listeners),
         }
 
+    def _render_to_info(
+        self, template: Template, variables: TemplateVarsType, strict: bool = False
+    ) -> RenderInfo:
+        """Render the template to info and count the render."""
+        start = time.perf_counter()
+        info = template.async_render_to_info(variables, strict=strict)
+        stats = self.render_stats.setdefault(template, TemplateRenderStats())
+        stats.renders += 1
+        stats.render_time += time.perf_counter() - start
+        return info
+
+    @callback
+    def _update_track_states(self) -> None:
+        """Update the state changes that will cause a re-render."""
+        infos = {
+            template: _suppress_domain_all_in_render_info(info)
+            if self._rate_limit.async_has_timer(template)
+            else info
+            for template, info in self._info.items()
+        }
+        self._last_track_states = _render_infos_to_track_states(infos.values())
+        self._router.async_update(
+            self,
+            {
+                template: _render_infos_to_track_states((info,))
+                for template, info in infos.items()
+            },
+        )
+
     @callback
     def _setup_time_listener(self, template: Template, has_time: bool) -> None:
         if not has_time:
@@ -920,8 +1147,7 @@ class _TrackTemplateResultInfo:
     @callback
     def async_remove(self) -> None:
         """Cancel the listener."""
-        assert self._track_state_changes
-        self._track_state_changes.async_remove()
+        self._router.async_remove(self)
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
@@ -931,6 +1157,18 @@ class _TrackTemplateResultInfo:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def async_refresh_templates(self, event: Event, templates: set[Template]) -> None:
+        """Recalculate the templates that depend on the state change event."""
+        self._refresh(
+            event,
+            track_templates=[
+                track_template_
+                for track_template_ in self._track_templates
+                if track_template_.template in templates
+            ],
+        )
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
@@ -975,8 +1213,8 @@ class _TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
+        self._info[template] = info = self._render_to_info(
+            template, track_template_.variables
         )
 
         try:
@@ -1082,17 +1320,7 @@ class _TrackTemplateResultInfo:
                 info_changed |= _apply_update(update, track_template_.template)
 
         if info_changed:
-            assert self._track_state_changes
-            self._track_state_changes.async_update_listeners(
-                _render_infos_to_track_states(
-                    [
-                        _suppress_domain_all_in_render_info(info)
-                        if self._rate_limit.async_has_timer(template)
-                        else info
-                        for template, info in self._info.items()
-                    ]
-                )
-            )
+            self._update_track_states()
             _LOGGER.debug(
                 "Template group %s listens for %s, re-render blocker by super template: %s",
                 self._track_templates,
@@ -1111,7 +1111,8 @@ _VarsType = Union[dict[str, Any], MappingProxyType]
 
 def _referenced_extract_ids(data: dict[str, Any], key: str, found: set[str]) -> None:
     """Extract referenced IDs."""
-    if not data:
+    # Service data can also be a template that renders to the data
+    if not data or not isinstance(data, dict):
         return
 
     item_ids = data.get(key)
@@ -1126,6 +1127,70 @@ def _referenced_extract_ids(data: dict[str, Any], key: str, found: set[str]) ->
             found.add(item_id)
 
 
+class ReferenceIndex:
+    """Reverse index from entities, devices and areas to their referrers.
+
+    Referrers, like automations or scripts, are added together with the
+    entities, devices and areas they reference and removed when they go
+    away, so looking up what references an item only costs the size of
+    the result.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._referenced: dict[str, tuple[set[str], set[str], set[str]]] = {}
+        self._entities: dict[str, set[str]] = {}
+        self._devices: dict[str, set[str]] = {}
+        self._areas: dict[str, set[str]] = {}
+
+    @callback
+    def async_add(
+        self,
+        referrer: str,
+        entities: set[str],
+        devices: set[str],
+        areas: set[str],
+    ) -> None:
+        """Add or replace the references of a referrer."""
+        self.async_remove(referrer)
+        referenced = (set(entities), set(devices), set(areas))
+        self._referenced[referrer] = referenced
+        for index, item_ids in zip(
+            (self._entities, self._devices, self._areas), referenced
+        ):
+            for item_id in item_ids:
+                index.setdefault(item_id, set()).add(referrer)
+
+    @callback
+    def async_remove(self, referrer: str) -> None:
+        """Remove the references of a referrer."""
+        if (referenced := self._referenced.pop(referrer, None)) is None:
+            return
+        for index, item_ids in zip(
+            (self._entities, self._devices, self._areas), referenced
+        ):
+            for item_id in item_ids:
+                referrers = index[item_id]
+                referrers.discard(referrer)
+                if not referrers:
+                    del index[item_id]
+
+    @callback
+    def referencing_entity(self, entity_id: str) -> list[str]:
+        """Return the referrers that reference the entity."""
+        return list(self._entities.get(entity_id, ()))
+
+    @callback
+    def referencing_device(self, device_id: str) -> list[str]:
+        """Return the referrers that reference the device."""
+        return list(self._devices.get(device_id, ()))
+
+    @callback
+    def referencing_area(self, area_id: str) -> list[str]:
+        """Return the referrers that reference the area."""
+        return list(self._areas.get(area_id, ()))
+
+
 class _ChooseData(TypedDict):
     choices: list[tuple[list[ConditionCheckerType], Script]]
     default: Script | None
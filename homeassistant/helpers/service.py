@@ -367,14 +367,25 @@ def async_extract_referenced_entity_ids(
 
     # Find devices for targeted areas
     selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
+    for area_id in selector.area_ids:
+        for device_entry in device_registry.async_entries_for_area(dev_reg, area_id):
             selected.referenced_devices.add(device_entry.id)
 
     if not selector.area_ids and not selected.referenced_devices:
         return selected
 
-    for ent_entry in ent_reg.entities.values():
+    # Only the entities of the targeted areas and the referenced devices can match
+    candidates: dict[str, entity_registry.RegistryEntry] = {}
+    for area_id in selector.area_ids:
+        for ent_entry in entity_registry.async_entries_for_area(ent_reg, area_id):
+            candidates[ent_entry.entity_id] = ent_entry
+    for device_id in selected.referenced_devices:
+        for ent_entry in entity_registry.async_entries_for_device(
+            ent_reg, device_id, include_disabled_entities=True
+        ):
+            candidates[ent_entry.entity_id] = ent_entry
+
+    for ent_entry in candidates.values():
         # Do not add entities which are hidden or which are config or diagnostic entities
         if ent_entry.entity_category is not None or ent_entry.hidden_by is not None:
             continue
@@ -2,14 +2,14 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from contextlib import suppress
 from copy import deepcopy
 import inspect
 from json import JSONEncoder
 import logging
 import os
-from typing import Any
+from typing import Any, Generic, TypeVar
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
@@ -24,6 +24,8 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
 
+_RecordT = TypeVar("_RecordT")
+
 
 @bind_hass
 async def async_migrator(
@@ -65,6 +67,37 @@ async def async_migrator(
     return config
 
 
+class StoredRecords(Generic[_RecordT]):
+    """Cache the stored representation of immutable records.
+
+    Registries keep their entries as frozen objects that are replaced
+    when they change. Only the records that are not the same object as
+    at the previous save are converted to a dict again. Every save still
+    walks all records on the event loop to find them, and the whole file
+    is still encoded and written in the executor.
+
+    The returned dicts are shared between saves and must not be mutated.
+    """
+
+    def __init__(self, to_dict: Callable[[_RecordT], dict[str, Any]]) -> None:
+        """Initialize the cache."""
+        self._to_dict = to_dict
+        self._cache: dict[str, tuple[_RecordT, dict[str, Any]]] = {}
+
+    def as_list(self, records: Mapping[str, _RecordT]) -> list[dict[str, Any]]:
+        """Return the stored representation of the records."""
+        cache = self._cache
+        new_cache: dict[str, tuple[_RecordT, dict[str, Any]]] = {}
+        stored: list[dict[str, Any]] = []
+        for key, record in records.items():
+            if (cached := cache.get(key)) is None or cached[0] is not record:
+                cached = (record, self._to_dict(record))
+            new_cache[key] = cached
+            stored.append(cached[1])
+        self._cache = new_cache
+        return stored
+
+
 @bind_hass
 class Store:
     """Class to help storing data."""
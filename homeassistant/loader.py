@@ -7,13 +7,15 @@ documentation as possible to keep it understandable.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from contextlib import suppress
 import functools as ft
 import importlib
 import logging
 import pathlib
+import stat
 import sys
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, TypeVar, cast
 
@@ -30,7 +32,6 @@ from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .helpers.json import JSON_DECODE_EXCEPTIONS, json_loads
-from .util.async_ import gather_with_concurrency
 
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
@@ -43,6 +44,8 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_CACHE = "integration_manifest_cache"
+DATA_IMPORT_TIMES = "integration_import_times"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -56,6 +59,10 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+MANIFEST_CACHE_STORAGE_KEY = "core.integration_manifests"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 10
+
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
 
@@ -109,6 +116,92 @@ class Manifest(TypedDict, total=False):
     loggers: list[str]
 
 
+class _ManifestReader:
+    """Read manifest.json files, reusing the cached ones that did not change.
+
+    A cached manifest is only used when the size and modification time of
+    the file still match, so reading an unchanged manifest costs a stat.
+    Runs in the executor, the manifests that were parsed are collected in
+    updated so they can be added to the cache on the event loop.
+    """
+
+    def __init__(self, cached: dict[str, list[Any]]) -> None:
+        """Initialize the reader."""
+        self._cached = cached
+        self.updated: dict[str, list[Any]] = {}
+
+    def read(self, manifest_path: pathlib.Path) -> Manifest | None:
+        """Return the manifest or None if there is no manifest file."""
+        try:
+            file_stat = manifest_path.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+
+        key = str(manifest_path)
+        if (cached := self._cached.get(key)) is not None and cached[:2] == [
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+        ]:
+            return cast(Manifest, dict(cached[2]))
+
+        manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+        self.updated[key] = [file_stat.st_mtime_ns, file_stat.st_size, manifest]
+        return cast(Manifest, dict(manifest))
+
+
+class _ManifestCache:
+    """Parsed manifest.json files persisted in storage between restarts."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manifest cache."""
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        self._store = Store(
+            hass, MANIFEST_CACHE_STORAGE_VERSION, MANIFEST_CACHE_STORAGE_KEY
+        )
+        self.manifests: dict[str, list[Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the cached manifests."""
+        if (data := await self._store.async_load()) is not None:
+            self.manifests = cast(dict[str, Any], data)["manifests"]
+
+    def async_update(self, updated: dict[str, list[Any]]) -> None:
+        """Add the manifests that were parsed again to the cache."""
+        if not updated:
+            return
+        self.manifests.update(updated)
+        self._store.async_delay_save(self._data_to_save, MANIFEST_CACHE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {"manifests": self.manifests}
+
+
+async def async_load_manifest_cache(hass: HomeAssistant) -> None:
+    """Load the persisted manifests used when resolving integrations."""
+    if DATA_MANIFEST_CACHE in hass.data:
+        return
+    manifest_cache = _ManifestCache(hass)
+    await manifest_cache.async_load()
+    hass.data[DATA_MANIFEST_CACHE] = manifest_cache
+
+
+def _async_manifest_reader(hass: HomeAssistant) -> _ManifestReader:
+    """Return a manifest reader backed by the persisted manifests."""
+    manifest_cache: _ManifestCache | None = hass.data.get(DATA_MANIFEST_CACHE)
+    return _ManifestReader(manifest_cache.manifests if manifest_cache else {})
+
+
+def _async_store_manifests(hass: HomeAssistant, manifests: _ManifestReader) -> None:
+    """Persist the manifests that a reader had to parse."""
+    if (manifest_cache := hass.data.get(DATA_MANIFEST_CACHE)) is not None:
+        manifest_cache.async_update(manifests.updated)
+
+
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     """Generate a manifest from a legacy module."""
     return {
@@ -132,34 +225,26 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
-
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
-    )
-
-    integrations = await gather_with_concurrency(
-        MAX_LOAD_CONCURRENTLY,
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
-            )
-            for comp in dirs
-        ),
+    manifests = _async_manifest_reader(hass)
+
+    def resolve_custom_components(paths: list[str]) -> dict[str, Integration]:
+        """Resolve the integrations in all sub directories of a set of paths."""
+        integrations: dict[str, Integration] = {}
+        for path in paths:
+            for entry in pathlib.Path(path).iterdir():
+                if entry.is_dir() and (
+                    integration := Integration.resolve_from_root(
+                        hass, custom_components, entry.name, manifests
+                    )
+                ):
+                    integrations[integration.domain] = integration
+        return integrations
+
+    integrations = await hass.async_add_executor_job(
+        resolve_custom_components, custom_components.__path__
     )
-
-    return {
-        integration.domain: integration
-        for integration in integrations
-        if integration is not None
-    }
+    _async_store_manifests(hass, manifests)
+    return integrations
 
 
 async def async_get_custom_components(
@@ -356,23 +441,30 @@ class Integration:
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        manifests: _ManifestReader | None = None,
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        if manifests is None:
+            manifests = _ManifestReader({})
+
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = json_loads(manifest_path.read_text())
+                manifest = manifests.read(manifest_path)
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
                 )
                 continue
 
+            if manifest is None:
+                continue
+
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
@@ -596,7 +688,7 @@ class Integration:
             return cache[self.domain]
 
         try:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            cache[self.domain] = self._import_module(self.pkg_path)
         except ImportError:
             raise
         except Exception as err:
@@ -632,7 +724,59 @@ class Integration:
 
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return self._import_module(f"{self.pkg_path}.{platform_name}")
+
+    def _import_module(self, name: str) -> ModuleType:
+        """Import a module of the integration and record how long it took."""
+        start = timer()
+        try:
+            return importlib.import_module(name)
+        finally:
+            # Imports also run in the executor so the time is recorded in
+            # the event loop that reads them, unless it is already closed
+            with suppress(RuntimeError):
+                self.hass.loop.call_soon_threadsafe(
+                    self._async_record_import_time, timer() - start
+                )
+
+    def _async_record_import_time(self, seconds: float) -> None:
+        """Add the time an import took to the import time of the integration."""
+        import_times: dict[str, float] = self.hass.data.setdefault(
+            DATA_IMPORT_TIMES, {}
+        )
+        import_times[self.domain] = import_times.get(self.domain, 0) + seconds
+
+    def preimport(self, platform_names: Iterable[str]) -> None:
+        """Import the component and the platforms it has ahead of the setup.
+
+        Runs in the executor. The imported modules end up in sys.modules
+        so the setup finds them already loaded. Errors are ignored, the
+        setup reports them when it imports the module again.
+        """
+        cache: dict[str, ModuleType] = self.hass.data.get(DATA_COMPONENTS, {})
+        if self.domain in cache:
+            return
+
+        try:
+            self._import_module(self.pkg_path)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.debug("Unable to pre-import %s", self.pkg_path, exc_info=True)
+            return
+
+        available = {
+            entry.name.removesuffix(".py") for entry in self.file_path.iterdir()
+        }
+        for platform_name in platform_names:
+            if (
+                platform_name not in available
+                or f"{self.domain}.{platform_name}" in cache
+            ):
+                continue
+            name = f"{self.pkg_path}.{platform_name}"
+            try:
+                self._import_module(name)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.debug("Unable to pre-import %s", name, exc_info=True)
 
     def __repr__(self) -> str:
         """Text representation of class."""
@@ -641,57 +785,146 @@ class Integration:
 
 async def async_get_integration(hass: HomeAssistant, domain: str) -> Integration:
     """Get an integration."""
-    if (cache := hass.data.get(DATA_INTEGRATIONS)) is None:
-        if not _async_mount_config_dir(hass):
-            raise IntegrationNotFound(domain)
-        cache = hass.data[DATA_INTEGRATIONS] = {}
+    int_or_exc = (await async_get_integrations(hass, [domain]))[domain]
+    if isinstance(int_or_exc, Exception):
+        raise int_or_exc
+    return int_or_exc
 
-    int_or_evt: Integration | asyncio.Event | None = cache.get(domain, _UNDEF)
 
-    if isinstance(int_or_evt, asyncio.Event):
-        await int_or_evt.wait()
+async def async_get_integrations(
+    hass: HomeAssistant, domains: Iterable[str], *, with_dependencies: bool = False
+) -> dict[str, Integration | Exception]:
+    """Get integrations, resolving the ones not loaded yet in one executor job.
 
-        # When we have waited and it's _UNDEF, it doesn't exist
-        # We don't cache that it doesn't exist, or else people can't fix it
-        # and then restart, because their config will never be valid.
-        if (int_or_evt := cache.get(domain, _UNDEF)) is _UNDEF:
-            raise IntegrationNotFound(domain)
+    With with_dependencies the integrations they depend on, and the ones
+    those depend on, are resolved in the same job and added to the cache.
+    """
+    if (cache := hass.data.get(DATA_INTEGRATIONS)) is None:
+        if not _async_mount_config_dir(hass):
+            return {domain: IntegrationNotFound(domain) for domain in domains}
+        cache = hass.data[DATA_INTEGRATIONS] = {}
 
-    if int_or_evt is not _UNDEF:
-        return cast(Integration, int_or_evt)
+    results: dict[str, Integration | Exception] = {}
+    needed: dict[str, asyncio.Event] = {}
+    in_progress: dict[str, asyncio.Event] = {}
+    for domain in domains:
+        int_or_evt: Integration | asyncio.Event | None = cache.get(domain, _UNDEF)
+        if isinstance(int_or_evt, asyncio.Event):
+            in_progress[domain] = int_or_evt
+        elif int_or_evt is not _UNDEF:
+            results[domain] = cast(Integration, int_or_evt)
+        elif "." in domain:
+            results[domain] = ValueError(f"Invalid domain {domain}")
+        else:
+            needed[domain] = cache[domain] = asyncio.Event()
+
+    if in_progress:
+        await asyncio.gather(*(event.wait() for event in in_progress.values()))
+        for domain in in_progress:
+            # When we have waited and it's _UNDEF, it doesn't exist
+            # We don't cache that it doesn't exist, or else people can't fix it
+            # and then restart, because their config will never be valid.
+            if (int_or_evt := cache.get(domain, _UNDEF)) is _UNDEF:
+                results[domain] = IntegrationNotFound(domain)
+            else:
+                results[domain] = cast(Integration, int_or_evt)
 
-    event = cache[domain] = asyncio.Event()
+    if not needed:
+        return results
 
     try:
-        integration = await _async_get_integration(hass, domain)
+        # Instead of using resolve_from_root we use the cache of custom
+        # components to find the integration.
+        custom = await async_get_custom_components(hass)
+        manifests = _async_manifest_reader(hass)
+        resolved: dict[
+            str, Integration | Exception
+        ] = await hass.async_add_executor_job(
+            _resolve_integrations,
+            hass,
+            list(needed),
+            custom,
+            set(cache),
+            manifests,
+            with_dependencies,
+        )
     except Exception:
-        # Remove event from cache.
-        cache.pop(domain)
-        event.set()
+        # Remove events from cache.
+        for domain, event in needed.items():
+            cache.pop(domain)
+            event.set()
         raise
 
-    cache[domain] = integration
-    event.set()
-    return integration
+    _async_store_manifests(hass, manifests)
+
+    for domain, event in needed.items():
+        int_or_exc = resolved.pop(domain, None)
+        if isinstance(int_or_exc, Integration):
+            cache[domain] = results[domain] = int_or_exc
+        else:
+            cache.pop(domain)
+            results[domain] = int_or_exc or IntegrationNotFound(domain)
+        event.set()
 
+    # Dependencies that were resolved along the way
+    for domain, int_or_exc in resolved.items():
+        if isinstance(int_or_exc, Integration):
+            cache.setdefault(domain, int_or_exc)
 
-async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integration:
-    if "." in domain:
-        raise ValueError(f"Invalid domain {domain}")
+    return results
 
-    # Instead of using resolve_from_root we use the cache of custom
-    # components to find the integration.
-    if integration := (await async_get_custom_components(hass)).get(domain):
-        return integration
 
+def _resolve_integrations(
+    hass: HomeAssistant,
+    domains: list[str],
+    custom: dict[str, Integration],
+    known: set[str],
+    manifests: _ManifestReader,
+    with_dependencies: bool,
+) -> dict[str, Integration | Exception]:
+    """Resolve integrations and optionally the integrations they depend on.
+
+    An error resolving one domain is returned for that domain
+    instead of failing the others.
+
+    Runs in the executor.
+    """
     from . import components  # pylint: disable=import-outside-toplevel
 
-    if integration := await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    ):
-        return integration
-
-    raise IntegrationNotFound(domain)
+    resolved: dict[str, Integration | Exception] = {}
+    attempted = set(domains)
+    to_resolve = domains
+    while to_resolve:
+        found: list[Integration] = []
+        for domain in to_resolve:
+            if (integration := custom.get(domain)) is None:
+                try:
+                    integration = Integration.resolve_from_root(
+                        hass, components, domain, manifests
+                    )
+                except Exception as err:  # pylint: disable=broad-except
+                    resolved[domain] = err
+                    continue
+            if integration is not None:
+                resolved[domain] = integration
+                found.append(integration)
+
+        if not with_dependencies:
+            break
+
+        to_resolve = list(
+            {
+                dependency: None
+                for integration in found
+                for dependency in integration.dependencies
+                if dependency not in known
+                and dependency not in attempted
+                and "." not in dependency
+            }
+        )
+        attempted.update(to_resolve)
+
+    return resolved
 
 
 class LoaderError(Exception):
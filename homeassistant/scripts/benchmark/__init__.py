@@ -8,6 +8,7 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+import sys
 from timeit import default_timer as timer
 from typing import TypeVar
 
@@ -19,6 +20,8 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+import homeassistant.util.dt as dt_util
+import homeassistant.util.ulid as ulid_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -120,6 +123,71 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_10k_filtered_listeners(hass):
+    """Fire 10k events to 10k listeners that filter on entity_id."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**4
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(10**4):
+        entity_id = f"light.kitchen{idx}"
+
+        @core.callback
+        def event_filter(event, entity_id=entity_id):
+            """Filter event."""
+            return event.data["entity_id"] == entity_id
+
+        hass.bus.async_listen(event_name, listener, event_filter=event_filter)
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(event_name, {"entity_id": f"light.kitchen{idx % 10**4}"})
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def fire_events_10k_keyed_listeners(hass):
+    """Fire 10k events to 10k listeners keyed by entity_id."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**4
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(10**4):
+        hass.bus.async_listen_keyed(
+            event_name, "entity_id", (f"light.kitchen{idx}",), listener
+        )
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(event_name, {"entity_id": f"light.kitchen{idx % 10**4}"})
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -298,6 +366,78 @@ async def valid_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def state_machine_domain_queries(hass):
+    """Run 10k domain queries against a state machine with 20k states."""
+    domains = [f"domain{idx}" for idx in range(100)]
+    for idx in range(2 * 10**4):
+        hass.states.async_set(f"{domains[idx % 100]}.entity{idx}", "on")
+
+    start = timer()
+
+    for idx in range(10**4):
+        domain = domains[idx % 100]
+        hass.states.async_entity_ids(domain)
+        hass.states.async_entity_ids_count(domain)
+        hass.states.async_all(domain)
+
+    return timer() - start
+
+
+@benchmark
+async def state_machine_updates(hass):
+    """Run 100k state and attribute updates through the state machine."""
+    entity_ids = [f"sensor.entity{idx}" for idx in range(1000)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "0", {"unit_of_measurement": "W"})
+
+    # Keep the new states alive so their allocations can be counted
+    states = []
+    blocks = sys.getallocatedblocks()
+    start = timer()
+
+    for idx in range(10**5):
+        entity_id = entity_ids[idx % 1000]
+        # Alternate between state changes and attribute only changes
+        hass.states.async_set(
+            entity_id, str(idx // 2000), {"unit_of_measurement": "W", "value": idx}
+        )
+        states.append(hass.states.get(entity_id))
+
+    runtime = timer() - start
+    print(f"Allocated blocks per state: {(sys.getallocatedblocks() - blocks) / 10**5}")
+    return runtime
+
+
+@benchmark
+async def state_full_construction(hass):
+    """Build 100k states with validation and an eager context id.
+
+    This is the path every state update used to take and serves as the
+    baseline for state_machine_updates.
+    """
+    states = []
+    blocks = sys.getallocatedblocks()
+    start = timer()
+
+    for idx in range(10**5):
+        now = dt_util.utcnow()
+        states.append(
+            core.State(
+                f"sensor.entity{idx % 1000}",
+                str(idx // 2000),
+                {"unit_of_measurement": "W", "value": idx},
+                None,
+                now,
+                core.Context(id=ulid_util.ulid(dt_util.utc_to_timestamp(now))),
+            )
+        )
+
+    runtime = timer() - start
+    print(f"Allocated blocks per state: {(sys.getallocatedblocks() - blocks) / 10**5}")
+    return runtime
+
+
 @benchmark
 async def json_serialize_states(hass):
     """Serialize million states with websocket default encoder."""
@@ -311,6 +451,212 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def mqtt_topic_dispatch(hass):
+    """Match 100k topics against a growing number of MQTT subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    topics_to_match = 10**5
+    job = core.HassJob(lambda msg: None)
+    trie = SubscriptionTrie()
+    # The trie also holds a wildcard subscription for every 100 literal ones
+    literal_count = 0
+    total = 0.0
+
+    for subscription_count in (100, 1000, 4000, 10000):
+        for idx in range(literal_count, subscription_count):
+            trie.add(Subscription(f"homeassistant/sensor/node{idx}/state", job))
+            if idx % 100 == 0:
+                trie.add(Subscription(f"homeassistant/+/node{idx}/#", job))
+        literal_count = subscription_count
+
+        topics = [
+            f"homeassistant/sensor/node{idx % subscription_count}/state"
+            for idx in range(topics_to_match)
+        ]
+        start = timer()
+        for topic in topics:
+            trie.matching_subscriptions(topic)
+        runtime = timer() - start
+        total += runtime
+        print(
+            f"{literal_count} literal and {len(trie) - literal_count} "
+            f"wildcard subscriptions: {runtime}s"
+        )
+
+    return total
+
+
+@benchmark
+async def websocket_states_snapshot(hass):
+    """Measure how long get_states blocks the event loop as entities grow."""
+    # pylint: disable=import-outside-toplevel
+    from types import SimpleNamespace
+
+    from homeassistant.auth.models import User
+    from homeassistant.components.websocket_api import commands
+    from homeassistant.components.websocket_api.connection import ActiveConnection
+
+    user = User(name="benchmark", perm_lookup=None, is_owner=True, is_active=True)
+    total = 0.0
+
+    for entity_count in (1000, 5000, 15000):
+        for idx in range(entity_count):
+            hass.states.async_set(
+                f"sensor.entity{idx}",
+                str(entity_count),
+                {"unit_of_measurement": "W", "friendly_name": f"Sensor {idx}"},
+            )
+
+        for label in ("uncached", "cached"):
+            sent = asyncio.Event()
+            connection = ActiveConnection(
+                logging.getLogger(__name__),
+                hass,
+                lambda msg: sent.set(),  # pylint: disable=cell-var-from-loop
+                user,
+                SimpleNamespace(id="benchmark"),
+            )
+            max_block = 0.0
+            start = timer()
+            commands.handle_get_states(hass, connection, {"id": 1})
+            while not sent.is_set():
+                tick = timer()
+                await asyncio.sleep(0)
+                max_block = max(max_block, timer() - tick)
+            runtime = timer() - start
+            total += runtime
+            print(
+                f"{entity_count} entities {label}: {runtime}s, "
+                f"longest loop block {max_block}s"
+            )
+
+    return total
+
+
+@benchmark
+async def recorder_sqlite_throughput(hass):
+    """Write 50k state changes to SQLite with the ORM and bulk insert paths."""
+    # pylint: disable=import-outside-toplevel
+    from tempfile import TemporaryDirectory
+
+    from homeassistant.components.recorder import Recorder
+
+    events = []
+    for idx in range(50000):
+        entity_id = f"sensor.entity{idx % 300}"
+        new_state = core.State(
+            entity_id,
+            str(idx // 300),
+            {"unit_of_measurement": "W", "friendly_name": f"Sensor {idx % 30}"},
+        )
+        events.append(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {"entity_id": entity_id, "old_state": None, "new_state": new_state},
+            )
+        )
+
+    def _record(instance):
+        # pylint: disable=protected-access
+        instance._setup_connection()
+        instance._open_event_session()
+        start = timer()
+        # Commit every 300 state changes, one per second at 300/s
+        for idx, event in enumerate(events, 1):
+            instance._process_one_event(event)
+            if idx % 300 == 0:
+                instance._commit_event_session_or_retry()
+        instance._commit_event_session_or_retry()
+        runtime = timer() - start
+        instance._close_event_session()
+        instance._close_connection()
+        return runtime
+
+    total = 0.0
+    for bulk_insert in (False, True):
+        with TemporaryDirectory() as tmp_dir:
+            instance = Recorder(
+                hass,
+                auto_purge=False,
+                auto_repack=False,
+                keep_days=1,
+                commit_interval=1,
+                uri=f"sqlite:///{tmp_dir}/benchmark.db",
+                db_max_retries=1,
+                db_retry_wait=1,
+                entity_filter=lambda entity_id: True,
+                exclude_t=[],
+                exclude_attributes_by_domain={},
+                bulk_insert=bulk_insert,
+            )
+            # The database pool only hands out connections to the db workers
+            instance.async_start_executor()
+            runtime = await instance.async_add_executor_job(_record, instance)
+            # pylint: disable-next=protected-access
+            await hass.async_add_executor_job(instance._stop_executor)
+        total += runtime
+        label = "bulk insert" if bulk_insert else "orm"
+        print(f"{label}: {runtime}s, {len(events) / runtime:.0f} states/s")
+
+    return total
+
+
+@benchmark
+async def registry_area_targets(hass):
+    """Resolve 1000 area targeted service calls with 12k entities and 3k devices."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+        service,
+    )
+
+    area_reg = hass.data[ar.DATA_REGISTRY] = ar.AreaRegistry(hass)
+    dev_reg = hass.data[dr.DATA_REGISTRY] = dr.DeviceRegistry(hass)
+    ent_reg = hass.data[er.DATA_REGISTRY] = er.EntityRegistry(hass)
+
+    area_ids = [f"area{idx}" for idx in range(100)]
+    for area_id in area_ids:
+        area_reg.areas[area_id] = ar.AreaEntry(
+            name=area_id, normalized_name=area_id, id=area_id
+        )
+    dev_reg.devices = {}
+    dev_reg.deleted_devices = {}
+    for idx in range(3000):
+        device = dr.DeviceEntry(
+            area_id=area_ids[idx % 100],
+            config_entries={f"entry{idx % 50}"},
+            identifiers={("benchmark", str(idx))},
+            id=f"device{idx}",
+        )
+        dev_reg.devices[device.id] = device
+    # pylint: disable-next=protected-access
+    dev_reg._rebuild_index()
+    ent_reg.entities = er.EntityRegistryItems()
+    for idx in range(12000):
+        entity_id = f"sensor.entity{idx}"
+        ent_reg.entities[entity_id] = er.RegistryEntry(
+            entity_id,
+            str(idx),
+            "benchmark",
+            device_id=f"device{idx % 3000}",
+            config_entry_id=f"entry{idx % 50}",
+        )
+
+    calls = [
+        core.ServiceCall("light", "turn_on", {"area_id": [area_ids[idx % 100]]})
+        for idx in range(1000)
+    ]
+
+    start = timer()
+    for call in calls:
+        service.async_extract_referenced_entity_ids(hass, call, expand_group=False)
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
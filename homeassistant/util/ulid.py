@@ -35,9 +35,17 @@ def ulid(timestamp: float | None = None) -> str:
     import ulid
     ulid.parse(ulid_util.ulid())
     """
-    ulid_bytes = int((timestamp or time.time()) * 1000).to_bytes(
-        6, byteorder="big"
-    ) + int(getrandbits(80)).to_bytes(10, byteorder="big")
+    return ulid_encode(int((timestamp or time.time()) * 1000) << 80 | getrandbits(80))
+
+
+def ulid_encode(value: int) -> str:
+    """Encode a ULID from its 128 bit integer value.
+
+    The upper 48 bits are the millisecond timestamp and the lower 80 bits
+    the randomness. This allows the value to be captured cheaply up front
+    and the string to be built only when it is actually needed.
+    """
+    ulid_bytes = value.to_bytes(16, byteorder="big")
 
     # This is base32 crockford encoding with the loop unrolled for performance
     #
@@ -1,5 +1,6 @@
 """The tests for the automation component."""
 import asyncio
+from copy import deepcopy
 from datetime import timedelta
 import logging
 from unittest.mock import Mock, patch
@@ -595,6 +596,69 @@ async def test_reload_config_service(hass, calls, hass_admin_user, hass_read_onl
     assert calls[1].data.get("event") == "test_event2"
 
 
+async def test_reload_only_changed_automations(hass, calls):
+    """Test reloading only recreates the automations that changed."""
+    config = {
+        automation.DOMAIN: [
+            {
+                "id": "unchanged",
+                "alias": "unchanged",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"service": "test.automation"},
+            },
+            {
+                "id": "changed",
+                "alias": "changed",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"service": "test.automation"},
+            },
+            {
+                "alias": "removed",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"service": "test.automation"},
+            },
+        ]
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+    component = hass.data[automation.DOMAIN]
+    unchanged = component.get_entity("automation.unchanged")
+    changed = component.get_entity("automation.changed")
+    assert hass.states.get("automation.removed") is not None
+
+    new_config = deepcopy(config)
+    new_config[automation.DOMAIN][1]["trigger"]["event_type"] = "test_event2"
+    del new_config[automation.DOMAIN][2]
+    new_config[automation.DOMAIN].append(
+        {
+            "alias": "added",
+            "trigger": {"platform": "event", "event_type": "test_event2"},
+            "action": {"service": "test.automation"},
+        }
+    )
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=new_config,
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert component.get_entity("automation.unchanged") is unchanged
+    assert component.get_entity("automation.changed") is not changed
+    assert hass.states.get("automation.removed") is None
+    assert hass.states.get("automation.added") is not None
+    listeners = hass.bus.async_listeners()
+    assert listeners.get("test_event") == 1
+    assert listeners.get("test_event2") == 2
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    hass.bus.async_fire("test_event2")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+
 async def test_reload_config_when_invalid_config(hass, calls):
     """Test the reload config service handling invalid config."""
     with assert_setup_component(1, automation.DOMAIN):
@@ -671,7 +735,9 @@ async def test_reload_config_handles_load_fails(hass, calls):
     assert len(calls) == 2
 
 
-@pytest.mark.parametrize("service", ["turn_off_stop", "turn_off_no_stop", "reload"])
+@pytest.mark.parametrize(
+    "service", ["turn_off_stop", "turn_off_no_stop", "reload", "reload_unchanged"]
+)
 async def test_automation_stops(hass, calls, service):
     """Test that turning off / reloading stops any running actions as appropriate."""
     entity_id = "automation.hello"
@@ -717,6 +783,9 @@ async def test_automation_stops(hass, calls, service):
             blocking=True,
         )
     else:
+        if service == "reload":
+            config = deepcopy(config)
+            config[automation.DOMAIN]["alias"] = "goodbye"
         with patch(
             "homeassistant.config.load_yaml_config_file",
             autospec=True,
@@ -729,7 +798,9 @@ async def test_automation_stops(hass, calls, service):
     hass.states.async_set(test_entity, "goodbye")
     await hass.async_block_till_done()
 
-    assert len(calls) == (1 if service == "turn_off_no_stop" else 0)
+    assert len(calls) == (
+        1 if service in ("turn_off_no_stop", "reload_unchanged") else 0
+    )
 
 
 async def test_automation_restore_state(hass):
@@ -1216,6 +1287,16 @@ async def test_extraction_functions(hass):
         "device-trigger-tag3",
     }
 
+    await hass.data[automation.DOMAIN].async_remove_entity("automation.test1")
+
+    assert automation.automations_with_entity(hass, "light.in_both") == [
+        "automation.test2"
+    ]
+    assert automation.automations_with_entity(hass, "light.in_first") == []
+    assert automation.automations_with_device(hass, "device-in-both") == [
+        "automation.test2"
+    ]
+
 
 async def test_logbook_humanify_automation_triggered_event(hass):
     """Test humanifying Automation Trigger event."""
@@ -8,8 +8,13 @@ from unittest.mock import AsyncMock, Mock, PropertyMock, mock_open, patch
 import pytest
 
 from homeassistant.components import camera
-from homeassistant.components.camera.const import DOMAIN, PREF_PRELOAD_STREAM
+from homeassistant.components.camera.const import (
+    DATA_STILL_STREAMS,
+    DOMAIN,
+    PREF_PRELOAD_STREAM,
+)
 from homeassistant.components.camera.prefs import CameraEntityPreferences
+from homeassistant.components.http import KEY_HASS
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import (
@@ -176,6 +181,100 @@ async def test_get_image_from_camera_not_jpeg(hass, image_mock_url):
     assert image.content == b"png"
 
 
+async def test_get_image_shares_fetches(hass, image_mock_url):
+    """Test concurrent requests share one fetch and recent images are reused."""
+    fetched = asyncio.Event()
+    release = asyncio.Event()
+    calls = 0
+
+    async def mock_camera_image(width=None, height=None):
+        nonlocal calls
+        calls += 1
+        fetched.set()
+        await release.wait()
+        return f"image {calls}".encode()
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=mock_camera_image,
+    ), patch("homeassistant.components.camera.monotonic", return_value=100):
+        first = hass.async_create_task(
+            camera.async_get_image(hass, "camera.demo_camera")
+        )
+        await fetched.wait()
+        second = hass.async_create_task(
+            camera.async_get_image(hass, "camera.demo_camera")
+        )
+        await asyncio.sleep(0)
+        release.set()
+        assert (await first).content == b"image 1"
+        assert (await second).content == b"image 1"
+        assert calls == 1
+
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"image 1"
+        assert calls == 1
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=mock_camera_image,
+    ), patch("homeassistant.components.camera.monotonic", return_value=101):
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+    assert image.content == b"image 2"
+
+
+async def test_get_image_scales_shared_frame(hass, image_mock_url):
+    """Test requests for different sizes scale the same frame once per size."""
+    calls = 0
+
+    async def mock_camera_image(width=None, height=None):
+        nonlocal calls
+        calls += 1
+        return b"Valid jpeg"
+
+    turbo_jpeg = mock_turbo_jpeg(
+        first_width=16, first_height=12, second_width=300, second_height=200
+    )
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+        return_value=turbo_jpeg,
+    ), patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=mock_camera_image,
+    ), patch(
+        "homeassistant.components.camera.monotonic", return_value=100
+    ):
+        images = await asyncio.gather(
+            camera.async_get_image(hass, "camera.demo_camera", width=4, height=3),
+            camera.async_get_image(hass, "camera.demo_camera", width=4, height=3),
+            camera.async_get_image(hass, "camera.demo_camera", width=8, height=6),
+            camera.async_get_image(hass, "camera.demo_camera"),
+        )
+
+    assert calls == 1
+    assert images[0].content == EMPTY_8_6_JPEG
+    assert images[1].content == EMPTY_8_6_JPEG
+    assert images[2].content == EMPTY_8_6_JPEG
+    assert images[3].content == b"Valid jpeg"
+    assert turbo_jpeg.scale_with_quality.call_count == 2
+
+
+async def test_get_image_failure_not_cached(hass, image_mock_url):
+    """Test a failed fetch is not shared with later requests."""
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=None,
+    ), pytest.raises(HomeAssistantError):
+        await camera.async_get_image(hass, "camera.demo_camera")
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ):
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+    assert image.content == b"Test"
+
+
 async def test_get_stream_source_from_camera(hass, mock_camera, mock_stream_source):
     """Fetch stream source from camera entity."""
 
@@ -474,6 +573,94 @@ async def test_camera_proxy_stream(hass, mock_camera, hass_client):
         assert response.status == HTTPStatus.BAD_GATEWAY
 
 
+def _mock_request(hass):
+    """Return a mock request of the Home Assistant HTTP app."""
+    return Mock(app={KEY_HASS: hass})
+
+
+def _mock_stream_response():
+    """Return a mock streaming response that records the written chunks."""
+    response = Mock(prepare=AsyncMock(), written=[])
+    response.write = AsyncMock(side_effect=response.written.append)
+    return response
+
+
+async def test_still_stream_shared_by_viewers(hass):
+    """Test viewers of a still image stream share the image fetches."""
+    images = [b"one", b"one", b"two", None]
+    calls = 0
+    started = asyncio.Event()
+
+    async def image_cb():
+        nonlocal calls
+        calls += 1
+        await started.wait()
+        return images.pop(0)
+
+    responses = [_mock_stream_response(), _mock_stream_response()]
+    with patch(
+        "homeassistant.components.camera.web.StreamResponse",
+        side_effect=responses,
+    ):
+        viewers = [
+            hass.async_create_task(
+                camera.async_get_still_stream(
+                    _mock_request(hass), image_cb, "image/jpeg", 0
+                )
+            )
+            for _ in responses
+        ]
+        await asyncio.sleep(0)
+        started.set()
+        await asyncio.gather(*viewers)
+
+    assert calls == 4
+    for response in responses:
+        assert response.written[0] == response.written[1]
+        assert b"one" in response.written[0]
+        assert b"two" in response.written[-1]
+    assert not hass.data[DATA_STILL_STREAMS]
+
+
+async def test_still_stream_stops_without_viewers(hass):
+    """Test images are no longer fetched when the last viewer leaves."""
+    calls = 0
+
+    async def image_cb():
+        nonlocal calls
+        calls += 1
+        return b"image"
+
+    with patch(
+        "homeassistant.components.camera.web.StreamResponse",
+        return_value=_mock_stream_response(),
+    ):
+        viewer = hass.async_create_task(
+            camera.async_get_still_stream(
+                _mock_request(hass), image_cb, "image/jpeg", 0.01
+            )
+        )
+        await asyncio.sleep(0.05)
+        assert calls > 0
+        viewer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await viewer
+
+    assert not hass.data[DATA_STILL_STREAMS]
+    calls_after_leaving = calls
+    await asyncio.sleep(0.05)
+    assert calls == calls_after_leaving
+
+
+def test_still_stream_slow_viewer_skips_images():
+    """Test a viewer that did not write the last image only gets the newest."""
+    queue = asyncio.Queue(maxsize=1)
+    camera._put_latest(queue, b"one")
+    camera._put_latest(queue, b"two")
+    assert queue.get_nowait() == b"two"
+    assert queue.empty()
+
+
 async def test_websocket_web_rtc_offer(
     hass,
     hass_ws_client,
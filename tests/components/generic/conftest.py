@@ -1,6 +1,7 @@
 """Test fixtures for the generic component."""
 
 from io import BytesIO
+from itertools import count
 from unittest.mock import AsyncMock, Mock, patch
 
 from PIL import Image
@@ -13,6 +14,15 @@ from homeassistant.components.generic.const import DOMAIN
 from tests.common import MockConfigEntry
 
 
+@pytest.fixture(autouse=True)
+def no_camera_image_reuse():
+    """Let every request fetch a new image, the tests count the fetches."""
+    with patch(
+        "homeassistant.components.camera.monotonic", side_effect=count(step=3600)
+    ):
+        yield
+
+
 @pytest.fixture(scope="package")
 def fakeimgbytes_png():
     """Fake image in RAM for testing."""
@@ -0,0 +1,76 @@
+"""Tests for downsampling the history."""
+from homeassistant.components.history.downsample import downsample_states, lttb_indices
+
+
+def test_lttb_indices():
+    """Test LTTB keeps the ends and the extremes."""
+    times = [float(idx) for idx in range(100)]
+    values = [0.0] * 100
+    values[40] = 10.0
+    values[70] = -10.0
+
+    assert lttb_indices(times, values, 200) == list(range(100))
+    assert lttb_indices(times, values, 2) == [0, 99]
+
+    kept = lttb_indices(times, values, 10)
+    assert len(kept) == 10
+    assert kept[0] == 0
+    assert kept[-1] == 99
+    assert 40 in kept
+    assert 70 in kept
+    assert kept == sorted(kept)
+
+
+def test_downsample_states():
+    """Test downsampling mixed numeric and categorical states."""
+    states = [{"s": "unavailable", "lu": 0.0}, {"s": "unavailable", "lu": 1.0}]
+    states += [{"s": str(idx % 7), "lu": float(idx)} for idx in range(2, 1000)]
+    states += [{"s": "unknown", "lu": 1000.0}, {"s": "unknown", "lu": 1001.0}]
+    states += [{"s": str(idx % 5), "lu": float(idx)} for idx in range(1002, 1500)]
+
+    def get_state(state):
+        return state["s"]
+
+    def get_time(state):
+        return state["lu"]
+
+    assert downsample_states(states, 2000, get_state, get_time) is states
+
+    downsampled = downsample_states(states, 50, get_state, get_time)
+    assert len(downsampled) <= 50
+    # Runs of the same categorical state are merged into their first state
+    assert [state["s"] for state in downsampled].count("unavailable") == 1
+    assert [state["s"] for state in downsampled].count("unknown") == 1
+    # The ends of each numeric run are kept
+    for state in (states[0], states[2], states[999], states[1000], states[1002]):
+        assert state in downsampled
+    assert downsampled[-1] is states[-1]
+    assert downsampled == sorted(downsampled, key=get_time)
+
+    categorical = [{"s": "on", "lu": float(idx)} for idx in range(10)]
+    assert downsample_states(categorical, 3, get_state, get_time) == [categorical[0]]
+
+
+def test_downsample_states_many_segments():
+    """Test the numeric runs between many categorical states share the budget."""
+    states = [{"s": str(idx % 7), "lu": float(idx)} for idx in range(1000)]
+    for segment in range(20):
+        start = 1000 + segment * 4
+        states.append({"s": "unavailable", "lu": float(start)})
+        states += [{"s": "1", "lu": float(start + idx)} for idx in range(1, 4)]
+
+    def get_state(state):
+        return state["s"]
+
+    def get_time(state):
+        return state["lu"]
+
+    downsampled = downsample_states(states, 100, get_state, get_time)
+    assert len(downsampled) <= 100
+    assert [state["s"] for state in downsampled].count("unavailable") == 20
+    # The ends of each numeric run are kept
+    assert states[0] in downsampled
+    assert states[999] in downsampled
+    for segment in range(20):
+        assert states[1000 + segment * 4 + 1] in downsampled
+        assert states[1000 + segment * 4 + 3] in downsampled
@@ -10,7 +10,11 @@ import pytest
 from pytest import approx
 
 from homeassistant.components import history
-from homeassistant.components.recorder.history import get_significant_states
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.history import (
+    get_numeric_history,
+    get_significant_states,
+)
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE
 import homeassistant.core as ha
@@ -1676,3 +1680,133 @@ async def test_history_during_period_with_use_include_order(
         *sort_order,
         "sensor.three",
     ]
+
+
+async def test_numeric_history_during_period(hass, hass_ws_client, recorder_mock):
+    """Test numeric_history_during_period."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "1")
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "unknown")
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "2.5")
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.other", "on")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/numeric_history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test", "sensor.other"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert list(response["result"]) == ["sensor.test"]
+
+    numeric_history = (
+        await get_instance(hass).async_add_executor_job(
+            get_numeric_history, hass, ["sensor.test"], now
+        )
+    )["sensor.test"]
+    timestamps = response["result"]["sensor.test"]["t"]
+    assert timestamps[0] == round(numeric_history.timestamps[0] * 1000)
+    assert timestamps[1] == round(numeric_history.timestamps[1] * 1000) - round(
+        numeric_history.timestamps[0] * 1000
+    )
+    assert response["result"]["sensor.test"]["v"] == [1.0, 2.5]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/numeric_history_during_period",
+            "start_time": now.isoformat(),
+            "end_time": "dogs",
+            "entity_ids": ["sensor.test"],
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_end_time"
+
+
+async def test_history_during_period_max_points(
+    hass, hass_ws_client, hass_client, recorder_mock
+):
+    """Test history is downsampled to max_points."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    # LTTB depends on the time between the states so space them evenly
+    for idx, value in enumerate((1, 5, 2, 2, 9, 3, 4, 1, 0, 6)):
+        with freeze_time(now + timedelta(seconds=idx + 1)):
+            hass.states.async_set("sensor.test", value)
+        await async_recorder_block_till_done(hass)
+    for idx, state in enumerate(("on", "off", "off", "on")):
+        with freeze_time(now + timedelta(seconds=idx + 1)):
+            hass.states.async_set("binary_sensor.test", state, {"any": state})
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test", "binary_sensor.test"],
+            "significant_changes_only": False,
+            "minimal_response": True,
+            "max_points": 3,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert [state["s"] for state in response["result"]["sensor.test"]] == [
+        "1",
+        "9",
+        "6",
+    ]
+    assert [state["s"] for state in response["result"]["binary_sensor.test"]] == [
+        "on",
+        "off",
+        "on",
+    ]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/numeric_history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "max_points": 3,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["sensor.test"]["v"] == [1.0, 9.0, 6.0]
+
+    http_client = await hass_client()
+    response = await http_client.get(
+        f"/api/history/period/{now.isoformat()}",
+        params={"filter_entity_id": "sensor.test", "max_points": 3},
+    )
+    assert response.status == HTTPStatus.OK
+    assert [state["state"] for state in (await response.json())[0]] == [
+        "1",
+        "9",
+        "6",
+    ]
+
+    response = await http_client.get(
+        f"/api/history/period/{now.isoformat()}",
+        params={"filter_entity_id": "sensor.test", "max_points": "1"},
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
@@ -6,7 +6,6 @@ from typing import Any
 
 from homeassistant.components import logbook
 from homeassistant.components.logbook import processor
-from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
 from homeassistant.core import Context
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.json import JSONEncoder
@@ -26,7 +25,7 @@ class MockRow:
         self.event_type = event_type
         self.shared_data = json.dumps(data, cls=JSONEncoder)
         self.data = data
-        self.time_fired = dt_util.utcnow()
+        self.time_fired_ts = dt_util.utc_to_timestamp(dt_util.utcnow())
         self.context_parent_id = context.parent_id if context else None
         self.context_user_id = context.user_id if context else None
         self.context_id = context.id if context else None
@@ -41,12 +40,12 @@ class MockRow:
     @property
     def time_fired_minute(self):
         """Minute the event was fired."""
-        return self.time_fired.minute
+        return dt_util.utc_from_timestamp(self.time_fired_ts).minute
 
     @property
     def time_fired_isoformat(self):
         """Time event was fired in utc isoformat."""
-        return process_timestamp_to_utc_isoformat(self.time_fired)
+        return dt_util.utc_from_timestamp(self.time_fired_ts).isoformat()
 
 
 def mock_humanify(hass_, rows):
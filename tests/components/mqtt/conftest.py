@@ -1,3 +1,14 @@
 """Test fixtures for mqtt component."""
+from unittest.mock import patch
+
+import pytest
+
 from tests.components.blueprint.conftest import stub_blueprint_populate  # noqa: F401
 from tests.components.light.conftest import mock_light_profiles  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def no_subscribe_cooldown():
+    """Send queued subscribes right away unless a test patches the cooldown."""
+    with patch("homeassistant.components.mqtt.client.SUBSCRIBE_COOLDOWN", 0):
+        yield
@@ -59,6 +59,13 @@ async def test_entry_diagnostics(
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
         "connected": True,
         "devices": [],
+        "message_statistics": {
+            "backlog": 0,
+            "batches": 0,
+            "max_backlog": 0,
+            "messages_per_second": 0.0,
+            "received": 0,
+        },
         "mqtt_config": default_config,
         "mqtt_debug_info": {"entities": [], "triggers": []},
     }
@@ -143,6 +150,13 @@ async def test_entry_diagnostics(
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
         "connected": True,
         "devices": [expected_device],
+        "message_statistics": {
+            "backlog": 0,
+            "batches": 0,
+            "max_backlog": 0,
+            "messages_per_second": 0.0,
+            "received": 2,
+        },
         "mqtt_config": default_config,
         "mqtt_debug_info": expected_debug_info,
     }
@@ -266,6 +280,7 @@ async def test_redact_diagnostics(
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
         "connected": True,
         "devices": [expected_device],
+        "message_statistics": ANY,
         "mqtt_config": expected_config,
         "mqtt_debug_info": expected_debug_info,
     }
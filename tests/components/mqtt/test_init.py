@@ -6,6 +6,7 @@ from functools import partial
 import json
 import logging
 import ssl
+import time
 from unittest.mock import ANY, AsyncMock, MagicMock, call, mock_open, patch
 
 import pytest
@@ -1085,6 +1086,81 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert calls[0][0].payload == "test-payload"
 
 
+async def test_subscribe_overlapping_wildcards(
+    hass, mqtt_mock_entry_no_yaml_config, calls, record_calls
+):
+    """Test a message is dispatched once to every matching subscription."""
+    await mqtt_mock_entry_no_yaml_config()
+    await mqtt.async_subscribe(hass, "test-topic/+/state", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    await mqtt.async_subscribe(hass, "+/+/+", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/bedroom/state", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/bedroom", record_calls)
+
+    async_fire_mqtt_message(hass, "test-topic/bedroom/state", "test-payload")
+
+    await hass.async_block_till_done()
+    assert sorted(call[0].subscribed_topic for call in calls) == [
+        "+/+/+",
+        "test-topic/#",
+        "test-topic/+/state",
+        "test-topic/bedroom/state",
+    ]
+
+
+async def test_subscribe_removal_keeps_other_filters(
+    hass, mqtt_mock_entry_no_yaml_config, calls, record_calls
+):
+    """Test removing a subscription does not affect filters sharing its path."""
+    await mqtt_mock_entry_no_yaml_config()
+    unsub_deep = await mqtt.async_subscribe(hass, "test-topic/a/b/c", record_calls)
+    unsub_wildcard = await mqtt.async_subscribe(hass, "test-topic/a/#", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/a", record_calls)
+
+    unsub_deep()
+    async_fire_mqtt_message(hass, "test-topic/a/b/c", "test-payload")
+    await hass.async_block_till_done()
+    assert [call[0].subscribed_topic for call in calls] == ["test-topic/a/#"]
+
+    calls.clear()
+    unsub_wildcard()
+    async_fire_mqtt_message(hass, "test-topic/a/b/c", "test-payload")
+    async_fire_mqtt_message(hass, "test-topic/a", "test-payload")
+    await hass.async_block_till_done()
+    assert [call[0].subscribed_topic for call in calls] == ["test-topic/a"]
+
+
+def test_subscription_trie():
+    """Test the subscription trie matches and prunes topic filters."""
+    trie = mqtt.client.SubscriptionTrie()
+    subscriptions = [
+        mqtt.client.Subscription(topic, ha.HassJob(lambda msg: None))
+        for topic in ("a/b", "a/+", "a/#", "#", "+/b", "$SYS/#", "a/b/c")
+    ]
+    for subscription in subscriptions:
+        trie.add(subscription)
+    assert len(trie) == 7
+
+    def matching(topic):
+        return sorted(sub.topic for sub in trie.matching_subscriptions(topic))
+
+    assert matching("a/b") == ["#", "+/b", "a/#", "a/+", "a/b"]
+    assert matching("a") == ["#", "a/#"]
+    assert matching("a/b/c") == ["#", "a/#", "a/b/c"]
+    assert matching("$SYS/broker") == ["$SYS/#"]
+    assert matching("$SYS") == ["$SYS/#"]
+    assert matching("b/c") == ["#"]
+
+    for subscription in subscriptions:
+        trie.remove(subscription)
+    assert len(trie) == 0
+    assert trie.matching_subscriptions("a/b") == []
+    assert not trie._root.children
+
+    with pytest.raises(ValueError):
+        trie.remove(subscriptions[0])
+
+
 async def test_subscribe_special_characters(
     hass, mqtt_mock_entry_no_yaml_config, calls, record_calls
 ):
@@ -1189,6 +1265,137 @@ async def test_unsubscribe_race(hass, mqtt_client_mock, mqtt_mock_entry_no_yaml_
     assert mqtt_client_mock.mock_calls in (expected_calls_1, expected_calls_2)
 
 
+async def test_subscribe_unsubscribe_batched(
+    hass, mqtt_client_mock, mqtt_mock_entry_no_yaml_config
+):
+    """Test concurrent subscribes and unsubscribes are sent in one packet."""
+    mqtt_mock = await mqtt_mock_entry_no_yaml_config()
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+    mqtt_client_mock.reset_mock()
+
+    unsubs = await asyncio.gather(
+        mqtt.async_subscribe(hass, "test/state1", None, qos=1),
+        mqtt.async_subscribe(hass, "test/state2", None),
+        mqtt.async_subscribe(hass, "test/state2", None, qos=2),
+        mqtt.async_subscribe(hass, "test/state3", None),
+    )
+    assert mqtt_client_mock.subscribe.mock_calls == [
+        call([("test/state1", 1), ("test/state2", 2), ("test/state3", 0)])
+    ]
+
+    for unsub in unsubs[:3]:
+        unsub()
+    await hass.async_block_till_done()
+    assert mqtt_client_mock.unsubscribe.call_count == 1
+    assert sorted(mqtt_client_mock.unsubscribe.call_args[0][0]) == [
+        "test/state1",
+        "test/state2",
+    ]
+
+
+async def test_subscribe_batch_error(
+    hass, mqtt_client_mock, mqtt_mock_entry_no_yaml_config
+):
+    """Test all subscribers of a failed batch get the error."""
+    mqtt_mock = await mqtt_mock_entry_no_yaml_config()
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+
+    # simulate client is not connected error when subscribing
+    mqtt_client_mock.subscribe.side_effect = lambda *args: (4, None)
+    results = await asyncio.gather(
+        mqtt.async_subscribe(hass, "test/state1", None),
+        mqtt.async_subscribe(hass, "test/state2", None),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, HomeAssistantError) for result in results)
+
+
+@patch("homeassistant.components.mqtt.client.SUBSCRIBE_COOLDOWN", 0.2)
+async def test_subscribes_in_cooldown_coalesced(
+    hass, mqtt_client_mock, mqtt_mock_entry_no_yaml_config
+):
+    """Test subscribes requested during the cooldown are sent in one packet."""
+    mqtt_mock = await mqtt_mock_entry_no_yaml_config()
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+    mqtt_client_mock.reset_mock()
+
+    tasks = []
+    for idx in range(3):
+        tasks.append(
+            hass.async_create_task(mqtt.async_subscribe(hass, f"test/state{idx}", None))
+        )
+        await asyncio.sleep(0.05)
+    assert mqtt_client_mock.subscribe.call_count == 0
+
+    await asyncio.gather(*tasks)
+    assert mqtt_client_mock.subscribe.mock_calls == [
+        call([("test/state0", 0), ("test/state1", 0), ("test/state2", 0)])
+    ]
+
+
+async def test_subscribe_batch_unexpected_error(
+    hass, mqtt_client_mock, mqtt_mock_entry_no_yaml_config
+):
+    """Test subscribers get unexpected errors of a batch instead of waiting."""
+    mqtt_mock = await mqtt_mock_entry_no_yaml_config()
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+
+    mqtt_client_mock.subscribe.side_effect = RuntimeError("Boom")
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            mqtt.async_subscribe(hass, "test/state1", None),
+            mqtt.async_subscribe(hass, "test/state2", None),
+            return_exceptions=True,
+        ),
+        5,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_subscribe_batch_cancel_one_subscriber(
+    hass, mqtt_client_mock, mqtt_mock_entry_no_yaml_config
+):
+    """Test cancelling one subscriber does not cancel the others of the batch."""
+    mqtt_mock = await mqtt_mock_entry_no_yaml_config()
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+    mqtt_client_mock.reset_mock()
+
+    cancelled = hass.async_create_task(mqtt.async_subscribe(hass, "test/state1", None))
+    other = hass.async_create_task(mqtt.async_subscribe(hass, "test/state2", None))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.wait_for(other, 5)
+    assert cancelled.cancelled()
+    assert mqtt_client_mock.subscribe.mock_calls == [
+        call([("test/state1", 0), ("test/state2", 0)])
+    ]
+
+
+@patch("homeassistant.components.mqtt.client.MAX_TOPICS_PER_PACKET", 2)
+async def test_subscribe_batch_split_in_packets(
+    hass, mqtt_client_mock, mqtt_mock_entry_no_yaml_config
+):
+    """Test a large batch of subscriptions is split over multiple packets."""
+    mqtt_mock = await mqtt_mock_entry_no_yaml_config()
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+    mqtt_client_mock.reset_mock()
+
+    await asyncio.gather(
+        *(mqtt.async_subscribe(hass, f"test/state{idx}", None) for idx in range(5))
+    )
+    assert mqtt_client_mock.subscribe.mock_calls == [
+        call([("test/state0", 0), ("test/state1", 0)]),
+        call([("test/state2", 0), ("test/state3", 0)]),
+        call("test/state4", 0),
+    ]
+
+
 @pytest.mark.parametrize(
     "mqtt_config",
     [{mqtt.CONF_BROKER: "mock-broker", mqtt.CONF_DISCOVERY: False}],
@@ -1341,6 +1548,100 @@ async def test_handle_message_callback(
     assert "Received message on some-topic: b'test-payload'" in caplog.text
 
 
+async def test_handle_message_batches(
+    hass, mqtt_mock_entry_no_yaml_config, mqtt_client_mock, calls, record_calls
+):
+    """Test messages from the network thread are handled in batches."""
+    mqtt_mock = await mqtt_mock_entry_no_yaml_config()
+    await mqtt.async_subscribe(hass, "some-topic/+", record_calls)
+
+    for idx in range(5):
+        mqtt_client_mock.on_message(
+            None, None, ReceiveMessage(f"some-topic/{idx}", b"test-payload", 0, False)
+        )
+    await hass.async_block_till_done()
+
+    assert [call[0].topic for call in calls] == [
+        f"some-topic/{idx}" for idx in range(5)
+    ]
+    statistics = mqtt_mock.async_get_message_statistics()
+    assert statistics["received"] == 5
+    assert statistics["batches"] == 1
+    assert statistics["max_backlog"] == 5
+    assert statistics["backlog"] == 0
+
+
+async def test_messages_per_second(
+    hass, mqtt_mock_entry_no_yaml_config, mqtt_client_mock, calls, record_calls
+):
+    """Test the message rate is calculated over the recent messages when read."""
+    mqtt_mock = await mqtt_mock_entry_no_yaml_config()
+    await mqtt.async_subscribe(hass, "some-topic", record_calls)
+
+    now = time.monotonic() + 100
+    with patch("homeassistant.components.mqtt.client.time", wraps=time) as mock_time:
+        mock_time.monotonic.return_value = now
+        for _ in range(20):
+            mqtt_client_mock.on_message(
+                None, None, ReceiveMessage("some-topic", b"test-payload", 0, False)
+            )
+        await hass.async_block_till_done()
+        assert len(calls) == 20
+
+        statistics = mqtt_mock.async_get_message_statistics()
+        assert statistics["messages_per_second"] == 2.0
+
+        # The messages count until they are older than the window,
+        # also when no new messages are handled in between
+        mock_time.monotonic.return_value = now + 5
+        statistics = mqtt_mock.async_get_message_statistics()
+        assert statistics["messages_per_second"] == 2.0
+        mock_time.monotonic.return_value = now + 11
+        statistics = mqtt_mock.async_get_message_statistics()
+        assert statistics["messages_per_second"] == 0.0
+
+
+@patch("homeassistant.components.mqtt.client.MAX_MESSAGES_PER_BATCH", 2)
+async def test_handle_message_large_backlog(
+    hass, mqtt_mock_entry_no_yaml_config, mqtt_client_mock, calls, record_calls
+):
+    """Test a large backlog of messages is spread over loop iterations."""
+    mqtt_mock = await mqtt_mock_entry_no_yaml_config()
+    await mqtt.async_subscribe(hass, "some-topic", record_calls)
+
+    for _ in range(5):
+        mqtt_client_mock.on_message(
+            None, None, ReceiveMessage("some-topic", b"test-payload", 0, False)
+        )
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    assert len(calls) == 5
+    statistics = mqtt_mock.async_get_message_statistics()
+    assert statistics["received"] == 5
+    assert statistics["batches"] == 3
+
+
+async def test_payload_decoded_once_per_encoding(
+    hass, mqtt_mock_entry_no_yaml_config, calls, record_calls
+):
+    """Test the payload is decoded once for all subscriptions of an encoding."""
+    await mqtt_mock_entry_no_yaml_config()
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls, encoding=None)
+
+    async_fire_mqtt_message(hass, "test-topic", "test-payload")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 3
+    payloads = [call[0].payload for call in calls]
+    decoded = [payload for payload in payloads if isinstance(payload, str)]
+    assert len(decoded) == 2
+    assert decoded[0] is decoded[1]
+    assert b"test-payload" in payloads
+
+
 async def test_setup_override_configuration(hass, caplog, tmp_path):
     """Test override setup from configuration entry."""
     calls_username_password_set = []
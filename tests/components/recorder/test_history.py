@@ -17,6 +17,7 @@ from homeassistant.components.recorder.db_schema import (
     RecorderRuns,
     StateAttributes,
     States,
+    StatesMeta,
 )
 from homeassistant.components.recorder.models import LazyState, process_timestamp
 from homeassistant.components.recorder.util import session_scope
@@ -74,15 +75,19 @@ def _add_db_entries(
                     event_data="{}",
                     origin="LOCAL",
                     time_fired=point,
+                    time_fired_ts=dt_util.utc_to_timestamp(point),
                 )
             )
             session.add(
                 States(
                     entity_id=entity_id,
+                    states_meta_rel=StatesMeta(entity_id=entity_id),
                     state="on",
                     attributes='{"name":"the light"}',
                     last_changed=None,
+                    last_changed_ts=None,
                     last_updated=point,
+                    last_updated_ts=dt_util.utc_to_timestamp(point),
                     event_id=1001 + idx,
                     attributes_id=1002 + idx,
                 )
@@ -327,6 +332,65 @@ def test_get_last_state_changes(hass_recorder):
     assert states == hist[entity_id]
 
 
+def test_get_numeric_history(hass_recorder):
+    """Test getting the numeric history of entities."""
+    hass = hass_recorder()
+
+    def set_state(entity_id, state, attributes=None):
+        """Set the state."""
+        hass.states.set(entity_id, state, attributes)
+        wait_recording_done(hass)
+        return hass.states.get(entity_id)
+
+    before = dt_util.utcnow()
+    start = before + timedelta(minutes=1)
+    point = start + timedelta(minutes=1)
+    end = point + timedelta(minutes=1)
+
+    with patch(
+        "homeassistant.components.recorder.core.dt_util.utcnow", return_value=before
+    ):
+        set_state("sensor.one", "1.5")
+        set_state("sensor.two", "unavailable")
+
+    with patch(
+        "homeassistant.components.recorder.core.dt_util.utcnow", return_value=point
+    ):
+        one = set_state("sensor.one", "2")
+        set_state("sensor.two", "nan")
+        two = set_state("sensor.two", "-3.25")
+        set_state("sensor.three", "on")
+
+    with patch(
+        "homeassistant.components.recorder.core.dt_util.utcnow",
+        return_value=point + timedelta(seconds=1),
+    ):
+        # Attribute changes do not add a value
+        set_state("sensor.one", "2", {"any": "attr"})
+
+    with patch(
+        "homeassistant.components.recorder.core.dt_util.utcnow", return_value=end
+    ):
+        set_state("sensor.one", "4")
+
+    hist = history.get_numeric_history(
+        hass, ["sensor.two", "sensor.one", "sensor.three"], start, end
+    )
+    assert list(hist) == ["sensor.two", "sensor.one"]
+    assert list(hist["sensor.one"].timestamps) == [
+        start.timestamp(),
+        one.last_updated.timestamp(),
+    ]
+    assert list(hist["sensor.one"].values) == [1.5, 2.0]
+    assert list(hist["sensor.two"].timestamps) == [two.last_updated.timestamp()]
+    assert list(hist["sensor.two"].values) == [-3.25]
+
+    hist = history.get_numeric_history(
+        hass, ["sensor.one"], start, include_start_time_state=False
+    )
+    assert list(hist["sensor.one"].values) == [2.0, 4.0]
+
+
 def test_ensure_state_can_be_copied(hass_recorder):
     """Ensure a state can pass though copy().
 
@@ -796,6 +860,53 @@ async def test_get_states_query_during_migration_to_schema_25_multiple_entities(
         assert hist[1].attributes == {"name": "the light"}
 
 
+async def test_query_during_migration_to_schema_31(
+    hass: ha.HomeAssistant,
+    async_setup_recorder_instance: SetupRecorderInstanceT,
+):
+    """Test we can query data after schema 30 and during migration to schema 31."""
+    instance = await async_setup_recorder_instance(hass, {})
+
+    start = dt_util.utcnow()
+    point = start + timedelta(seconds=1)
+    end = point + timedelta(seconds=1)
+    entity_id_1 = "light.test"
+    entity_id_2 = "switch.test"
+    entity_ids = [entity_id_1, entity_id_2]
+
+    await recorder.get_instance(hass).async_add_executor_job(
+        _add_db_entries, hass, point, entity_ids
+    )
+
+    # Schema 30 moved the entity_ids to the states_meta table
+    # and the timestamp columns are only populated by schema 31
+    with instance.engine.connect() as conn:
+        conn.execute(text("update states set entity_id=NULL, last_updated_ts=NULL;"))
+        conn.commit()
+
+    with patch.object(instance, "schema_version", 30):
+        hist = history.state_changes_during_period(
+            hass, start, end, entity_id_1, include_start_time_state=False
+        )
+        assert hist[entity_id_1][0].last_updated == point
+
+        hist = history.get_significant_states(
+            hass, start, end, entity_ids, include_start_time_state=False
+        )
+        assert hist[entity_id_1][0].last_updated == point
+        assert hist[entity_id_2][0].last_updated == point
+
+        hist = await _async_get_states(hass, end, [entity_id_1])
+        assert hist[0].entity_id == entity_id_1
+        assert hist[0].state == "on"
+
+        hist = await _async_get_states(hass, end, entity_ids)
+        assert {state.entity_id for state in hist} == set(entity_ids)
+
+        hist = await _async_get_states(hass, end)
+        assert {state.entity_id for state in hist} >= set(entity_ids)
+
+
 async def test_get_full_significant_states_handles_empty_last_changed(
     hass: ha.HomeAssistant,
     async_setup_recorder_instance: SetupRecorderInstanceT,
@@ -870,13 +981,17 @@ async def test_get_full_significant_states_handles_empty_last_changed(
     db_sensor_one_states = await recorder.get_instance(hass).async_add_executor_job(
         _fetch_db_states
     )
-    assert db_sensor_one_states[0].last_changed is None
+    assert db_sensor_one_states[0].last_changed_ts is None
+    assert (
+        dt_util.utc_from_timestamp(db_sensor_one_states[1].last_changed_ts)
+        == state0.last_changed
+    )
+    assert db_sensor_one_states[0].last_updated_ts is not None
+    assert db_sensor_one_states[1].last_updated_ts is not None
     assert (
-        process_timestamp(db_sensor_one_states[1].last_changed) == state0.last_changed
+        db_sensor_one_states[0].last_updated_ts
+        != db_sensor_one_states[1].last_updated_ts
     )
-    assert db_sensor_one_states[0].last_updated is not None
-    assert db_sensor_one_states[1].last_updated is not None
-    assert db_sensor_one_states[0].last_updated != db_sensor_one_states[1].last_updated
 
 
 def test_state_changes_during_period_multiple_entities_single_test(hass_recorder):
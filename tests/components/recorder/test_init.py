@@ -32,6 +32,7 @@ from homeassistant.components.recorder.db_schema import (
     RecorderRuns,
     StateAttributes,
     States,
+    StatesMeta,
     StatisticsRuns,
 )
 from homeassistant.components.recorder.models import process_timestamp
@@ -631,11 +632,11 @@ def test_saving_state_and_removing_entity(hass, hass_recorder):
     with session_scope(hass=hass) as session:
         states = list(session.query(States))
         assert len(states) == 3
-        assert states[0].entity_id == entity_id
+        assert states[0].states_meta_rel.entity_id == entity_id
         assert states[0].state == STATE_LOCKED
-        assert states[1].entity_id == entity_id
+        assert states[1].states_meta_rel.entity_id == entity_id
         assert states[1].state == STATE_UNLOCKED
-        assert states[2].entity_id == entity_id
+        assert states[2].states_meta_rel.entity_id == entity_id
         assert states[2].state is None
 
 
@@ -1035,10 +1036,10 @@ def test_saving_sets_old_state(hass_recorder):
         states = list(session.query(States))
         assert len(states) == 4
 
-        assert states[0].entity_id == "test.one"
-        assert states[1].entity_id == "test.two"
-        assert states[2].entity_id == "test.one"
-        assert states[3].entity_id == "test.two"
+        assert states[0].states_meta_rel.entity_id == "test.one"
+        assert states[1].states_meta_rel.entity_id == "test.two"
+        assert states[2].states_meta_rel.entity_id == "test.one"
+        assert states[3].states_meta_rel.entity_id == "test.two"
 
         assert states[0].old_state_id is None
         assert states[1].old_state_id is None
@@ -1062,8 +1063,8 @@ def test_saving_state_with_serializable_data(hass_recorder, caplog):
         states = list(session.query(States))
         assert len(states) == 2
 
-        assert states[0].entity_id == "test.two"
-        assert states[1].entity_id == "test.two"
+        assert states[0].states_meta_rel.entity_id == "test.two"
+        assert states[1].states_meta_rel.entity_id == "test.two"
         assert states[0].old_state_id is None
         assert states[1].old_state_id == states[0].state_id
 
@@ -1549,7 +1550,8 @@ def test_deduplication_state_attributes_inside_commit_interval(hass_recorder, ca
     with session_scope(hass=hass) as session:
         states = list(
             session.query(States)
-            .filter(States.entity_id == entity_id)
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == entity_id)
             .outerjoin(
                 StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
             )
@@ -1560,6 +1562,76 @@ def test_deduplication_state_attributes_inside_commit_interval(hass_recorder, ca
         assert first_attributes_id == last_attributes_id
 
 
+def test_bulk_insert_saves_states_and_events(hass_recorder):
+    """Test the bulk insert pipeline resolves the ids the rows refer to."""
+    hass = hass_recorder({"bulk_insert": True})
+    assert hass.data[DATA_INSTANCE].bulk_insert is True
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+
+    hass.states.set("test.one", "on", attributes)
+    hass.states.set("test.two", "on", attributes)
+    hass.states.set("test.one", "off", attributes)
+    hass.states.set("test.one", "on", {"test_attr": 6})
+    hass.bus.fire("this_event", {"de": "dupe"})
+    hass.bus.fire("this_event", {"de": "dupe"})
+    hass.bus.fire("this_event")
+    wait_recording_done(hass)
+    hass.states.set("test.one", "off", attributes)
+    hass.states.remove("test.two")
+    hass.bus.fire("this_event", {"de": "dupe"})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States).order_by(States.last_updated))
+        assert [(state.states_meta_rel.entity_id, state.state) for state in states] == [
+            ("test.one", "on"),
+            ("test.two", "on"),
+            ("test.one", "off"),
+            ("test.one", "on"),
+            ("test.one", "off"),
+            ("test.two", None),
+        ]
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id is None
+        assert states[2].old_state_id == states[0].state_id
+        assert states[3].old_state_id == states[2].state_id
+        assert states[4].old_state_id == states[3].state_id
+        assert states[5].old_state_id == states[1].state_id
+        assert session.query(StatesMeta).count() == 2
+
+        shared_attrs = {
+            attributes.attributes_id: attributes.to_native()
+            for attributes in session.query(StateAttributes)
+        }
+        assert len(shared_attrs) == 3
+        assert shared_attrs[states[0].attributes_id] == attributes
+        assert states[1].attributes_id == states[0].attributes_id
+        assert states[4].attributes_id == states[0].attributes_id
+        assert shared_attrs[states[3].attributes_id] == {"test_attr": 6}
+        assert shared_attrs[states[5].attributes_id] == {}
+
+        events = list(
+            session.query(Events)
+            .filter(Events.event_type == "this_event")
+            .order_by(Events.event_id)
+        )
+        assert len(events) == 4
+        assert (
+            session.query(EventData)
+            .filter(EventData.shared_data == '{"de":"dupe"}')
+            .count()
+            == 1
+        )
+        assert events[0].data_id is not None
+        assert events[1].data_id == events[0].data_id
+        assert events[2].data_id is None
+        assert events[3].data_id == events[0].data_id
+
+        assert hass.data[DATA_INSTANCE]._old_state_ids == {
+            "test.one": states[4].state_id
+        }
+
+
 async def test_async_block_till_done(hass, async_setup_recorder_instance):
     """Test we can block until recordering is done."""
     instance = await async_setup_recorder_instance(hass)
@@ -1573,7 +1645,11 @@ async def test_async_block_till_done(hass, async_setup_recorder_instance):
 
     def _fetch_states():
         with session_scope(hass=hass) as session:
-            return list(session.query(States).filter(States.entity_id == entity_id))
+            return list(
+                session.query(States)
+                .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == entity_id)
+            )
 
     await async_block_recorder(hass, 0.1)
     await instance.async_block_till_done()
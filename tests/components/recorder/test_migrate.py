@@ -26,6 +26,7 @@ from homeassistant.components.recorder.db_schema import (
     SCHEMA_VERSION,
     RecorderRuns,
     States,
+    StatesMeta,
 )
 from homeassistant.components.recorder.util import session_scope
 import homeassistant.util.dt as dt_util
@@ -39,7 +40,9 @@ def _get_native_states(hass, entity_id):
     with session_scope(hass=hass) as session:
         return [
             state.to_native()
-            for state in session.query(States).filter(States.entity_id == entity_id)
+            for state in session.query(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == entity_id)
         ]
 
 
@@ -332,6 +335,192 @@ async def test_schema_migrate(hass, start_version):
         assert recorder.util.async_migration_in_progress(hass) is not True
 
 
+async def test_migrate_entity_ids_to_states_meta(hass):
+    """Test the entity_ids of the states are moved to the states_meta table."""
+
+    def _create_engine_28(*args, **kwargs):
+        """Test version of create_engine that initializes with schema 28."""
+        module = "tests.components.recorder.db_schema_28"
+        importlib.import_module(module)
+        old_db_schema = sys.modules[module]
+        engine = create_engine(*args, **kwargs)
+        old_db_schema.Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(
+                recorder.db_schema.StatisticsRuns(
+                    start=recorder.statistics.get_start_time()
+                )
+            )
+            session.add(
+                recorder.db_schema.SchemaChanges(
+                    schema_version=old_db_schema.SCHEMA_VERSION
+                )
+            )
+            for entity_id, state in (
+                ("sensor.one", "1"),
+                ("sensor.two", "2"),
+                ("sensor.one", "3"),
+            ):
+                session.add(
+                    old_db_schema.States(
+                        entity_id=entity_id,
+                        state=state,
+                        last_updated=dt_util.utcnow(),
+                    )
+                )
+            session.commit()
+        return engine
+
+    # Move a single state per batch
+    with patch("homeassistant.components.recorder.ALLOW_IN_MEMORY_DB", True), patch(
+        "homeassistant.components.recorder.core.create_engine",
+        new=_create_engine_28,
+    ), patch("homeassistant.components.recorder.migration.MAX_ROWS_TO_PURGE", 1):
+        await async_setup_component(
+            hass,
+            "recorder",
+            {"recorder": {"db_url": "sqlite://", "commit_interval": 0}},
+        )
+        await hass.data[DATA_INSTANCE].async_recorder_ready.wait()
+        await async_wait_recording_done(hass)
+
+    def _get_states():
+        with session_scope(hass=hass) as session:
+            return [
+                (state.entity_id, state.metadata_id, state.states_meta_rel.entity_id)
+                for state in session.query(States).order_by(States.state_id)
+            ]
+
+    instance = recorder.get_instance(hass)
+    assert (await instance.async_add_executor_job(_get_states))[:3] == [
+        (None, 1, "sensor.one"),
+        (None, 2, "sensor.two"),
+        (None, 1, "sensor.one"),
+    ]
+    assert [
+        state.state
+        for state in await instance.async_add_executor_job(
+            _get_native_states, hass, "sensor.one"
+        )
+    ] == ["1", "3"]
+
+
+@pytest.mark.parametrize("clear_legacy_columns", [True, False])
+async def test_migrate_times_to_timestamps(hass, clear_legacy_columns):
+    """Test the times of the events and states are moved to timestamp columns.
+
+    The datetime columns are only cleared after the migration is done.
+    """
+    time_fired = datetime.datetime(2022, 11, 3, 8, 15, 30, 123456, tzinfo=dt_util.UTC)
+    last_changed = time_fired - datetime.timedelta(minutes=5)
+
+    def _create_engine_28(*args, **kwargs):
+        """Test version of create_engine that initializes with schema 28."""
+        module = "tests.components.recorder.db_schema_28"
+        importlib.import_module(module)
+        old_db_schema = sys.modules[module]
+        engine = create_engine(*args, **kwargs)
+        old_db_schema.Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(
+                recorder.db_schema.StatisticsRuns(
+                    start=recorder.statistics.get_start_time()
+                )
+            )
+            session.add(
+                recorder.db_schema.SchemaChanges(
+                    schema_version=old_db_schema.SCHEMA_VERSION
+                )
+            )
+            session.add(
+                old_db_schema.Events(
+                    event_type="custom_event", origin_idx=0, time_fired=time_fired
+                )
+            )
+            session.add(
+                old_db_schema.States(
+                    entity_id="sensor.one",
+                    state="1",
+                    last_updated=time_fired,
+                    last_changed=last_changed,
+                )
+            )
+            session.add(
+                old_db_schema.States(
+                    entity_id="sensor.one",
+                    state="2",
+                    last_updated=time_fired,
+                    last_changed=time_fired,
+                )
+            )
+            session.commit()
+        return engine
+
+    with patch("homeassistant.components.recorder.ALLOW_IN_MEMORY_DB", True), patch(
+        "homeassistant.components.recorder.core.create_engine",
+        new=_create_engine_28,
+    ), patch(
+        "homeassistant.components.recorder.migration.TIMESTAMP_MIGRATION_BATCH_SIZE", 1
+    ), patch(
+        "homeassistant.components.recorder.migration._clear_legacy_time_columns",
+        wraps=migration._clear_legacy_time_columns if clear_legacy_columns else None,
+    ):
+        await async_setup_component(
+            hass,
+            "recorder",
+            {"recorder": {"db_url": "sqlite://", "commit_interval": 0}},
+        )
+        await hass.data[DATA_INSTANCE].async_recorder_ready.wait()
+        await async_wait_recording_done(hass)
+
+    def _get_times():
+        with session_scope(hass=hass) as session:
+            events = [
+                (event.time_fired, event.time_fired_ts)
+                for event in session.query(recorder.db_schema.Events).filter(
+                    recorder.db_schema.Events.event_type == "custom_event"
+                )
+            ]
+            states = [
+                (
+                    state.last_updated,
+                    state.last_changed,
+                    state.last_updated_ts,
+                    state.last_changed_ts,
+                )
+                for state in session.query(States).order_by(States.state_id)
+            ]
+            return events, states[:2]
+
+    instance = recorder.get_instance(hass)
+    events, states = await instance.async_add_executor_job(_get_times)
+    if clear_legacy_columns:
+        assert events == [(None, time_fired.timestamp())]
+        assert states == [
+            (None, None, time_fired.timestamp(), last_changed.timestamp()),
+            (None, None, time_fired.timestamp(), time_fired.timestamp()),
+        ]
+        return
+
+    naive_time_fired = time_fired.replace(tzinfo=None)
+    naive_last_changed = last_changed.replace(tzinfo=None)
+    assert events == [(naive_time_fired, time_fired.timestamp())]
+    assert states == [
+        (
+            naive_time_fired,
+            naive_last_changed,
+            time_fired.timestamp(),
+            last_changed.timestamp(),
+        ),
+        (
+            naive_time_fired,
+            naive_time_fired,
+            time_fired.timestamp(),
+            time_fired.timestamp(),
+        ),
+    ]
+
+
 def test_invalid_update(hass):
     """Test that an invalid new version raises an exception."""
     with pytest.raises(ValueError):
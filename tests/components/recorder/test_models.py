@@ -14,9 +14,11 @@ from homeassistant.components.recorder.db_schema import (
     RecorderRuns,
     StateAttributes,
     States,
+    StatesMeta,
 )
 from homeassistant.components.recorder.models import (
     LazyState,
+    LazyStatePreSchema31,
     process_datetime_to_timestamp,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
@@ -43,7 +45,10 @@ def test_from_event_to_db_state():
         {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
         context=state.context,
     )
-    assert state == States.from_event(event).to_native()
+    db_state = States.from_event(event)
+    # The entity_id is set to None by States.from_event
+    db_state.entity_id = state.entity_id
+    assert state == db_state.to_native()
 
 
 def test_from_event_to_db_state_attributes():
@@ -79,10 +84,10 @@ def test_from_event_to_delete_state():
     )
     db_state = States.from_event(event)
 
-    assert db_state.entity_id == "sensor.temperature"
+    assert db_state.entity_id is None
     assert db_state.state == ""
-    assert db_state.last_changed is None
-    assert db_state.last_updated == event.time_fired
+    assert db_state.last_changed_ts is None
+    assert db_state.last_updated_ts == event.time_fired.timestamp()
 
 
 def test_entity_ids():
@@ -117,35 +122,35 @@ def test_entity_ids():
 
     session.add(
         States(
-            entity_id="sensor.temperature",
+            states_meta_rel=StatesMeta(entity_id="sensor.temperature"),
             state="20",
-            last_changed=before_run,
-            last_updated=before_run,
+            last_changed_ts=before_run.timestamp(),
+            last_updated_ts=before_run.timestamp(),
         )
     )
     session.add(
         States(
-            entity_id="sensor.sound",
+            states_meta_rel=StatesMeta(entity_id="sensor.sound"),
             state="10",
-            last_changed=after_run,
-            last_updated=after_run,
+            last_changed_ts=after_run.timestamp(),
+            last_updated_ts=after_run.timestamp(),
         )
     )
 
     session.add(
         States(
-            entity_id="sensor.humidity",
+            states_meta_rel=StatesMeta(entity_id="sensor.humidity"),
             state="76",
-            last_changed=in_run,
-            last_updated=in_run,
+            last_changed_ts=in_run.timestamp(),
+            last_updated_ts=in_run.timestamp(),
         )
     )
     session.add(
         States(
-            entity_id="sensor.lux",
+            states_meta_rel=StatesMeta(entity_id="sensor.lux"),
             state="5",
-            last_changed=in_run3,
-            last_updated=in_run3,
+            last_changed_ts=in_run3.timestamp(),
+            last_updated_ts=in_run3.timestamp(),
         )
     )
 
@@ -272,8 +277,8 @@ async def test_lazy_state_handles_different_last_updated_and_last_changed(caplog
         entity_id="sensor.valid",
         state="off",
         shared_attrs='{"shared":true}',
-        last_updated=now,
-        last_changed=now - timedelta(seconds=60),
+        last_updated_ts=now.timestamp(),
+        last_changed_ts=(now - timedelta(seconds=60)).timestamp(),
     )
     lstate = LazyState(row, {})
     assert lstate.as_dict() == {
@@ -283,8 +288,8 @@ async def test_lazy_state_handles_different_last_updated_and_last_changed(caplog
         "last_updated": "2021-06-12T03:04:01.000323+00:00",
         "state": "off",
     }
-    assert lstate.last_updated == row.last_updated
-    assert lstate.last_changed == row.last_changed
+    assert lstate.last_updated.timestamp() == row.last_updated_ts
+    assert lstate.last_changed.timestamp() == row.last_changed_ts
     assert lstate.as_dict() == {
         "attributes": {"shared": True},
         "entity_id": "sensor.valid",
@@ -301,8 +306,8 @@ async def test_lazy_state_handles_same_last_updated_and_last_changed(caplog):
         entity_id="sensor.valid",
         state="off",
         shared_attrs='{"shared":true}',
-        last_updated=now,
-        last_changed=now,
+        last_updated_ts=now.timestamp(),
+        last_changed_ts=now.timestamp(),
     )
     lstate = LazyState(row, {})
     assert lstate.as_dict() == {
@@ -312,8 +317,8 @@ async def test_lazy_state_handles_same_last_updated_and_last_changed(caplog):
         "last_updated": "2021-06-12T03:04:01.000323+00:00",
         "state": "off",
     }
-    assert lstate.last_updated == row.last_updated
-    assert lstate.last_changed == row.last_changed
+    assert lstate.last_updated.timestamp() == row.last_updated_ts
+    assert lstate.last_changed.timestamp() == row.last_changed_ts
     assert lstate.as_dict() == {
         "attributes": {"shared": True},
         "entity_id": "sensor.valid",
@@ -407,3 +412,25 @@ async def test_process_datetime_to_timestamp_mirrors_utc_isoformat_behavior(
         process_datetime_to_timestamp(datetime_hst_timezone)
         == dt_util.parse_datetime("2016-07-09T21:00:00+00:00").timestamp()
     )
+
+
+async def test_lazy_state_pre_schema_31_handles_datetime_columns(caplog):
+    """Test that the LazyStatePreSchema31 reads the datetime columns."""
+    now = datetime(2021, 6, 12, 3, 4, 1, 323, tzinfo=dt_util.UTC)
+    row = PropertyMock(
+        entity_id="sensor.valid",
+        state="off",
+        shared_attrs='{"shared":true}',
+        last_updated=now,
+        last_changed=now - timedelta(seconds=60),
+    )
+    lstate = LazyStatePreSchema31(row, {})
+    assert lstate.as_dict() == {
+        "attributes": {"shared": True},
+        "entity_id": "sensor.valid",
+        "last_changed": "2021-06-12T03:03:01.000323+00:00",
+        "last_updated": "2021-06-12T03:04:01.000323+00:00",
+        "state": "off",
+    }
+    assert lstate.last_updated == row.last_updated
+    assert lstate.last_changed == row.last_changed
@@ -16,6 +16,7 @@ from homeassistant.components.recorder.db_schema import (
     RecorderRuns,
     StateAttributes,
     States,
+    StatesMeta,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -450,16 +451,16 @@ async def test_purge_edge_case(
                     event_type="EVENT_TEST_PURGE",
                     event_data="{}",
                     origin="LOCAL",
-                    time_fired=timestamp,
+                    time_fired_ts=dt_util.utc_to_timestamp(timestamp),
                 )
             )
             session.add(
                 States(
-                    entity_id="test.recorder2",
+                    states_meta_rel=_states_meta(session, "test.recorder2"),
                     state="purgeme",
                     attributes="{}",
-                    last_changed=timestamp,
-                    last_updated=timestamp,
+                    last_changed_ts=dt_util.utc_to_timestamp(timestamp),
+                    last_updated_ts=dt_util.utc_to_timestamp(timestamp),
                     event_id=1001,
                     attributes_id=1002,
                 )
@@ -519,16 +520,16 @@ async def test_purge_cutoff_date(
                     event_type="KEEP",
                     event_data="{}",
                     origin="LOCAL",
-                    time_fired=timestamp_keep,
+                    time_fired_ts=dt_util.utc_to_timestamp(timestamp_keep),
                 )
             )
             session.add(
                 States(
-                    entity_id="test.cutoff",
+                    states_meta_rel=_states_meta(session, "test.cutoff"),
                     state="keep",
                     attributes="{}",
-                    last_changed=timestamp_keep,
-                    last_updated=timestamp_keep,
+                    last_changed_ts=dt_util.utc_to_timestamp(timestamp_keep),
+                    last_updated_ts=dt_util.utc_to_timestamp(timestamp_keep),
                     event_id=1000,
                     attributes_id=1000,
                 )
@@ -547,16 +548,16 @@ async def test_purge_cutoff_date(
                         event_type="PURGE",
                         event_data="{}",
                         origin="LOCAL",
-                        time_fired=timestamp_purge,
+                        time_fired_ts=dt_util.utc_to_timestamp(timestamp_purge),
                     )
                 )
                 session.add(
                     States(
-                        entity_id="test.cutoff",
+                        states_meta_rel=_states_meta(session, "test.cutoff"),
                         state="purge",
                         attributes="{}",
-                        last_changed=timestamp_purge,
-                        last_updated=timestamp_purge,
+                        last_changed_ts=dt_util.utc_to_timestamp(timestamp_purge),
+                        last_updated_ts=dt_util.utc_to_timestamp(timestamp_purge),
                         event_id=1000 + row,
                         attributes_id=1000 + row,
                     )
@@ -677,11 +678,11 @@ async def test_purge_filtered_states(
             timestamp = dt_util.utcnow() - timedelta(days=1)
             session.add(
                 States(
-                    entity_id="sensor.excluded",
+                    states_meta_rel=_states_meta(session, "sensor.excluded"),
                     state="purgeme",
                     attributes="{}",
-                    last_changed=timestamp,
-                    last_updated=timestamp,
+                    last_changed_ts=dt_util.utc_to_timestamp(timestamp),
+                    last_updated_ts=dt_util.utc_to_timestamp(timestamp),
                 )
             )
             # Add states and state_changed events that should be keeped
@@ -703,30 +704,30 @@ async def test_purge_filtered_states(
                 ),
             )
             state_1 = States(
-                entity_id="sensor.linked_old_state_id",
+                states_meta_rel=_states_meta(session, "sensor.linked_old_state_id"),
                 state="keep",
                 attributes="{}",
-                last_changed=timestamp,
-                last_updated=timestamp,
+                last_changed_ts=dt_util.utc_to_timestamp(timestamp),
+                last_updated_ts=dt_util.utc_to_timestamp(timestamp),
                 old_state_id=1,
                 state_attributes=state_attrs,
             )
             timestamp = dt_util.utcnow() - timedelta(days=4)
             state_2 = States(
-                entity_id="sensor.linked_old_state_id",
+                states_meta_rel=_states_meta(session, "sensor.linked_old_state_id"),
                 state="keep",
                 attributes="{}",
-                last_changed=timestamp,
-                last_updated=timestamp,
+                last_changed_ts=dt_util.utc_to_timestamp(timestamp),
+                last_updated_ts=dt_util.utc_to_timestamp(timestamp),
                 old_state_id=2,
                 state_attributes=state_attrs,
             )
             state_3 = States(
-                entity_id="sensor.linked_old_state_id",
+                states_meta_rel=_states_meta(session, "sensor.linked_old_state_id"),
                 state="keep",
                 attributes="{}",
-                last_changed=timestamp,
-                last_updated=timestamp,
+                last_changed_ts=dt_util.utc_to_timestamp(timestamp),
+                last_updated_ts=dt_util.utc_to_timestamp(timestamp),
                 old_state_id=62,  # keep
                 state_attributes=state_attrs,
             )
@@ -738,7 +739,7 @@ async def test_purge_filtered_states(
                     event_type="EVENT_KEEP",
                     event_data="{}",
                     origin="LOCAL",
-                    time_fired=timestamp,
+                    time_fired_ts=dt_util.utc_to_timestamp(timestamp),
                 )
             )
 
@@ -794,10 +795,18 @@ async def test_purge_filtered_states(
         events_keep = session.query(Events).filter(Events.event_type == "EVENT_KEEP")
         assert events_keep.count() == 1
 
-        states_sensor_excluded = session.query(States).filter(
-            States.entity_id == "sensor.excluded"
+        states_sensor_excluded = (
+            session.query(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == "sensor.excluded")
         )
         assert states_sensor_excluded.count() == 0
+        assert (
+            session.query(StatesMeta)
+            .filter(StatesMeta.entity_id == "sensor.excluded")
+            .count()
+            == 0
+        )
 
         assert session.query(States).get(72).old_state_id is None
         assert session.query(States).get(72).attributes_id == 71
@@ -907,11 +916,11 @@ async def test_purge_without_state_attributes_filtered_states_to_empty(
             event_id = 1021
             session.add(
                 States(
-                    entity_id="sensor.old_format",
+                    states_meta_rel=_states_meta(session, "sensor.old_format"),
                     state=STATE_ON,
                     attributes=json.dumps({"old": "not_using_state_attributes"}),
-                    last_changed=timestamp,
-                    last_updated=timestamp,
+                    last_changed_ts=dt_util.utc_to_timestamp(timestamp),
+                    last_updated_ts=dt_util.utc_to_timestamp(timestamp),
                     event_id=event_id,
                     state_attributes=None,
                 )
@@ -922,7 +931,7 @@ async def test_purge_without_state_attributes_filtered_states_to_empty(
                     event_type=EVENT_STATE_CHANGED,
                     event_data="{}",
                     origin="LOCAL",
-                    time_fired=timestamp,
+                    time_fired_ts=dt_util.utc_to_timestamp(timestamp),
                 )
             )
             session.add(
@@ -931,7 +940,7 @@ async def test_purge_without_state_attributes_filtered_states_to_empty(
                     event_type=EVENT_THEMES_UPDATED,
                     event_data="{}",
                     origin="LOCAL",
-                    time_fired=timestamp,
+                    time_fired_ts=dt_util.utc_to_timestamp(timestamp),
                 )
             )
 
@@ -983,7 +992,7 @@ async def test_purge_filtered_events(
                             event_type="EVENT_PURGE",
                             event_data="{}",
                             origin="LOCAL",
-                            time_fired=timestamp,
+                            time_fired_ts=dt_util.utc_to_timestamp(timestamp),
                         )
                     )
 
@@ -1083,34 +1092,34 @@ async def test_purge_filtered_events_state_changed(
                         event_type="EVENT_KEEP",
                         event_data="{}",
                         origin="LOCAL",
-                        time_fired=timestamp,
+                        time_fired_ts=dt_util.utc_to_timestamp(timestamp),
                     )
                 )
             # Add states with linked old_state_ids that need to be handled
             timestamp = dt_util.utcnow() - timedelta(days=0)
             state_1 = States(
-                entity_id="sensor.linked_old_state_id",
+                states_meta_rel=_states_meta(session, "sensor.linked_old_state_id"),
                 state="keep",
                 attributes="{}",
-                last_changed=timestamp,
-                last_updated=timestamp,
+                last_changed_ts=dt_util.utc_to_timestamp(timestamp),
+                last_updated_ts=dt_util.utc_to_timestamp(timestamp),
                 old_state_id=1,
             )
             timestamp = dt_util.utcnow() - timedelta(days=4)
             state_2 = States(
-                entity_id="sensor.linked_old_state_id",
+                states_meta_rel=_states_meta(session, "sensor.linked_old_state_id"),
                 state="keep",
                 attributes="{}",
-                last_changed=timestamp,
-                last_updated=timestamp,
+                last_changed_ts=dt_util.utc_to_timestamp(timestamp),
+                last_updated_ts=dt_util.utc_to_timestamp(timestamp),
                 old_state_id=2,
             )
             state_3 = States(
-                entity_id="sensor.linked_old_state_id",
+                states_meta_rel=_states_meta(session, "sensor.linked_old_state_id"),
                 state="keep",
                 attributes="{}",
-                last_changed=timestamp,
-                last_updated=timestamp,
+                last_changed_ts=dt_util.utc_to_timestamp(timestamp),
+                last_updated_ts=dt_util.utc_to_timestamp(timestamp),
                 old_state_id=62,  # keep
             )
             session.add_all((state_1, state_2, state_3))
@@ -1234,8 +1243,10 @@ async def test_purge_entities(
         states = session.query(States)
         assert states.count() == 10
 
-        states_sensor_kept = session.query(States).filter(
-            States.entity_id == "sensor.keep"
+        states_sensor_kept = (
+            session.query(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == "sensor.keep")
         )
         assert states_sensor_kept.count() == 10
 
@@ -1264,8 +1275,10 @@ async def test_purge_entities(
         states = session.query(States)
         assert states.count() == 10
 
-        states_sensor_kept = session.query(States).filter(
-            States.entity_id == "sensor.keep"
+        states_sensor_kept = (
+            session.query(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == "sensor.keep")
         )
         assert states_sensor_kept.count() == 10
 
@@ -1345,7 +1358,7 @@ async def _add_test_events(hass: HomeAssistant, iterations: int = 1):
                         event_type=event_type,
                         event_data=json.dumps(event_data),
                         origin="LOCAL",
-                        time_fired=timestamp,
+                        time_fired_ts=dt_util.utc_to_timestamp(timestamp),
                     )
                 )
 
@@ -1382,7 +1395,7 @@ async def _add_events_with_event_data(hass: HomeAssistant, iterations: int = 1):
                     Events(
                         event_type=event_type,
                         origin="LOCAL",
-                        time_fired=timestamp,
+                        time_fired_ts=dt_util.utc_to_timestamp(timestamp),
                         event_data_rel=event_data,
                     )
                 )
@@ -1469,6 +1482,17 @@ async def _add_test_statistics_runs(hass: HomeAssistant):
             )
 
 
+def _states_meta(session: Session, entity_id: str) -> StatesMeta:
+    """Return the states_meta row for the entity_id, adding it if needed."""
+    if states_meta := (
+        session.query(StatesMeta).filter(StatesMeta.entity_id == entity_id).first()
+    ):
+        return states_meta
+    states_meta = StatesMeta(entity_id=entity_id)
+    session.add(states_meta)
+    return states_meta
+
+
 def _add_state_without_event_linkage(
     session: Session,
     entity_id: str,
@@ -1481,11 +1505,11 @@ def _add_state_without_event_linkage(
     session.add(state_attrs)
     session.add(
         States(
-            entity_id=entity_id,
+            states_meta_rel=_states_meta(session, entity_id),
             state=state,
             attributes=None,
-            last_changed=timestamp,
-            last_updated=timestamp,
+            last_changed_ts=dt_util.utc_to_timestamp(timestamp),
+            last_updated_ts=dt_util.utc_to_timestamp(timestamp),
             event_id=None,
             state_attributes=state_attrs,
         )
@@ -1506,11 +1530,11 @@ def _add_state_and_state_changed_event(
     session.add(state_attrs)
     session.add(
         States(
-            entity_id=entity_id,
+            states_meta_rel=_states_meta(session, entity_id),
             state=state,
             attributes=None,
-            last_changed=timestamp,
-            last_updated=timestamp,
+            last_changed_ts=dt_util.utc_to_timestamp(timestamp),
+            last_updated_ts=dt_util.utc_to_timestamp(timestamp),
             event_id=event_id,
             state_attributes=state_attrs,
         )
@@ -1521,7 +1545,7 @@ def _add_state_and_state_changed_event(
             event_type=EVENT_STATE_CHANGED,
             event_data="{}",
             origin="LOCAL",
-            time_fired=timestamp,
+            time_fired_ts=dt_util.utc_to_timestamp(timestamp),
         )
     )
 
@@ -1579,6 +1603,46 @@ async def test_purge_many_old_events(
         assert event_datas.count() == 0
 
 
+async def test_purge_old_events_in_time_slices(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test the purge stops after a slice and reports its progress."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_events(hass, MAX_ROWS_TO_PURGE)
+
+    with session_scope(hass=hass) as session, patch(
+        "homeassistant.components.recorder.purge.PURGE_SLICE_SECONDS", 0
+    ):
+        events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
+        event_datas = session.query(EventData)
+        assert events.count() == MAX_ROWS_TO_PURGE * 6
+        assert event_datas.count() == 5
+        # The events fired while the recorder started are purged as well
+        all_events = session.query(Events).count()
+
+        purge_before = dt_util.utcnow()
+
+        # Only one batch fits in a slice
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert events.count() == MAX_ROWS_TO_PURGE * 5
+        progress = instance.purge_progress
+        assert progress.slices == 1
+        assert progress.events == MAX_ROWS_TO_PURGE
+        assert progress.event_data == 0
+        assert progress.as_dict()["purge_before"] == purge_before.isoformat()
+
+        while not purge_old_data(instance, purge_before, repack=False):
+            pass
+        assert events.count() == 0
+        assert event_datas.count() == 0
+        assert instance.purge_progress is None
+        assert progress.events == all_events
+        assert progress.event_data == 5
+        assert progress.rows_per_second > 0
+
+
 async def test_purge_can_mix_legacy_and_new_format(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -1589,9 +1653,9 @@ async def test_purge_can_mix_legacy_and_new_format(
     with session_scope(hass=hass) as session:
         broken_state_no_time = States(
             event_id=None,
-            entity_id="orphened.state",
-            last_updated=None,
-            last_changed=None,
+            states_meta_rel=_states_meta(session, "orphened.state"),
+            last_updated_ts=None,
+            last_changed_ts=None,
         )
         session.add(broken_state_no_time)
         start_id = 50000
@@ -269,6 +269,7 @@ async def test_recorder_info(hass, hass_ws_client, recorder_mock):
         "backlog": 0,
         "max_backlog": 40000,
         "migration_in_progress": False,
+        "purge_progress": None,
         "recording": True,
         "thread_running": True,
     }
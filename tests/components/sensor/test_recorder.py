@@ -19,6 +19,7 @@ from homeassistant.components.recorder.statistics import (
     statistics_during_period,
 )
 from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.sensor import recorder as sensor_recorder
 from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.setup import async_setup_component, setup_component
 import homeassistant.util.dt as dt_util
@@ -1494,6 +1495,73 @@ def test_compile_hourly_statistics_unchanged(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_statistics_from_accumulated_states(hass_recorder):
+    """Test statistics accumulated from state changes match the database."""
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    now = dt_util.utcnow()
+    # The first fully observed period
+    zero = now.replace(minute=now.minute - now.minute % 5, second=0, microsecond=0)
+    zero += timedelta(minutes=5)
+    end = zero + timedelta(minutes=5)
+    power_attributes = dict(POWER_SENSOR_ATTRIBUTES)
+    energy_attributes = {**ENERGY_SENSOR_ATTRIBUTES, "state_class": "total_increasing"}
+
+    for offset, power, energy, extra in (
+        (timedelta(minutes=-1), "1", "10", {}),
+        (timedelta(seconds=30), "3", "12", {}),
+        # Attribute only changes are not significant for measurements
+        (timedelta(minutes=1), "3", "12", {"extra": 1}),
+        (timedelta(minutes=2), STATE_UNAVAILABLE, "15", {}),
+        (timedelta(minutes=3), "-2", "1", {}),
+        # Changes in the next period are not included
+        (timedelta(minutes=6), "100", "2", {}),
+    ):
+        with patch(
+            "homeassistant.components.recorder.core.dt_util.utcnow",
+            return_value=zero + offset,
+        ):
+            hass.states.set("sensor.power", power, {**power_attributes, **extra})
+            hass.states.set("sensor.energy", energy, {**energy_attributes, **extra})
+        wait_recording_done(hass)
+
+    def _compile():
+        with patch(
+            "homeassistant.components.sensor.recorder.dt_util.utcnow",
+            return_value=end + timedelta(minutes=2),
+        ), patch.object(
+            history,
+            "get_full_significant_states_with_session",
+            wraps=history.get_full_significant_states_with_session,
+        ) as get_history:
+            compiled = sensor_recorder.compile_statistics(hass, zero, end)
+        return compiled.platform_stats, get_history.call_count
+
+    accumulated, history_calls = _compile()
+    assert history_calls == 0
+    hass.data.pop(sensor_recorder.DATA_ACCUMULATOR)
+    from_database, history_calls = _compile()
+    assert history_calls == 2
+
+    assert accumulated == from_database
+    assert {
+        result["meta"]["statistic_id"]: result["stat"] for result in accumulated
+    } == {
+        "sensor.power": {
+            "start": zero,
+            "max": 3000.0,
+            "min": -2000.0,
+            "mean": approx((1000 * 30 + 3000 * 150 - 2000 * 120) / 300),
+        },
+        "sensor.energy": {
+            "start": zero,
+            "sum": 6.0,
+            "state": 1.0,
+        },
+    }
+
+
 def test_compile_hourly_statistics_partially_unavailable(hass_recorder, caplog):
     """Test compiling hourly statistics, with the sensor being partially unavailable."""
     zero = dt_util.utcnow()
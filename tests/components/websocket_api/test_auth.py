@@ -119,6 +119,23 @@ async def test_auth_active_with_token(
     assert auth_msg["type"] == TYPE_AUTH_OK
 
 
+async def test_auth_with_supported_features(
+    hass, no_auth_websocket_client, hass_access_token
+):
+    """Test enabling protocol features while authenticating."""
+    await no_auth_websocket_client.send_json(
+        {
+            "type": TYPE_AUTH,
+            "access_token": hass_access_token,
+            "supported_features": {"coalesce_messages": 1, "not_a_feature": 1},
+        }
+    )
+    auth_msg = await no_auth_websocket_client.receive_json()
+
+    assert auth_msg["type"] == TYPE_AUTH_OK
+    assert auth_msg["supported_features"] == {"coalesce_messages": 1}
+
+
 async def test_auth_active_user_inactive(hass, hass_client_no_auth, hass_access_token):
     """Test authenticating with a token."""
     refresh_token = await hass.auth.async_validate_access_token(hass_access_token)
@@ -1,4 +1,5 @@
 """Tests for WebSocket API commands."""
+import asyncio
 from copy import deepcopy
 import datetime
 from unittest.mock import ANY, patch
@@ -19,8 +20,14 @@ from homeassistant.core import Context, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.loader import async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+from homeassistant.helpers.template import Template
+from homeassistant.loader import DATA_IMPORT_TIMES, async_get_integration
+from homeassistant.setup import (
+    DATA_BOOTSTRAP_TIMINGS,
+    DATA_SETUP_TIME,
+    async_setup_component,
+)
 
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
 
@@ -984,6 +991,65 @@ async def test_subscribe_unsubscribe_entities(hass, websocket_client, hass_admin
     }
 
 
+async def test_subscribe_entities_changes_while_serializing(hass, websocket_client):
+    """Test changes made while the initial states are serialized are sent after."""
+    for idx in range(5):
+        hass.states.async_set(f"light.entity_{idx}", "off")
+
+    original_sleep = asyncio.sleep
+    changed = False
+
+    async def _change_state_and_sleep(delay):
+        nonlocal changed
+        if not changed:
+            changed = True
+            hass.states.async_set("light.entity_0", "on")
+        await original_sleep(delay)
+
+    with patch(
+        "homeassistant.components.websocket_api.commands.STATES_CHUNK_SIZE", 2
+    ), patch(
+        "homeassistant.components.websocket_api.commands.asyncio.sleep",
+        _change_state_and_sleep,
+    ):
+        await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 7
+        assert msg["type"] == const.TYPE_RESULT
+        assert msg["success"]
+
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        assert list(msg["event"]["a"]) == [f"light.entity_{idx}" for idx in range(5)]
+        assert msg["event"]["a"]["light.entity_0"]["s"] == "off"
+
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        assert msg["event"]["c"]["light.entity_0"]["+"]["s"] == "on"
+
+    assert changed
+
+
+async def test_get_states_in_chunks(hass, websocket_client):
+    """Test get_states serializes large state machines in chunks."""
+    for idx in range(5):
+        hass.states.async_set(f"light.entity_{idx}", "off", {"idx": idx})
+
+    with patch("homeassistant.components.websocket_api.commands.STATES_CHUNK_SIZE", 2):
+        await websocket_client.send_json({"id": 5, "type": "get_states"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        hass.states.get(f"light.entity_{idx}").as_dict() for idx in range(5)
+    ]
+
+
 async def test_subscribe_unsubscribe_entities_specific_entities(
     hass, websocket_client, hass_admin_user
 ):
@@ -1694,6 +1760,63 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
     ]
 
 
+async def test_integration_import_times(hass, websocket_client):
+    """Test fetching the time spent importing integrations."""
+    hass.data[DATA_IMPORT_TIMES] = {"august": 0.25, "isy994": 1.5}
+    await websocket_client.send_json({"id": 7, "type": "integration/import_times"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {"domain": "august", "seconds": 0.25},
+        {"domain": "isy994", "seconds": 1.5},
+    ]
+
+
+async def test_template_render_stats(hass, websocket_client):
+    """Test fetching the render statistics of tracked templates."""
+    hass.states.async_set("light.test", "on")
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(Template("{{ states('light.test') }}", hass), None)],
+        lambda event, updates: None,
+    )
+    hass.states.async_set("light.test", "off")
+
+    await websocket_client.send_json({"id": 7, "type": "template/render_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert len(msg["result"]) == 1
+    assert msg["result"][0]["template"] == "{{ states('light.test') }}"
+    assert msg["result"][0]["renders"] == 2
+    assert msg["result"][0]["seconds"] > 0
+
+    info.async_remove()
+
+
+async def test_integration_bootstrap_timings(hass, websocket_client):
+    """Test fetching the timings of the bootstrap phases."""
+    hass.data[DATA_BOOTSTRAP_TIMINGS] = {
+        "resolve_integrations": datetime.timedelta(seconds=0.5),
+        "stage_1": datetime.timedelta(seconds=3.25),
+    }
+    await websocket_client.send_json({"id": 7, "type": "integration/bootstrap_timings"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {"phase": "resolve_integrations", "seconds": 0.5},
+        {"phase": "stage_1", "seconds": 3.25},
+    ]
+
+
 @pytest.mark.parametrize(
     "key,config",
     (
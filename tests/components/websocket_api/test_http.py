@@ -93,3 +93,50 @@ async def test_prepare_fail(hass, hass_ws_client, caplog):
         await hass_ws_client(hass)
 
     assert "Timeout preparing request" in caplog.text
+
+
+async def test_coalesce_messages(hass, no_auth_websocket_client, hass_access_token):
+    """Test queued messages are sent as one frame when the client supports it."""
+    await no_auth_websocket_client.send_json(
+        {
+            "type": "auth",
+            "access_token": hass_access_token,
+            "supported_features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await no_auth_websocket_client.receive_json()
+    assert msg["type"] == "auth_ok"
+
+    await no_auth_websocket_client.send_json(
+        {"id": 1, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await no_auth_websocket_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["success"]
+
+    for idx in range(3):
+        hass.bus.async_fire("test_event", {"idx": idx})
+
+    msg = await no_auth_websocket_client.receive_json()
+    assert [message["event"]["data"]["idx"] for message in msg] == [0, 1, 2]
+    assert all(message["id"] == 1 for message in msg)
+
+    hass.bus.async_fire("test_event", {"idx": 3})
+    msg = await no_auth_websocket_client.receive_json()
+    assert msg["event"]["data"]["idx"] == 3
+
+
+async def test_messages_not_coalesced_by_default(hass, websocket_client):
+    """Test messages are sent in separate frames without the feature."""
+    await websocket_client.send_json(
+        {"id": 1, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    for idx in range(3):
+        hass.bus.async_fire("test_event", {"idx": idx})
+
+    for idx in range(3):
+        msg = await websocket_client.receive_json()
+        assert msg["event"]["data"]["idx"] == idx
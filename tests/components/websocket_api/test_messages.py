@@ -2,11 +2,15 @@
 
 from homeassistant.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
+    _cached_state_diff_message as lru_state_diff_cache,
     cached_event_message,
+    cached_state_diff_message,
+    event_message,
     message_to_json,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import callback
+from homeassistant.helpers.json import JSON_DUMP, json_loads
 
 
 async def test_cached_event_message(hass):
@@ -78,6 +82,109 @@ async def test_cached_event_message_with_different_idens(hass):
     assert cache_info.currsize == 1
 
 
+async def test_cached_event_message_reuses_state_json(hass):
+    """Test state changed event messages match a full serialization."""
+
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on", {"brightness": 100})
+    hass.states.async_set("light.window", "off", {"brightness": 100})
+    hass.states.async_remove("light.window")
+    await hass.async_block_till_done()
+
+    assert len(events) == 3
+    lru_event_cache.cache_clear()
+
+    for event in events:
+        assert json_loads(cached_event_message(2, event)) == json_loads(
+            JSON_DUMP(event_message(2, event))
+        )
+
+    old_state = events[1].data["old_state"]
+    new_state = events[1].data["new_state"]
+    assert old_state.as_dict_json() is old_state.as_dict_json()
+    assert new_state.as_dict_json().decode() in cached_event_message(3, events[1])
+
+
+async def test_cached_event_message_state_with_placeholder(hass):
+    """Test states containing the placeholder strings are serialized intact."""
+
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("input_text.hello", "__NEW_STATE__", {"x": "__OLD_STATE__"})
+    hass.states.async_set("input_text.hello", "__OLD_STATE__", {"x": "__NEW_STATE__"})
+    await hass.async_block_till_done()
+
+    lru_event_cache.cache_clear()
+
+    for event in events:
+        assert json_loads(cached_event_message(2, event)) == json_loads(
+            JSON_DUMP(event_message(2, event))
+        )
+
+
+async def test_cached_state_diff_message_reuses_state_json(hass):
+    """Test state diff messages for added states use the cached json."""
+
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on", {"brightness": 100})
+    await hass.async_block_till_done()
+
+    lru_state_diff_cache.cache_clear()
+    state = events[0].data["new_state"]
+    assert json_loads(cached_state_diff_message(2, events[0])) == {
+        "id": 2,
+        "type": "event",
+        "event": {
+            "a": {"light.window": json_loads(JSON_DUMP(state.as_compressed_state()))}
+        },
+    }
+    assert state.as_compressed_state_json().decode() in cached_state_diff_message(
+        3, events[0]
+    )
+
+
+async def test_cached_event_message_unserializable_state(hass, caplog):
+    """Test state changed events with unserializable states are still answered."""
+
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on", {"bad": _Unserializeable()})
+    await hass.async_block_till_done()
+
+    lru_event_cache.cache_clear()
+    lru_state_diff_cache.cache_clear()
+
+    assert json_loads(cached_event_message(2, events[0]))["success"] is False
+    assert json_loads(cached_state_diff_message(2, events[0]))["success"] is False
+    assert "Unable to serialize to JSON" in caplog.text
+
+
 async def test_message_to_json(caplog):
     """Test we can serialize websocket messages."""
 
@@ -1,6 +1,7 @@
 """Tests for the Entity Registry."""
 from unittest.mock import patch
 
+import attr
 import pytest
 import voluptuous as vol
 
@@ -1236,6 +1237,66 @@ def test_entity_registry_items():
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_secondary_indexes():
+    """Test the EntityRegistryItems device, area and config entry indexes."""
+    entities = er.EntityRegistryItems()
+    entry1 = er.RegistryEntry(
+        "test.entity1", "1234", "hue", device_id="dev1", config_entry_id="ce1"
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2", "2345", "hue", device_id="dev1", area_id="kitchen"
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_device_id("dev1") == [entry1, entry2]
+    assert entities.get_entries_for_area_id("kitchen") == [entry2]
+    assert entities.get_entries_for_config_entry_id("ce1") == [entry1]
+    assert entities.get_entries_for_device_id("dev2") == []
+
+    entry1_moved = attr.evolve(entry1, device_id="dev2", area_id="kitchen")
+    entities["test.entity1"] = entry1_moved
+    assert entities.get_entries_for_device_id("dev1") == [entry2]
+    assert entities.get_entries_for_device_id("dev2") == [entry1_moved]
+    assert entities.get_entries_for_area_id("kitchen") == [entry2, entry1_moved]
+    assert entities.get_entries_for_config_entry_id("ce1") == [entry1_moved]
+
+    # Updating an entry keeps its position in the index
+    entry2_renamed = attr.evolve(entry2, name="Renamed")
+    entities["test.entity2"] = entry2_renamed
+    assert entities.get_entries_for_area_id("kitchen") == [
+        entry2_renamed,
+        entry1_moved,
+    ]
+
+    entities.pop("test.entity1")
+    del entities["test.entity2"]
+
+    assert entities.get_entries_for_device_id("dev1") == []
+    assert entities.get_entries_for_device_id("dev2") == []
+    assert entities.get_entries_for_area_id("kitchen") == []
+    assert entities.get_entries_for_config_entry_id("ce1") == []
+    assert entities._device_id_index == {}
+    assert entities._area_id_index == {}
+    assert entities._config_entry_id_index == {}
+
+
+async def test_entries_for_renamed_entity(registry):
+    """Test the secondary indexes follow a renamed entity."""
+    entry = registry.async_get_or_create(
+        "light", "hue", "5678", config_entry=MockConfigEntry(entry_id="ce1")
+    )
+    registry.async_update_entity(entry.entity_id, area_id="kitchen")
+    registry.async_update_entity(entry.entity_id, new_entity_id="light.renamed")
+
+    assert [
+        entry.entity_id for entry in er.async_entries_for_area(registry, "kitchen")
+    ] == ["light.renamed"]
+    assert [
+        entry.entity_id for entry in er.async_entries_for_config_entry(registry, "ce1")
+    ] == ["light.renamed"]
+
+
 async def test_disabled_by_str_not_allowed(hass):
     """Test we need to pass disabled by type."""
     reg = er.async_get(hass)
@@ -21,6 +21,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_template_render_stats,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
     async_track_point_in_utc_time,
@@ -1807,6 +1808,72 @@ async def test_track_template_result_complex(hass):
     }
 
 
+async def test_track_template_result_shared_routing(hass):
+    """Test template trackers share state change routing and count renders."""
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "on")
+    listeners_before = hass.bus.async_listeners().get("state_changed", 0)
+
+    template_one = Template("{{ states('light.one') }}", hass)
+    template_two = Template("{{ states('light.two') }}", hass)
+    template_both = Template(
+        "{{ states('light.one') }} {{ states('light.two') }}", hass
+    )
+    template_domain = Template("{{ states.sensor | count }}", hass)
+    tracker_updates = []
+    domain_updates = []
+
+    tracker = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(template_one, None),
+            TrackTemplate(template_two, None),
+            TrackTemplate(template_both, None),
+        ],
+        lambda event, updates: tracker_updates.append(updates),
+    )
+    domain_tracker = async_track_template_result(
+        hass,
+        [TrackTemplate(template_domain, None)],
+        lambda event, updates: domain_updates.append(updates),
+    )
+    await hass.async_block_till_done()
+
+    assert hass.bus.async_listeners()["state_changed"] == listeners_before + 1
+
+    hass.states.async_set("light.one", "off")
+    await hass.async_block_till_done()
+
+    # Both templates of the tracker are updated in a single refresh
+    assert len(tracker_updates) == 1
+    assert {update.template for update in tracker_updates[0]} == {
+        template_one,
+        template_both,
+    }
+    assert tracker.render_stats[template_one].renders == 2
+    assert tracker.render_stats[template_two].renders == 1
+    assert tracker.render_stats[template_both].renders == 2
+    assert domain_updates == []
+
+    hass.states.async_set("sensor.new", "1")
+    await hass.async_block_till_done()
+
+    assert len(tracker_updates) == 1
+    assert len(domain_updates) == 1
+    assert domain_updates[0][0].result == 1
+    assert domain_tracker.render_stats[template_domain].renders == 2
+
+    stats = dict(async_get_template_render_stats(hass))
+    assert stats[template_both].renders == 2
+    assert stats[template_both].render_time > 0
+
+    tracker.async_remove()
+    domain_tracker.async_remove()
+
+    assert hass.bus.async_listeners().get("state_changed", 0) == listeners_before
+    assert async_get_template_render_stats(hass) == []
+
+
 async def test_track_template_result_with_wildcard(hass):
     """Test tracking template with a wildcard."""
     specific_runs = []
@@ -3740,6 +3740,33 @@ async def test_referenced_devices(hass):
     assert script_obj.referenced_devices is script_obj.referenced_devices
 
 
+def test_reference_index():
+    """Test the reverse index of referenced entities, devices and areas."""
+    index = script.ReferenceIndex()
+    index.async_add(
+        "script.one", {"light.both", "light.one"}, {"device-one"}, {"area-both"}
+    )
+    index.async_add("script.two", {"light.both"}, set(), {"area-both"})
+
+    assert set(index.referencing_entity("light.both")) == {"script.one", "script.two"}
+    assert index.referencing_entity("light.one") == ["script.one"]
+    assert index.referencing_device("device-one") == ["script.one"]
+    assert set(index.referencing_area("area-both")) == {"script.one", "script.two"}
+    assert index.referencing_entity("light.unknown") == []
+
+    # Adding again replaces the previous references
+    index.async_add("script.one", {"light.new"}, set(), set())
+    assert index.referencing_entity("light.both") == ["script.two"]
+    assert index.referencing_entity("light.one") == []
+    assert index.referencing_device("device-one") == []
+    assert index.referencing_entity("light.new") == ["script.one"]
+
+    index.async_remove("script.two")
+    index.async_remove("script.unknown")
+    assert index.referencing_entity("light.both") == []
+    assert index.referencing_area("area-both") == []
+
+
 @contextmanager
 def does_not_raise():
     """Indicate no exception is expected."""
@@ -460,3 +460,37 @@ async def test_changing_delayed_written_data(hass, store, hass_storage):
         "key": MOCK_KEY,
         "data": {"hello": "world"},
     }
+
+
+def test_stored_records_reuses_unchanged_records():
+    """Test only replaced records are converted again."""
+    converted = []
+
+    def to_dict(record):
+        converted.append(record)
+        return {"value": record[0]}
+
+    stored = storage.StoredRecords(to_dict)
+    first, second = ("a",), ("b",)
+    records = {"1": first, "2": second}
+
+    initial = stored.as_list(records)
+    assert initial == [{"value": "a"}, {"value": "b"}]
+    assert converted == [first, second]
+
+    converted.clear()
+    replaced = ("c",)
+    records["2"] = replaced
+    updated = stored.as_list(records)
+    assert updated == [{"value": "a"}, {"value": "c"}]
+    assert updated[0] is initial[0]
+    assert converted == [replaced]
+
+    converted.clear()
+    del records["1"]
+    assert stored.as_list(records) == [{"value": "c"}]
+    assert converted == []
+
+    records["1"] = first
+    assert stored.as_list(records) == [{"value": "c"}, {"value": "a"}]
+    assert converted == [first]
@@ -7,13 +7,15 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, core, runner
+from homeassistant import bootstrap, core, loader, runner
 import homeassistant.config as config_util
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATONS
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.setup import DATA_BOOTSTRAP_TIMINGS
 
 from tests.common import (
+    MockConfigEntry,
     MockModule,
     MockPlatform,
     get_test_config_dir,
@@ -717,3 +719,52 @@ async def test_warning_logged_on_wrap_up_timeout(hass, caplog):
         await hass.async_block_till_done()
 
     assert "Setup timed out for bootstrap - moving forward" in caplog.text
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_bootstrap_phase_timings(hass):
+    """Test the duration of the bootstrap phases is recorded."""
+    await bootstrap.async_from_config_dict({"group": {}}, hass)
+
+    timings = hass.data[DATA_BOOTSTRAP_TIMINGS]
+    for phase in (
+        "manifest_cache",
+        "config_entries",
+        "core",
+        "resolve_integrations",
+        "registries",
+        "stage_2",
+        "wrap_up",
+    ):
+        assert timings[phase].total_seconds() >= 0, phase
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_preimport_integrations(hass):
+    """Test integrations are imported in the executor in dependency order."""
+    config_entry = MockConfigEntry(domain="logbook")
+    config_entry.add_to_hass(hass)
+    imported = []
+
+    def mock_preimport(self, platform_names):
+        imported.append((self.domain, list(platform_names)))
+
+    with patch.object(loader.Integration, "preimport", mock_preimport):
+        integrations = await loader.async_get_integrations(
+            hass, ["logbook", "http"], with_dependencies=True
+        )
+        for integration in integrations.values():
+            assert await integration.resolve_dependencies()
+        # Integrations whose dependencies failed to resolve are skipped
+        unresolved = mock_integration(
+            hass, MockModule("unresolved", dependencies=["non_existing"])
+        )
+        assert not await unresolved.resolve_dependencies()
+        await bootstrap._async_preimport_integrations(
+            hass, {**integrations, "unresolved": unresolved}
+        )
+
+    assert [domain for domain, _ in imported] == ["http", "logbook"]
+    assert imported[0][1] == []
+    assert imported[1][1][0] == "config_flow"
+    assert "sensor" in imported[1][1]
@@ -35,11 +35,13 @@ from homeassistant.const import (
 import homeassistant.core as ha
 from homeassistant.core import State
 from homeassistant.exceptions import (
+    HomeAssistantError,
     InvalidEntityFormatError,
     InvalidStateError,
     MaxLengthExceeded,
     ServiceNotFound,
 )
+from homeassistant.helpers.json import JSON_DUMP, json_loads
 import homeassistant.util.dt as dt_util
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
@@ -466,6 +468,158 @@ async def test_eventbus_run_immediately(hass):
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass):
+    """Test listeners keyed by an event data value."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.kitchen", "light.bedroom"], listener
+    )
+    assert hass.bus.async_listeners()["test"] == 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.living_room"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test", {"other": "light.kitchen"})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.bedroom"})
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == [
+        "light.kitchen",
+        "light.bedroom",
+    ]
+
+    unsub()
+    assert "test" not in hass.bus.async_listeners()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    # Should do nothing now
+    unsub()
+
+
+async def test_eventbus_domain_listener(hass):
+    """Test listeners keyed by the domain of the entity_id."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_domain("test", ["light"], listener)
+    unsub_keyed = hass.bus.async_listen_keyed(
+        "test", "entity_id", ["switch.kitchen"], listener
+    )
+    assert hass.bus.async_listeners()["test"] == 2
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "switch.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "switch.bedroom"})
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == [
+        "light.kitchen",
+        "switch.kitchen",
+    ]
+
+    unsub_keyed()
+    unsub()
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_keyed_listeners_run_after_unkeyed(hass):
+    """Test keyed listeners run after the other listeners of the event type."""
+    calls = []
+
+    def listener(name):
+        """Return a mock listener."""
+
+        @ha.callback
+        def mock_listener(event):
+            calls.append(name)
+
+        return mock_listener
+
+    hass.bus.async_listen_domain("test", ["light"], listener("domain"))
+    hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.kitchen"], listener("keyed")
+    )
+    hass.bus.async_listen("test", listener("unkeyed"))
+    hass.bus.async_listen(MATCH_ALL, listener("match_all"))
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert calls == ["match_all", "unkeyed", "keyed", "domain"]
+
+
+async def test_eventbus_keyed_listener_run_immediately(hass):
+    """Test keyed listeners can be called immediately."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.kitchen"], listener, run_immediately=True
+    )
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    # No async_block_till_done here
+    assert len(calls) == 1
+
+    unsub()
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_domain(
+            "test", ["light"], lambda event: None, run_immediately=True
+        )
+
+
+async def test_eventbus_remove_listener_while_firing(hass):
+    """Test a listener removing another listener while an event is fired."""
+    calls = []
+    unsub_second = None
+
+    @ha.callback
+    def first_listener(event):
+        """Remove the second listener."""
+        calls.append("first")
+        unsub_second()
+
+    @ha.callback
+    def second_listener(event):
+        """Mock listener."""
+        calls.append("second")
+
+    @ha.callback
+    def third_listener(event):
+        """Mock listener."""
+        calls.append("third")
+
+    hass.bus.async_listen("test", first_listener, run_immediately=True)
+    unsub_second = hass.bus.async_listen("test", second_listener, run_immediately=True)
+    hass.bus.async_listen("test", third_listener, run_immediately=True)
+
+    hass.bus.async_fire("test")
+    assert calls == ["first", "second", "third"]
+
+    calls.clear()
+    hass.bus.async_fire("test")
+    assert calls == ["first", "third"]
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -631,6 +785,62 @@ def test_state_name_if_friendly_name_attr():
     assert state.name == name
 
 
+def test_state_json_is_cached():
+    """Test the json forms of a state are generated once."""
+    state = ha.State(
+        "light.kitchen",
+        "on",
+        {"brightness": 100},
+        context=ha.Context(id="abc"),
+    )
+    assert json_loads(state.as_dict_json()) == json_loads(JSON_DUMP(state.as_dict()))
+    assert state.as_dict_json() is state.as_dict_json()
+    assert json_loads(state.attributes_json()) == {"brightness": 100}
+    assert state.attributes_json() is state.attributes_json()
+    assert state.as_compressed_state() == {
+        "s": "on",
+        "a": {"brightness": 100},
+        "c": "abc",
+        "lc": state.last_changed.timestamp(),
+    }
+    assert json_loads(state.as_compressed_state_json()) == {
+        "s": "on",
+        "a": {"brightness": 100},
+        "c": "abc",
+        "lc": state.last_changed.timestamp(),
+    }
+    assert state.as_compressed_state_json() is state.as_compressed_state_json()
+
+    state = ha.State(
+        "light.kitchen",
+        "on",
+        last_changed=datetime(2022, 1, 1, tzinfo=dt_util.UTC),
+        last_updated=datetime(2022, 1, 2, tzinfo=dt_util.UTC),
+        context=ha.Context(id="abc", user_id="user"),
+    )
+    assert state.as_compressed_state() == {
+        "s": "on",
+        "a": {},
+        "c": {"id": "abc", "parent_id": None, "user_id": "user"},
+        "lc": state.last_changed.timestamp(),
+        "lu": state.last_updated.timestamp(),
+    }
+
+
+async def test_statemachine_update_keeps_attributes_json(hass):
+    """Test a state that keeps its attributes also keeps their json."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    attributes_json = hass.states.get("light.bowl").attributes_json()
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    assert hass.states.get("light.bowl").attributes_json() is attributes_json
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    assert json_loads(hass.states.get("light.bowl").attributes_json()) == {
+        "brightness": 50
+    }
+
+
 def test_state_dict_conversion():
     """Test conversion of dict."""
     state = ha.State("domain.hello", "world", {"some": "attr"})
@@ -763,6 +973,52 @@ async def test_statemachine_force_update(hass):
     assert len(events) == 1
 
 
+async def test_statemachine_update_reuses_previous_state(hass):
+    """Test updating a state reuses the parts that did not change."""
+    hass.states.async_set("light.Bowl", "on", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+    context = state.context
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    state2 = hass.states.get("light.bowl")
+    assert state2.entity_id == "light.bowl"
+    assert state2.domain is state.domain
+    assert state2.object_id is state.object_id
+    assert state2.attributes is state.attributes
+    assert state2.last_changed == state2.last_updated
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    state3 = hass.states.get("light.bowl")
+    assert state3.attributes == {"brightness": 50}
+    assert state3.last_changed == state2.last_changed
+    assert state3.as_dict()["attributes"] == {"brightness": 50}
+
+    # The expired state keeps the same context id
+    assert state.context is not context
+    assert state.context == context
+    assert state.context.id == context.id
+
+    with pytest.raises(ha.InvalidStateError):
+        hass.states.async_set("light.bowl", "x" * 256)
+    assert hass.states.get("light.bowl") is state3
+
+
+def test_context_id_is_lazy():
+    """Test the context id is only generated when accessed."""
+    context = ha.Context()
+    copy = context._copy_without_origin()
+    assert context._id is None
+    assert copy._id is None
+
+    assert len(context.id) == 26
+    assert context.id == copy.id
+    assert context.id is context.id
+
+    context = ha.Context(id="abc")
+    assert context.id == "abc"
+    assert context._copy_without_origin().id == "abc"
+
+
 def test_service_call_repr():
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1445,6 +1701,34 @@ async def test_async_entity_ids_count(hass):
     assert hass.states.async_entity_ids_count("light") == 3
 
 
+async def test_domain_queries_follow_state_changes(hass):
+    """Test domain queries after states are updated and removed."""
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.link", "on")
+    hass.states.async_set("light.frog", "on")
+    hass.states.async_set("light.bowl", "off")
+
+    assert hass.states.async_entity_ids("LIGHT") == ["light.bowl", "light.frog"]
+    assert hass.states.async_all("light")[0].state == "off"
+    assert hass.states.async_entity_ids(["light", "light"]) == [
+        "light.bowl",
+        "light.frog",
+    ]
+    assert hass.states.async_entity_ids_count(["light", "switch", "vacuum"]) == 3
+
+    hass.states.async_remove("light.bowl")
+    hass.states.async_remove("switch.link")
+
+    assert hass.states.async_entity_ids("light") == ["light.frog"]
+    assert hass.states.async_entity_ids("switch") == []
+    assert hass.states.async_all("switch") == []
+    assert hass.states.async_entity_ids_count("switch") == 0
+
+    hass.states.async_set("switch.link", "off")
+    assert hass.states.async_entity_ids("switch") == ["switch.link"]
+
+
 async def test_hassjob_forbid_coroutine():
     """Test hassjob forbids coroutines."""
 
@@ -1,4 +1,7 @@
 """Test to verify that we can load components."""
+from datetime import timedelta
+import os
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -6,8 +9,9 @@ import pytest
 from homeassistant import core, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+import homeassistant.util.dt as dt_util
 
-from tests.common import MockModule, mock_integration
+from tests.common import MockModule, async_fire_time_changed, mock_integration
 
 
 async def test_component_dependencies(hass):
@@ -673,3 +677,147 @@ async def test_loggers(hass):
         },
     )
     assert integration.loggers == ["name1", "name2"]
+
+
+async def test_get_integrations_with_dependencies(hass):
+    """Test dependencies are resolved in the same executor job."""
+    with patch(
+        "homeassistant.loader._resolve_integrations",
+        wraps=loader._resolve_integrations,
+    ) as mock_resolve:
+        integrations = await loader.async_get_integrations(
+            hass, ["logbook", "not_existing"], with_dependencies=True
+        )
+
+    assert mock_resolve.call_count == 1
+    assert integrations["logbook"].domain == "logbook"
+    assert isinstance(integrations["not_existing"], loader.IntegrationNotFound)
+    assert "frontend" not in integrations
+
+    cache = hass.data[loader.DATA_INTEGRATIONS]
+    for domain in ("frontend", "http", "recorder"):
+        assert isinstance(cache[domain], loader.Integration)
+    assert "not_existing" not in cache
+
+    with patch("homeassistant.loader._resolve_integrations") as mock_resolve:
+        integration = await loader.async_get_integration(hass, "frontend")
+    assert integration is cache["frontend"]
+    assert not mock_resolve.called
+
+
+async def test_get_integrations_error_resolving_one_domain(hass):
+    """Test an error resolving one domain does not fail the others."""
+    resolve_from_root = loader.Integration.resolve_from_root
+
+    def _resolve_from_root(hass, root_module, domain, manifests):
+        if domain == "hue":
+            raise UnicodeDecodeError("utf-8", b"", 0, 1, "invalid start byte")
+        return resolve_from_root(hass, root_module, domain, manifests)
+
+    with patch(
+        "homeassistant.loader.Integration.resolve_from_root",
+        side_effect=_resolve_from_root,
+    ):
+        integrations = await loader.async_get_integrations(
+            hass, ["hue", "logbook"], with_dependencies=True
+        )
+
+    assert isinstance(integrations["hue"], UnicodeDecodeError)
+    assert integrations["logbook"].domain == "logbook"
+    cache = hass.data[loader.DATA_INTEGRATIONS]
+    assert "hue" not in cache
+    assert isinstance(cache["frontend"], loader.Integration)
+
+
+async def test_manifest_cache(hass, hass_storage):
+    """Test persisted manifests are used while the file is unchanged."""
+    manifest_path = f"{hue.__path__[0]}/manifest.json"
+    file_stat = os.stat(manifest_path)
+    cached_manifest = {
+        "domain": "hue",
+        "name": "Cached Hue",
+        "dependencies": [],
+        "codeowners": [],
+    }
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "key": loader.MANIFEST_CACHE_STORAGE_KEY,
+        "data": {
+            "manifests": {
+                manifest_path: [
+                    file_stat.st_mtime_ns,
+                    file_stat.st_size,
+                    cached_manifest,
+                ]
+            }
+        },
+    }
+    await loader.async_load_manifest_cache(hass)
+
+    with patch("homeassistant.loader.json_loads") as mock_json_loads:
+        integration = await loader.async_get_integration(hass, "hue")
+    assert integration.name == "Cached Hue"
+    assert not mock_json_loads.called
+
+
+async def test_manifest_cache_stores_changed_manifests(hass, hass_storage):
+    """Test manifests that were parsed again are persisted."""
+    hue_path = f"{hue.__path__[0]}/manifest.json"
+    file_stat = os.stat(hue_path)
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "key": loader.MANIFEST_CACHE_STORAGE_KEY,
+        "data": {
+            "manifests": {
+                hue_path: [
+                    file_stat.st_mtime_ns - 1,
+                    file_stat.st_size,
+                    {"domain": "hue", "name": "Outdated Hue", "dependencies": []},
+                ]
+            }
+        },
+    }
+    await loader.async_load_manifest_cache(hass)
+
+    integration = await loader.async_get_integration(hass, "hue")
+    assert integration.name == "Philips Hue"
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]["manifests"]
+    assert stored[hue_path][:2] == [file_stat.st_mtime_ns, file_stat.st_size]
+    assert stored[hue_path][2]["name"] == "Philips Hue"
+    assert "is_built_in" not in stored[hue_path][2]
+
+
+async def test_preimport(hass, enable_custom_integrations):
+    """Test an integration and its existing platforms are imported ahead."""
+    integration = await loader.async_get_integration(hass, "test_embedded")
+    for name in (
+        "custom_components.test_embedded",
+        "custom_components.test_embedded.switch",
+    ):
+        sys.modules.pop(name, None)
+
+    await hass.async_add_executor_job(
+        integration.preimport, ["switch", "light", "config_flow"]
+    )
+
+    assert "custom_components.test_embedded" in sys.modules
+    assert "custom_components.test_embedded.switch" in sys.modules
+    assert "custom_components.test_embedded.light" not in sys.modules
+    assert hass.data[loader.DATA_IMPORT_TIMES]["test_embedded"] > 0
+
+
+async def test_preimport_ignores_import_errors(hass, enable_custom_integrations):
+    """Test errors importing ahead are left to the setup to report."""
+    integration = await loader.async_get_integration(hass, "test_embedded")
+
+    with patch("importlib.import_module", side_effect=ImportError):
+        await hass.async_add_executor_job(integration.preimport, ["switch"])
+
+    with pytest.raises(ImportError):
+        with patch("importlib.import_module", side_effect=ImportError):
+            integration.get_component()
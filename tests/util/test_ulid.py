@@ -14,3 +14,9 @@ async def test_ulid_util_uuid_hex():
 async def test_ulid_util_uuid():
     """Verify we can generate a ulid."""
     assert len(ulid_util.ulid()) == 26
+
+
+async def test_ulid_util_encode():
+    """Verify a ulid can be encoded from its integer value."""
+    assert ulid_util.ulid_encode(1 << 80 | 42) == "0000000001000000000000001A"
+    assert len(ulid_util.ulid_encode(2**128 - 1)) == 26